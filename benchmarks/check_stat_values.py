@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""
+Regression check for stat arithmetic.
+
+Adjusting stats must keep every value a profile can legitimately have:
+Leadership of 7+ and 8+, AP of 0 improving to -1, signed modifiers. Each case
+is run through add_to_value and, where it names a stat, through the batch
+change that adjusts it. Exits with 1 if any case fails.
+"""
+import argparse
+import os
+import sys
+from typing import List, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from tts_editor.models.batch_edit import SIGNED_STATS, AdjustStat, AdjustWeaponStat  # noqa: E402
+from tts_editor.models.profile_fields import MeleeWeapon, StatLine  # noqa: E402
+from tts_editor.utils.stat_values import add_to_value  # noqa: E402
+
+
+# (stat or None, value, amount, expected)
+CASES: List[Tuple[Optional[str], str, int, str]] = [
+    ("Ld", "7+", 1, "8+"),
+    ("Ld", "7+", -1, "6+"),
+    ("Ld", "8+", -1, "7+"),
+    ("Sv", "2+", -1, "2+"),
+    ("Sv", "3+", -1, "2+"),
+    ("AP", "0", -1, "-1"),
+    ("AP", "-1", -1, "-2"),
+    ("AP", "-1", 1, "0"),
+    ("A", "1", -2, "0"),
+    ("A", "D6", 1, "D6+1"),
+    ("W", "3", 1, "4"),
+    (None, "+1", 1, "+2"),
+    (None, "-2", 1, "-1"),
+    (None, '6"', -10, '0"'),
+    (None, "*", 1, "*"),
+]
+
+
+def check_case(stat: Optional[str], value: str, amount: int) -> List[Tuple[str, str]]:
+    """
+    Adjust a value every way the editor can.
+
+    Args:
+        stat: The stat the value belongs to, or None for a bare value
+        value: The stat string
+        amount: The amount to add
+
+    Returns:
+        A (path, result) tuple for add_to_value and the matching batch change
+    """
+    results = [("add_to_value", add_to_value(value, amount, stat in SIGNED_STATS))]
+    if stat in StatLine.FIELDS:
+        stats = StatLine().replace(**{stat: value})
+        new_stats = AdjustStat(stat, amount).apply((stats, [], [], []))[0]
+        results.append(("AdjustStat", getattr(new_stats, stat)))
+    elif stat in MeleeWeapon.FIELDS:
+        weapon = MeleeWeapon("Blade", "1", "3+", "4", "0", "1", "").replace(**{stat: value})
+        change = AdjustWeaponStat(stat, amount, "melee")
+        new_weapon = change.apply_many([(StatLine(), [], [weapon], [])])[0][2][0]
+        results.append(("AdjustWeaponStat", getattr(new_weapon, stat)))
+    return results
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Check stat arithmetic against known values")
+    parser.parse_args(argv)
+
+    failures = 0
+    for stat, value, amount, expected in CASES:
+        for path, result in check_case(stat, value, amount):
+            if result != expected:
+                failures += 1
+                print(f"{path}: {stat or 'value'} {value} {amount:+d} gave {result}, expected {expected}")
+    print(f"{len(CASES)} cases, {failures} failures")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+"""
+Round-trip fuzzer for the description parser and generator.
+
+Random profiles are generated, parsed, regenerated and parsed again; the two
+parses must agree and regenerating must reproduce the description exactly.
+Throughput is reported in descriptions per second.
+
+Inputs are drawn from the domain the text layout can represent: weapon names
+without brackets or parentheses, stat values without whitespace and ability
+lines that cannot be mistaken for section headers.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from typing import List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from tts_editor.models.profile_fields import (  # noqa: E402
+    Ability, MeleeWeapon, RangedWeapon, StatLine
+)
+from tts_editor.utils import description_parser  # noqa: E402
+
+from save_generator import UNIT_TEMPLATES, WEAPON_KEYWORDS, build_description  # noqa: E402
+
+
+NAME_WORDS = ["Bolt", "Plasma", "Heavy", "Twin", "Storm", "Las", "Melta", "Shuriken",
+              "rifle", "pistol", "cannon", "blade", "fist", "claws", "gun", "launcher"]
+VALUES = ["1", "2", "3", "4", "6", "12", "D3", "D6", "2D6", "D6+1", "2+", "3+", "4+",
+          "0", "-1", "-2", "-3", "*", "N/A"]
+ABILITY_WORDS = ["Oath", "of", "Moment", "Deep", "Strike", "Leader", "Scouts", "Stealth",
+                 "Fights", "First", "Lone", "Operative", "Feel", "No", "Pain", "5+"]
+
+Profile = Tuple[StatLine, List[RangedWeapon], List[MeleeWeapon], List[Ability]]
+
+
+def _words(rng: random.Random, vocabulary: List[str], low: int, high: int) -> str:
+    return " ".join(rng.choice(vocabulary) for _ in range(rng.randint(low, high)))
+
+
+def _ability_line(rng: random.Random) -> str:
+    """Pick an ability line that is not a stats header."""
+    while True:
+        line = _words(rng, ABILITY_WORDS, 1, 4)
+        if not all(token in line for token in ("M", "T", "Sv", "W")):
+            return line
+
+
+def random_profile(rng: random.Random) -> Profile:
+    """
+    Generate random structured profile data.
+
+    Args:
+        rng: The random generator
+
+    Returns:
+        A (stats, ranged weapons, melee weapons, abilities) tuple
+    """
+    values = [rng.choice(VALUES) for _ in StatLine.FIELDS]
+    values[0] = f'{rng.randint(3, 14)}"'
+    stats = StatLine(*values)
+
+    ranged = [
+        RangedWeapon(
+            _words(rng, NAME_WORDS, 1, 3), f'{rng.randint(6, 72)}"',
+            *(rng.choice(VALUES) for _ in range(5)),
+            abilities=", ".join(rng.sample(WEAPON_KEYWORDS, rng.randint(0, 3)))
+        )
+        for _ in range(rng.randint(0, 12))
+    ]
+
+    melee = [
+        MeleeWeapon(
+            _words(rng, NAME_WORDS, 1, 3),
+            *(rng.choice(VALUES) for _ in range(5)),
+            abilities=", ".join(rng.sample(WEAPON_KEYWORDS, rng.randint(0, 3)))
+        )
+        for _ in range(rng.randint(0, 6))
+    ]
+
+    abilities = [Ability(_ability_line(rng)) for _ in range(rng.randint(0, 8))]
+    return stats, ranged, melee, abilities
+
+
+def parse(description: str) -> Profile:
+    """Parse a description into structured profile data."""
+    return description_parser.parse_profile(description)
+
+
+def fuzz(iterations: int, seed: int) -> Tuple[int, float, float]:
+    """
+    Run the round-trip fuzzer.
+
+    Args:
+        iterations: The number of random descriptions to check
+        seed: The random seed
+
+    Returns:
+        A (failures, generate rate, round-trip rate) tuple; rates are in
+        descriptions per second
+    """
+    rng = random.Random(seed)
+    descriptions = []
+    for i in range(iterations):
+        if i % 2:
+            template = rng.choice(UNIT_TEMPLATES)
+            ranged = rng.sample(template["ranged"], rng.randint(0, len(template["ranged"])))
+            melee = rng.sample(template["melee"], rng.randint(0, len(template["melee"])))
+            descriptions.append(build_description(rng, template, ranged, melee))
+        else:
+            descriptions.append(description_parser.generate_description(*random_profile(rng)))
+
+    failures = 0
+    start = time.perf_counter()
+    for description in descriptions:
+        first = parse(description)
+        regenerated = description_parser.generate_description(*first)
+        second = parse(regenerated)
+        if first != second or description_parser.generate_description(*second) != regenerated:
+            failures += 1
+            if failures <= 5:
+                print("Round trip mismatch for description:")
+                print(description)
+    round_trip_time = time.perf_counter() - start
+
+    parsed = [parse(description) for description in descriptions]
+    start = time.perf_counter()
+    for profile in parsed:
+        description_parser.generate_description(*profile)
+    generate_time = time.perf_counter() - start
+
+    return (
+        failures,
+        len(descriptions) / max(generate_time, 1e-9),
+        len(descriptions) / max(round_trip_time, 1e-9),
+    )
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Round-trip fuzz the description parser")
+    parser.add_argument("-n", "--iterations", type=int, default=5000,
+                        help="Number of random descriptions (default: 5000)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    args = parser.parse_args(argv)
+
+    failures, generate_rate, round_trip_rate = fuzz(args.iterations, args.seed)
+    print(f"{args.iterations} descriptions, {failures} round-trip failures")
+    print(f"  generate_description   {generate_rate:12.0f} descriptions/s")
+    print(f"  parse/generate/parse   {round_trip_rate:12.0f} descriptions/s")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+"""
+Headless replay of editing sessions for throughput testing.
+
+Each session goes through the same editor presenters the main window uses:
+select a unit and one of its profiles, change a field in the structured
+editor's fields, generate the description and apply it. Every --save-every
+sessions the pending edits are saved, as pressing Ctrl+S would. No display is
+needed; the presenters run with a view that shows nothing.
+
+Sessions are drawn from a seeded generator, so runs against the same save
+replay the same edits.
+"""
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from typing import Dict
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from tts_editor.models.profile_fields import Ability  # noqa: E402
+from tts_editor.presenters.editor import EditorPresenter  # noqa: E402
+from tts_editor.utils.stat_values import add_to_value  # noqa: E402
+
+from save_generator import write_save  # noqa: E402
+
+
+ABILITIES = ["Battle-hardened", "Blooded", "Deep Strike", "Stealth", "Feel No Pain 6+"]
+STEPS = ["select", "edit", "generate", "apply", "save"]
+
+
+def edit_fields(rng: random.Random, fields: tuple) -> tuple:
+    """
+    Make one random change to a profile's structured fields.
+
+    Args:
+        rng: The random generator
+        fields: The (stats, ranged weapons, melee weapons, abilities) to change
+
+    Returns:
+        The changed fields
+    """
+    stats, ranged, melee, abilities = fields
+    choice = rng.randrange(3)
+    if choice == 0 and melee:
+        index = rng.randrange(len(melee))
+        melee = list(melee)
+        melee[index] = melee[index].replace(A=add_to_value(melee[index].A, 1))
+    elif choice == 1 and ranged:
+        index = rng.randrange(len(ranged))
+        ranged = list(ranged)
+        ranged[index] = ranged[index].replace(name=ranged[index].name + " (relic)")
+    elif choice == 2:
+        abilities = list(abilities) + [Ability(rng.choice(ABILITIES))]
+    else:
+        stats = stats.replace(W=add_to_value(stats.W, 1))
+    return stats, ranged, melee, abilities
+
+
+def replay(file_path: str, sessions: int, save_every: int, seed: int) -> Dict[str, float]:
+    """
+    Replay editing sessions against a save.
+
+    Args:
+        file_path: The save to edit; it is overwritten by the saves
+        sessions: The number of sessions
+        save_every: Sessions between saves; 0 saves only at the end
+        seed: The seed of the session generator
+
+    Returns:
+        Total seconds spent in each step, plus "load" and "sessions"
+    """
+    rng = random.Random(seed)
+    totals = dict.fromkeys(STEPS, 0.0)
+
+    presenter = EditorPresenter()
+    start = time.perf_counter()
+    presenter.load_file(file_path)
+    totals["load"] = time.perf_counter() - start
+
+    unit_rows = [row for row, (_, unit_index) in enumerate(presenter.unit_rows) if unit_index is not None]
+    if not unit_rows:
+        raise ValueError(f"No units in {file_path}")
+
+    for session in range(sessions):
+        start = time.perf_counter()
+        presenter.select_units([rng.choice(unit_rows)])
+        presenter.select_profiles([rng.randrange(len(presenter.profile_rows))])
+        selected = time.perf_counter()
+
+        fields = edit_fields(rng, presenter.structured.loaded_fields)
+        edited = time.perf_counter()
+
+        presenter.generate_description(fields)
+        generated = time.perf_counter()
+
+        presenter.apply_changes()
+        applied = time.perf_counter()
+
+        if save_every and (session + 1) % save_every == 0:
+            presenter.save_pending()
+        saved = time.perf_counter()
+
+        totals["select"] += selected - start
+        totals["edit"] += edited - selected
+        totals["generate"] += generated - edited
+        totals["apply"] += applied - generated
+        totals["save"] += saved - applied
+
+    start = time.perf_counter()
+    presenter.save_pending()
+    totals["save"] += time.perf_counter() - start
+    totals["sessions"] = sessions
+    return totals
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Replay editing sessions headlessly")
+    parser.add_argument("file", nargs="?",
+                        help="Save to replay against; it is copied first (default: a generated save)")
+    parser.add_argument("-n", "--sessions", type=int, default=5000,
+                        help="Number of sessions (default: 5000)")
+    parser.add_argument("--objects", type=int, default=1000,
+                        help="Objects in the generated save when no file is given (default: 1000)")
+    parser.add_argument("--save-every", type=int, default=100,
+                        help="Sessions between saves, 0 for only at the end (default: 100)")
+    parser.add_argument("--seed", type=int, default=0, help="Session generator seed (default: 0)")
+    args = parser.parse_args(argv)
+
+    work_dir = tempfile.mkdtemp(prefix="tts_editor_replay_")
+    try:
+        file_path = os.path.join(work_dir, "save.json")
+        if args.file:
+            shutil.copyfile(args.file, file_path)
+        else:
+            write_save(file_path, args.objects, args.seed)
+
+        totals = replay(file_path, args.sessions, args.save_every, args.seed)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    sessions = max(args.sessions, 1)
+    total = sum(totals[step] for step in STEPS)
+    print(f"load                {totals['load'] * 1000:10.1f} ms")
+    for step in STEPS:
+        print(f"{step:<18}  {totals[step] * 1000 / sessions:10.3f} ms/session")
+    print(f"{args.sessions} sessions in {total:.2f} s, {args.sessions / max(total, 1e-9):.0f} sessions/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,292 @@
+#!/usr/bin/env python
+"""
+Benchmark runner for the load/group/parse/render/save pipeline.
+
+Every stage is timed (best of N repeats) and then run once more under
+tracemalloc to record its peak memory. Results can be compared against a
+stored baseline file; a stage that got slower than the allowed ratio is
+reported as a regression and makes the runner exit with status 1.
+
+All stages run headless except "render", which needs a display and is only
+run when --render is given.
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from tts_editor.models.unit import UnitManager  # noqa: E402
+from tts_editor.utils import description_parser  # noqa: E402
+
+from save_generator import write_save  # noqa: E402
+
+
+DEFAULT_SIZES = [100, 1000, 10000, 100000]
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Number of profiles rendered by the optional render stage
+RENDER_LIMIT = 200
+
+
+def _extract_all(descriptions: List[str]) -> List[tuple]:
+    """Parse and extract every description into generator inputs."""
+    return [description_parser.parse_profile(description) for description in descriptions]
+
+
+class PipelineBenchmark:
+    """Runs the editor pipeline stages against one save file."""
+
+    def __init__(self, file_path: str, render: bool = False):
+        """
+        Initialize the benchmark.
+
+        Args:
+            file_path: The save file to benchmark against
+            render: Whether to run the Tk render stage
+        """
+        self.file_path = file_path
+        self.render = render
+        self.text = ""
+        self.json_data: Optional[Dict[str, Any]] = None
+        self.unit_manager = UnitManager()
+        self.descriptions: List[str] = []
+        self.extracted: List[tuple] = []
+        self.output_path = file_path + ".out"
+
+    def stage_read(self) -> None:
+        """Read the save file into memory."""
+        with open(self.file_path, 'r', encoding='utf-8') as file:
+            self.text = file.read()
+
+    def stage_json_decode(self) -> None:
+        """Decode the save text."""
+        self.json_data = json.loads(self.text)
+
+    def stage_load_json(self) -> None:
+        """Load the decoded data into the unit manager."""
+        self.unit_manager.load_json(self.json_data)
+
+    def stage_group_units(self) -> None:
+        """Group objects into units and collect the unique descriptions."""
+        self.unit_manager._group_units()
+        self.descriptions = [
+            profile.description
+            for unit in self.unit_manager.units
+            for profile in unit.profiles
+        ]
+
+    def stage_parse_description(self) -> None:
+        """Split every unique description into sections."""
+        for description in self.descriptions:
+            description_parser.parse_description(description)
+
+    def stage_extract(self) -> None:
+        """Extract stats, weapons and abilities from every description."""
+        self.extracted = _extract_all(self.descriptions)
+
+    def stage_generate_description(self) -> None:
+        """Regenerate every description from its extracted data."""
+        for stats, ranged, melee, abilities in self.extracted:
+            description_parser.generate_description(stats, ranged, melee, abilities)
+
+    def stage_render(self) -> None:
+        """Render descriptions into a Tk text widget."""
+        from tts_editor.utils.color_formatter import ColorFormatter
+
+        for description in self.descriptions[:RENDER_LIMIT]:
+            ColorFormatter.apply_formatting(self._text_widget, description)
+            self._root.update_idletasks()
+
+    def stage_save(self) -> None:
+        """Write the JSON data back out."""
+        self.unit_manager.save_file(self.output_path)
+
+    def stages(self) -> List[tuple]:
+        """Return the (name, callable) pairs in pipeline order."""
+        stages = [
+            ("read", self.stage_read),
+            ("json_decode", self.stage_json_decode),
+            ("load_json", self.stage_load_json),
+            ("group_units", self.stage_group_units),
+            ("parse_description", self.stage_parse_description),
+            ("extract", self.stage_extract),
+            ("generate_description", self.stage_generate_description),
+        ]
+        if self.render:
+            stages.append(("render", self.stage_render))
+        stages.append(("save", self.stage_save))
+        return stages
+
+    def setup(self) -> None:
+        """Create the hidden Tk widgets used by the render stage."""
+        if self.render:
+            import tkinter as tk
+
+            self._root = tk.Tk()
+            self._root.withdraw()
+            self._text_widget = tk.Text(self._root)
+
+    def teardown(self) -> None:
+        """Destroy Tk widgets and remove the output file."""
+        if self.render:
+            self._root.destroy()
+        if os.path.exists(self.output_path):
+            os.remove(self.output_path)
+
+
+def _time_stage(func: Callable[[], None], repeat: int) -> float:
+    """Return the best wall-clock time of a stage over several repeats."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _peak_memory(func: Callable[[], None]) -> int:
+    """Return the peak traced memory of a single run of a stage, in bytes."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_size(object_count: int, work_dir: str, repeat: int, render: bool,
+             seed: int = 0) -> Dict[str, Dict[str, float]]:
+    """
+    Benchmark every stage against a generated save of the given size.
+
+    Args:
+        object_count: The number of objects in the generated save
+        work_dir: Directory for the generated save and output file
+        repeat: Number of timed repeats per stage
+        render: Whether to run the Tk render stage
+        seed: The generator seed
+
+    Returns:
+        A mapping of stage name to {"seconds": ..., "peak_kib": ...}
+    """
+    file_path = os.path.join(work_dir, f"save_{object_count}_{seed}.json")
+    if not os.path.exists(file_path):
+        write_save(file_path, object_count, seed)
+
+    benchmark = PipelineBenchmark(file_path, render=render)
+    benchmark.setup()
+    results = {}
+    try:
+        for name, func in benchmark.stages():
+            seconds = _time_stage(func, repeat)
+            peak = _peak_memory(func)
+            results[name] = {
+                "seconds": round(seconds, 6),
+                "peak_kib": round(peak / 1024.0, 1),
+            }
+            print(f"  {name:<22} {seconds * 1000:10.2f} ms {peak / 1048576.0:10.2f} MiB peak")
+    finally:
+        benchmark.teardown()
+    return results
+
+
+def compare(results: Dict[str, Dict[str, Dict[str, float]]],
+            baseline: Dict[str, Dict[str, Dict[str, float]]],
+            tolerance: float) -> List[str]:
+    """
+    Compare results against a baseline.
+
+    Args:
+        results: Results keyed by size then stage
+        baseline: Baseline results in the same shape
+        tolerance: Allowed slowdown ratio before a stage counts as a regression
+
+    Returns:
+        A list of regression messages
+    """
+    regressions = []
+    for size, stages in results.items():
+        base_stages = baseline.get(size, {})
+        for stage, values in stages.items():
+            base = base_stages.get(stage)
+            if not base or not base.get("seconds"):
+                continue
+            ratio = values["seconds"] / base["seconds"]
+            marker = ""
+            if ratio > tolerance:
+                marker = "  REGRESSION"
+                regressions.append(f"{size} objects / {stage}: {ratio:.2f}x slower than baseline")
+            print(f"  {size:>7} {stage:<22} {ratio:6.2f}x time "
+                  f"{values['peak_kib'] / max(base['peak_kib'], 0.1):6.2f}x memory{marker}")
+    return regressions
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the TTS editor pipeline")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Object counts to benchmark (default: 100 1000 10000 100000)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Timed repeats per stage, best is kept (default: 3)")
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed (default: 0)")
+    parser.add_argument("--render", action="store_true",
+                        help="Also benchmark ColorFormatter rendering (needs a display)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE,
+                        help="Baseline file to compare against")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Write the results to the baseline file instead of comparing")
+    parser.add_argument("--tolerance", type=float, default=1.25,
+                        help="Slowdown ratio reported as a regression (default: 1.25)")
+    parser.add_argument("--work-dir", help="Directory for generated saves (default: a temp dir)")
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = {}
+    # Generated saves are several MB each; the default work directory is removed afterwards
+    with tempfile.TemporaryDirectory(prefix="tts_editor_bench_") as temp_dir:
+        work_dir = args.work_dir or temp_dir
+        os.makedirs(work_dir, exist_ok=True)
+        for size in args.sizes:
+            print(f"{size} objects")
+            results[str(size)] = run_size(size, work_dir, args.repeat, args.render, args.seed)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, 'r', encoding='utf-8') as file:
+                baseline = json.load(file)
+        baseline.update(results)
+        with open(args.baseline, 'w', encoding='utf-8') as file:
+            json.dump(baseline, file, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one")
+        return 0
+
+    with open(args.baseline, 'r', encoding='utf-8') as file:
+        baseline = json.load(file)
+
+    print("Compared to baseline")
+    regressions = compare(results, baseline, args.tolerance)
+    for message in regressions:
+        print(message)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,375 @@
+#!/usr/bin/env python
+"""
+Deterministic synthetic Tabletop Simulator save generator.
+
+Produces saves that look like the output of common list-building tools: models
+are grouped into units, nicknames carry color codes, counts and variants, every
+model repeats its unit's description and most models carry a LuaScript of
+varying size.
+"""
+import argparse
+import json
+import random
+import sys
+from typing import Any, Dict, List, Tuple
+
+
+# Nickname colors used by list builders for the "1/5" count prefix
+NICKNAME_COLORS = ["00ff16", "e85545", "c6c930", "ffffff"]
+
+# Relative weights for LuaScript sizes (in characters) attached to each model
+LUA_SIZES = [(0, 3), (256, 4), (1024, 5), (4096, 2), (16384, 1)]
+
+# Unit templates: name, stats, ranged pool, melee pool, abilities, variants
+UNIT_TEMPLATES = [
+    {
+        "name": "Intercessor Squad",
+        "stats": ['6"', "4", "3+", "2", "6+", "2"],
+        "ranged": ["Bolt rifle", "Bolt pistol", "Astartes grenade launcher"],
+        "melee": ["Close combat weapon"],
+        "abilities": ["Oath of Moment", "Objective Secured", "Target Elimination"],
+        "variants": ["Sergeant", "Grenadier"],
+    },
+    {
+        "name": "Howling Banshees",
+        "stats": ['8"', "3", "4+", "1", "6+", "1"],
+        "ranged": ["Shuriken pistol", "Triskele"],
+        "melee": ["Power sword", "Mirrorswords", "Executioner"],
+        "abilities": ["Battle Focus", "Acrobatic", "Banshee Mask", "Fated Hero"],
+        "variants": ["Exarch"],
+    },
+    {
+        "name": "Hellblaster Squad",
+        "stats": ['6"', "4", "3+", "2", "6+", "1"],
+        "ranged": ["Plasma incinerator", "Plasma pistol"],
+        "melee": ["Close combat weapon"],
+        "abilities": ["Oath of Moment", "For the Chapter!"],
+        "variants": ["Sergeant"],
+    },
+    {
+        "name": "Redemptor Dreadnought",
+        "stats": ['8"', "10", "2+", "12", "6+", "4"],
+        "ranged": [
+            "Heavy onslaught gatling cannon",
+            "Macro plasma incinerator",
+            "Icarus rocket pod",
+            "Storm bolters",
+            "Heavy flamer",
+            "Onslaught gatling cannon",
+        ],
+        "melee": ["Redemptor fist"],
+        "abilities": ["Oath of Moment", "Deadly Demise D3", "Duty Eternal"],
+        "variants": [],
+    },
+    {
+        "name": "Termagants",
+        "stats": ['6"', "3", "5+", "1", "8+", "2"],
+        "ranged": ["Fleshborer", "Devourer", "Spinefists", "Shardlauncher"],
+        "melee": ["Xenos claws and teeth"],
+        "abilities": ["Synapse", "Skulking Horrors"],
+        "variants": [],
+    },
+    {
+        "name": "Necron Warriors",
+        "stats": ['5"', "4", "4+", "1", "7+", "2"],
+        "ranged": ["Gauss flayer", "Gauss reaper"],
+        "melee": ["Close combat weapon"],
+        "abilities": ["Reanimation Protocols", "Their Number Is Legion"],
+        "variants": [],
+    },
+    {
+        "name": "Boyz",
+        "stats": ['6"', "5", "5+", "1", "7+", "2"],
+        "ranged": ["Slugga", "Big shoota", "Rokkit launcha"],
+        "melee": ["Choppa", "Big choppa", "Power klaw"],
+        "abilities": ["Waaagh!", "Get Stuck In"],
+        "variants": ["Boss Nob"],
+    },
+    {
+        "name": "Captain in Terminator Armour",
+        "stats": ['5"', "5", "2+", "6", "6+", "1"],
+        "ranged": ["Storm bolter", "Combi-weapon"],
+        "melee": ["Relic weapon", "Relic fist"],
+        "abilities": ["Leader", "Rites of Battle", "Teleport Homer", "Invulnerable Save 4+"],
+        "variants": [],
+    },
+]
+
+WEAPON_KEYWORDS = [
+    "ASSAULT", "HEAVY", "RAPID FIRE 1", "RAPID FIRE 2", "PISTOL", "TORRENT",
+    "IGNORES COVER", "HAZARDOUS", "DEVASTATING WOUNDS", "LETHAL HITS",
+    "SUSTAINED HITS 1", "ANTI-INFANTRY 4+", "MELTA 2", "TWIN-LINKED",
+    "PRECISION", "BLAST", "LANCE",
+]
+
+CRUSADE_SUFFIXES = ["", "", "", " (Battle-hardened)", " (Blooded)", " (Heroic)"]
+
+LUA_LINES = [
+    "function onLoad(save_state)",
+    "    self.setVar('unitName', '{name}')",
+    "    local data = JSON.decode(save_state or '{{}}')",
+    "    if data.wounds then self.setVar('wounds', data.wounds) end",
+    "end",
+    "function onScriptingButtonDown(index, player_color)",
+    "    if index == 1 then broadcastToAll('{name} activated') end",
+    "end",
+    "function updateWounds(delta)",
+    "    local wounds = (self.getVar('wounds') or 0) + delta",
+    "    self.setVar('wounds', wounds)",
+    "    self.script_state = JSON.encode({{wounds = wounds}})",
+    "end",
+]
+
+
+def _weapon_line_values(rng: random.Random, ranged: bool) -> List[str]:
+    """Pick a plausible set of weapon characteristics."""
+    values = []
+    if ranged:
+        values.append(f'{rng.choice([12, 18, 24, 30, 36, 48])}"')
+    values.append(rng.choice(["1", "2", "3", "4", "D6", "D3", "2D6", "D6+1"]))
+    values.append(rng.choice(["2+", "3+", "4+", "5+"]))
+    values.append(str(rng.choice([3, 4, 5, 6, 8, 9, 10, 12])))
+    values.append(rng.choice(["0", "-1", "-2", "-3", "-4"]))
+    values.append(rng.choice(["1", "2", "3", "D3", "D6", "D6+1"]))
+    return values
+
+
+def _weapon_keywords(rng: random.Random) -> str:
+    """Pick zero or more weapon keywords."""
+    count = rng.choice([0, 0, 1, 1, 2, 3])
+    return ", ".join(rng.sample(WEAPON_KEYWORDS, count))
+
+
+def build_description(rng: random.Random, template: Dict[str, Any],
+                      ranged: List[str], melee: List[str]) -> str:
+    """
+    Build a description in the layout used by TTS list builders.
+
+    Args:
+        rng: The random generator to draw characteristics from
+        template: The unit template
+        ranged: The ranged weapon names this model carries
+        melee: The melee weapon names this model carries
+
+    Returns:
+        The description text
+    """
+    lines = ["[56f442] M    T   Sv    W    Ld   OC  [-]"]
+    lines.append("   ".join(template["stats"]) + "   [-][-]")
+    lines.append("")
+
+    if ranged:
+        lines.append("[e85545]Ranged weapons[-]")
+        for name in ranged:
+            rng_, a, bs, s, ap, d = _weapon_line_values(rng, True)
+            keywords = _weapon_keywords(rng)
+            lines.append(f"[c6c930]{name} (Ranged Weapons)[-]")
+            stats_line = f"{rng_} A:{a} BS:{bs} S:{s} AP:{ap} D:{d} "
+            if keywords:
+                stats_line += f"[7bc596][{keywords}][-] "
+            lines.append(stats_line)
+        lines.append("")
+
+    if melee:
+        lines.append("[e85545]Melee weapons[-]")
+        for name in melee:
+            a, ws, s, ap, d = _weapon_line_values(rng, False)
+            keywords = _weapon_keywords(rng)
+            lines.append(f"[c6c930]{name} (Melee Weapons)[-]")
+            stats_line = f"A:{a} WS:{ws} S:{s} AP:{ap} D:{d} "
+            if keywords:
+                stats_line += f"[7bc596][{keywords}][-] "
+            lines.append(stats_line)
+        lines.append("")
+
+    lines.append("[dc61ed]Abilities[-]")
+    for ability in template["abilities"]:
+        lines.append(ability)
+
+    return "\n".join(lines) + "\n"
+
+
+def build_lua_script(rng: random.Random, name: str) -> str:
+    """Build a LuaScript of a randomly chosen size."""
+    sizes, weights = zip(*LUA_SIZES)
+    size = rng.choices(sizes, weights=weights)[0]
+    if not size:
+        return ""
+
+    chunks = []
+    total = 0
+    while total < size:
+        line = rng.choice(LUA_LINES).format(name=name)
+        chunks.append(line)
+        total += len(line) + 1
+    return "\n".join(chunks)
+
+
+def _transform(rng: random.Random) -> Dict[str, float]:
+    """Build a TTS Transform block."""
+    return {
+        "posX": round(rng.uniform(-36.0, 36.0), 4),
+        "posY": 1.0,
+        "posZ": round(rng.uniform(-24.0, 24.0), 4),
+        "rotX": 0.0,
+        "rotY": round(rng.uniform(0.0, 360.0), 4),
+        "rotZ": 0.0,
+        "scaleX": 1.0,
+        "scaleY": 1.0,
+        "scaleZ": 1.0,
+    }
+
+
+def _make_object(rng: random.Random, guid: int, nickname: str, description: str,
+                 lua_script: str) -> Dict[str, Any]:
+    """Build a single Figurine_Custom object state."""
+    return {
+        "GUID": f"{guid:06x}",
+        "Name": "Figurine_Custom",
+        "Transform": _transform(rng),
+        "Nickname": nickname,
+        "Description": description,
+        "GMNotes": "",
+        "ColorDiffuse": {"r": 1.0, "g": 1.0, "b": 1.0},
+        "Locked": False,
+        "Grid": True,
+        "Snap": True,
+        "Autoraise": True,
+        "Sticky": True,
+        "Tooltip": True,
+        "GridProjection": False,
+        "Hands": False,
+        "CustomImage": {
+            "ImageURL": f"http://cloud-3.steamusercontent.com/ugc/{rng.getrandbits(48)}/",
+            "ImageSecondaryURL": "",
+            "WidthScale": 0.0,
+        },
+        "LuaScript": lua_script,
+        "LuaScriptState": "",
+        "XmlUI": "",
+    }
+
+
+def _unit_models(rng: random.Random, template: Dict[str, Any]) -> List[Tuple[str, List[str], List[str]]]:
+    """
+    Decide the models in one unit instance.
+
+    Returns:
+        A list of (variant, ranged weapons, melee weapons) tuples
+    """
+    size = rng.choice([1, 1, 3, 5, 5, 10, 10, 20])
+    base_ranged = template["ranged"][:1]
+    base_melee = template["melee"][:1]
+
+    models = []
+    for i in range(size):
+        variant = ""
+        ranged = list(base_ranged)
+        melee = list(base_melee)
+        if template["variants"] and i == 0:
+            variant = template["variants"][0]
+            ranged = rng.sample(template["ranged"], min(2, len(template["ranged"])))
+            melee = rng.sample(template["melee"], min(2, len(template["melee"])))
+        elif len(template["variants"]) > 1 and i == 1:
+            variant = template["variants"][1]
+            ranged = template["ranged"][-1:]
+        elif len(template["ranged"]) > 3 and not template["variants"]:
+            # Vehicles and monsters carry many weapon options
+            ranged = rng.sample(template["ranged"], rng.randint(2, len(template["ranged"])))
+        models.append((variant, ranged, melee))
+    return models
+
+
+def generate_save(object_count: int, seed: int = 0) -> Dict[str, Any]:
+    """
+    Generate a synthetic TTS save.
+
+    Args:
+        object_count: The number of entries in ObjectStates
+        seed: The random seed; the same seed always produces the same save
+
+    Returns:
+        The TTS JSON data
+    """
+    rng = random.Random(seed)
+    objects: List[Dict[str, Any]] = []
+    guid = 0x100000
+    instance = 0
+
+    while len(objects) < object_count:
+        template = rng.choice(UNIT_TEMPLATES)
+        instance += 1
+        unit_name = template["name"] + rng.choice(CRUSADE_SUFFIXES)
+        # Every fourth unit instance is a renamed copy, as happens when an
+        # army contains the same datasheet more than once
+        if instance % 4 == 0:
+            unit_name = f"{unit_name} {instance}"
+
+        lua_script = build_lua_script(rng, unit_name)
+        models = _unit_models(rng, template)
+        descriptions: Dict[Tuple[str, Tuple[str, ...], Tuple[str, ...]], str] = {}
+
+        for i, (variant, ranged, melee) in enumerate(models):
+            key = (variant, tuple(ranged), tuple(melee))
+            if key not in descriptions:
+                descriptions[key] = build_description(rng, template, ranged, melee)
+
+            color = rng.choice(NICKNAME_COLORS)
+            nickname = f"[{color}]{i + 1}/{len(models)}[-] {unit_name}"
+            if variant:
+                nickname += f" - {variant}"
+
+            objects.append(_make_object(rng, guid, nickname, descriptions[key], lua_script))
+            guid += 1
+            if len(objects) >= object_count:
+                break
+
+    return {
+        "SaveName": f"Synthetic Crusade {object_count}",
+        "EpochTime": 1700000000 + seed,
+        "Date": "11/14/2023 10:13:20 PM",
+        "VersionNumber": "v13.2.2",
+        "GameMode": "Warhammer 40,000",
+        "GameType": "",
+        "GameComplexity": "",
+        "Tags": [],
+        "Gravity": 0.5,
+        "PlayArea": 0.5,
+        "Table": "Table_Custom",
+        "Sky": "Sky_Museum",
+        "Note": "",
+        "LuaScript": "",
+        "LuaScriptState": "",
+        "XmlUI": "",
+        "ObjectStates": objects,
+    }
+
+
+def write_save(file_path: str, object_count: int, seed: int = 0) -> None:
+    """
+    Generate a synthetic save and write it to a file.
+
+    Args:
+        file_path: The path to write the save to
+        object_count: The number of entries in ObjectStates
+        seed: The random seed
+    """
+    with open(file_path, 'w', encoding='utf-8') as file:
+        json.dump(generate_save(object_count, seed), file, indent=2)
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Generate a synthetic TTS save")
+    parser.add_argument("output", help="Path of the JSON file to write")
+    parser.add_argument("-n", "--objects", type=int, default=1000,
+                        help="Number of objects in ObjectStates (default: 1000)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    args = parser.parse_args(argv)
+
+    write_save(args.output, args.objects, args.seed)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
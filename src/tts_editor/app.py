@@ -3,24 +3,39 @@ Application module for the Warhammer 40k TTS Unit Editor.
 """
 import tkinter as tk
 import os
-import json
-from typing import Optional
+from typing import List, Optional
 
 from .ui.main_window import MainWindow
+from .utils.watchdog import watchdog
 
 
 class Application:
     """Main application class for the Warhammer 40k TTS Unit Editor."""
     
-    def __init__(self):
-        """Initialize the application."""
+    def __init__(self, watch_stalls: bool = True):
+        """
+        Initialize the application.
+        
+        Args:
+            watch_stalls: Whether to log callbacks that stall the event loop,
+                see utils.watchdog
+        """
         self.root = tk.Tk()
+        if watch_stalls:
+            # Before the widgets are created, so their callbacks are timed
+            watchdog.install(self.root)
         self.main_window = MainWindow(self.root)
         
-        # Try to load the default file if specified
+        # Try to load the default file(s) if specified
         self.default_file = os.environ.get("TTS_EDITOR_DEFAULT_FILE")
-        if self.default_file and os.path.exists(self.default_file):
-            self.load_file(self.default_file)
+        if self.default_file:
+            default_files = [
+                path for path in self.default_file.split(os.pathsep) if os.path.exists(path)
+            ]
+            if len(default_files) == 1:
+                self.load_file(default_files[0])
+            elif default_files:
+                self.load_files(default_files)
     
     def load_file(self, file_path: str) -> bool:
         """
@@ -33,28 +48,34 @@ class Application:
             True if the file was loaded successfully, False otherwise
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                json_data = file.read()
-                
-            # Parse JSON
-            json_data = json.loads(json_data)
-            
-            # Load the data into the unit manager
-            self.main_window.unit_manager.load_json(json_data)
-            
-            # Update the UI
-            self.main_window.load_units()
-            self.main_window.root.title(f"Warhammer 40k TTS Unit Editor - {os.path.basename(file_path)}")
-            
+            self.main_window.load_file(file_path)
             return True
             
         except Exception as e:
             print(f"Failed to load file: {str(e)}")
             return False
     
+    def load_files(self, file_paths: List[str]) -> bool:
+        """
+        Load several TTS JSON files into the workspace concurrently.
+        
+        Args:
+            file_paths: The paths to the files to load
+            
+        Returns:
+            True if every file was loaded successfully, False otherwise
+        """
+        errors = self.main_window.load_files(file_paths)
+        for file_path, error in errors:
+            print(f"Failed to load file {file_path}: {str(error)}")
+        return not errors
+    
     def run(self):
         """Run the application."""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            watchdog.uninstall()
 
 
 def run_app():
@@ -7,22 +7,88 @@ import os
 import argparse
 
 from .app import Application
+from .utils.memory import memory
+from .utils.save_catalog import DEFAULT_CATALOG_PATH, SaveCatalog
+from .utils.watchdog import watchdog
 
 
 def main():
     """Main entry point function."""
     parser = argparse.ArgumentParser(description="Warhammer 40k TTS Unit Editor")
-    parser.add_argument("file", nargs="?", help="TTS JSON file to open")
+    parser.add_argument("files", nargs="*", help="TTS JSON file(s) to open")
+    parser.add_argument(
+        "--memory-profile", action="store_true",
+        help="Record the memory used by loading, editing and saving (Debug > Memory...)"
+    )
+    parser.add_argument(
+        "--memory-report", metavar="FILE",
+        help="Record memory use as with --memory-profile and write a JSON report to FILE on exit"
+    )
+    parser.add_argument(
+        "--stall-threshold", metavar="MS", type=int, default=250,
+        help="Log event handlers and event loop delays longer than MS milliseconds "
+             "(Debug > Stall Log...); 0 turns stall detection off (default: 250)"
+    )
+    parser.add_argument(
+        "--stall-log", metavar="FILE", default=watchdog.log_path,
+        help=f"Rotating stall log file (default: {watchdog.log_path})"
+    )
+    parser.add_argument(
+        "--scan-catalog", metavar="DIR",
+        help="Add the saves in DIR to the saves catalog, reading only new and changed saves, and exit"
+    )
+    parser.add_argument(
+        "--catalog", metavar="FILE", default=DEFAULT_CATALOG_PATH,
+        help=f"Saves catalog database for --scan-catalog (default: {DEFAULT_CATALOG_PATH})"
+    )
     args = parser.parse_args()
     
+    if args.scan_catalog:
+        return scan_catalog(args.catalog, args.scan_catalog)
+    
+    watchdog.threshold = args.stall_threshold / 1000.0
+    watchdog.log_path = args.stall_log
+    
+    # Start tracing before anything is loaded, so loading the files is accounted
+    if args.memory_profile or args.memory_report:
+        memory.start()
+    
     # Set the default file environment variable if specified
-    if args.file:
-        os.environ["TTS_EDITOR_DEFAULT_FILE"] = args.file
+    if args.files:
+        os.environ["TTS_EDITOR_DEFAULT_FILE"] = os.pathsep.join(args.files)
     
     # Create and run the application
-    app = Application()
+    app = Application(watch_stalls=args.stall_threshold > 0)
     app.run()
     
+    if args.memory_report:
+        memory.export_json(args.memory_report)
+    
+    return 0
+
+
+def scan_catalog(db_path: str, directory: str) -> int:
+    """
+    Refresh the saves catalog from a directory without starting the editor.
+    
+    Args:
+        db_path: The path of the catalog database
+        directory: The directory to scan
+        
+    Returns:
+        The exit status
+    """
+    if not os.path.isdir(directory):
+        print(f"{directory} is not a directory", file=sys.stderr)
+        return 1
+    
+    catalog = SaveCatalog(db_path)
+    try:
+        counts = catalog.refresh(directory)
+    finally:
+        catalog.close()
+    
+    print(", ".join(f"{count} {key}" for key, count in counts.items()))
     return 0
 
 
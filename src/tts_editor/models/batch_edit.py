@@ -0,0 +1,354 @@
+"""
+Batch edits applied to several profiles at once.
+"""
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..utils import description_parser
+from ..utils.stat_values import StatColumn, add_to_value
+from .profile_fields import Ability, MeleeWeapon, RangedWeapon, StatLine
+
+
+ProfileFields = Tuple[StatLine, List[RangedWeapon], List[MeleeWeapon], List[Ability]]
+Target = Tuple[int, int]
+
+# Weapon types a weapon change can be limited to
+WEAPON_TYPES = ("ranged", "melee", "both")
+
+# Stats whose numbers go below 0 when adjusted, e.g. AP 0 -1 is AP -1
+SIGNED_STATS = ("AP",)
+
+
+class Change:
+    """A structured change to the fields of a profile."""
+
+    __slots__ = ()
+
+    def apply(self, fields: ProfileFields) -> ProfileFields:
+        """
+        Apply the change.
+
+        Args:
+            fields: The (stats, ranged weapons, melee weapons, abilities) of a profile
+
+        Returns:
+            The changed fields; the same values if the change does not apply
+        """
+        raise NotImplementedError
+
+    def apply_many(self, fields_list: List[ProfileFields]) -> List[ProfileFields]:
+        """
+        Apply the change to the fields of several profiles.
+
+        Changes that can work on all the values at once override this.
+
+        Args:
+            fields_list: The fields of each profile
+
+        Returns:
+            The changed fields of each profile
+        """
+        return [self.apply(fields) for fields in fields_list]
+
+
+class SetStat(Change):
+    """Set one characteristic of the stat line."""
+
+    __slots__ = ("stat", "value")
+
+    def __init__(self, stat: str, value: str):
+        """
+        Initialize the change.
+
+        Args:
+            stat: The stat to set, one of StatLine.FIELDS
+            value: The new value
+        """
+        if stat not in StatLine.FIELDS:
+            raise ValueError(f"Unknown stat: {stat}")
+        self.stat = stat
+        self.value = value
+
+    def apply(self, fields: ProfileFields) -> ProfileFields:
+        stats, ranged, melee, abilities = fields
+        return stats.replace(**{self.stat: self.value}), ranged, melee, abilities
+
+
+class AddAbility(Change):
+    """Add a line to the abilities section, unless it is already there."""
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        """
+        Initialize the change.
+
+        Args:
+            text: The ability line to add
+        """
+        self.text = text.strip()
+
+    def apply(self, fields: ProfileFields) -> ProfileFields:
+        stats, ranged, melee, abilities = fields
+        if not self.text or any(ability.text == self.text for ability in abilities):
+            return fields
+        return stats, ranged, melee, abilities + [Ability(self.text)]
+
+
+class RemoveAbility(Change):
+    """Remove a line from the abilities section."""
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        """
+        Initialize the change.
+
+        Args:
+            text: The ability line to remove
+        """
+        self.text = text.strip()
+
+    def apply(self, fields: ProfileFields) -> ProfileFields:
+        stats, ranged, melee, abilities = fields
+        return stats, ranged, melee, [ability for ability in abilities if ability.text != self.text]
+
+
+class AdjustStat(Change):
+    """Add to one characteristic of the stat line, e.g. +1 W."""
+
+    __slots__ = ("stat", "amount")
+
+    def __init__(self, stat: str, amount: int):
+        """
+        Initialize the change.
+
+        Args:
+            stat: The stat to change, one of StatLine.FIELDS
+            amount: The amount to add, see StatColumn.add
+        """
+        if stat not in StatLine.FIELDS:
+            raise ValueError(f"Unknown stat: {stat}")
+        self.stat = stat
+        self.amount = amount
+
+    def apply(self, fields: ProfileFields) -> ProfileFields:
+        return self.apply_many([fields])[0]
+
+    def apply_many(self, fields_list: List[ProfileFields]) -> List[ProfileFields]:
+        column = StatColumn(getattr(fields[0], self.stat) for fields in fields_list)
+        column.add(self.amount, self.stat in SIGNED_STATS)
+        return [
+            (stats.replace(**{self.stat: value}), ranged, melee, abilities)
+            for (stats, ranged, melee, abilities), value in zip(fields_list, column.to_strings())
+        ]
+
+
+class WeaponChange(Change):
+    """Base class for changes applied to each matching weapon."""
+
+    __slots__ = ("weapon_type", "weapon_name")
+
+    def __init__(self, weapon_type: str = "both", weapon_name: Optional[str] = None):
+        """
+        Initialize the change.
+
+        Args:
+            weapon_type: "ranged", "melee" or "both"
+            weapon_name: Optional weapon name to limit the change to (case insensitive)
+        """
+        if weapon_type not in WEAPON_TYPES:
+            raise ValueError(f"Unknown weapon type: {weapon_type}")
+        self.weapon_type = weapon_type
+        self.weapon_name = weapon_name.strip().lower() if weapon_name else None
+
+    def apply(self, fields: ProfileFields) -> ProfileFields:
+        stats, ranged, melee, abilities = fields
+        if self.weapon_type != "melee":
+            ranged = self._apply_all(ranged)
+        if self.weapon_type != "ranged":
+            melee = self._apply_all(melee)
+        return stats, ranged, melee, abilities
+
+    def _apply_all(self, weapons: list) -> list:
+        """Apply the change to the matching weapons of a list."""
+        return [self.apply_weapon(weapon) if self.matches(weapon) else weapon for weapon in weapons]
+
+    def matches(self, weapon) -> bool:
+        """
+        Check whether the change is limited to a weapon's name, if to any.
+
+        Args:
+            weapon: A RangedWeapon or MeleeWeapon
+
+        Returns:
+            True if the weapon is one the change applies to
+        """
+        return self.weapon_name is None or weapon.name.lower() == self.weapon_name
+
+    def apply_weapon(self, weapon):
+        """
+        Apply the change to one weapon.
+
+        Args:
+            weapon: A RangedWeapon or MeleeWeapon
+
+        Returns:
+            The changed weapon, or the same weapon if the change does not apply
+        """
+        raise NotImplementedError
+
+
+class SetWeaponStat(WeaponChange):
+    """Set a stat of every matching weapon."""
+
+    __slots__ = ("stat", "value")
+
+    def __init__(self, stat: str, value: str, weapon_type: str = "both",
+                 weapon_name: Optional[str] = None):
+        """
+        Initialize the change.
+
+        Args:
+            stat: The weapon stat to set, e.g. "A" or "AP"; weapons without the
+                stat (BS on melee weapons, WS on ranged weapons) are left alone
+            value: The new value
+            weapon_type: "ranged", "melee" or "both"
+            weapon_name: Optional weapon name to limit the change to
+        """
+        super().__init__(weapon_type, weapon_name)
+        if stat == "name" or (stat not in RangedWeapon.FIELDS and stat not in MeleeWeapon.FIELDS):
+            raise ValueError(f"Unknown weapon stat: {stat}")
+        self.stat = stat
+        self.value = value
+
+    def apply_weapon(self, weapon):
+        if self.stat not in weapon.FIELDS:
+            return weapon
+        return weapon.replace(**{self.stat: self.value})
+
+
+class AddWeaponAbility(WeaponChange):
+    """Add a keyword such as "Lethal Hits" to the abilities of every matching weapon."""
+
+    __slots__ = ("keyword",)
+
+    def __init__(self, keyword: str, weapon_type: str = "both",
+                 weapon_name: Optional[str] = None):
+        """
+        Initialize the change.
+
+        Args:
+            keyword: The weapon ability to add
+            weapon_type: "ranged", "melee" or "both"
+            weapon_name: Optional weapon name to limit the change to
+        """
+        super().__init__(weapon_type, weapon_name)
+        self.keyword = keyword.strip()
+
+    def apply_weapon(self, weapon):
+        keywords = [keyword.strip() for keyword in weapon.abilities.split(",") if keyword.strip()]
+        if not self.keyword or self.keyword.lower() in (keyword.lower() for keyword in keywords):
+            return weapon
+        return weapon.replace(abilities=", ".join(keywords + [self.keyword]))
+
+
+class AdjustWeaponStat(WeaponChange):
+    """Add to a stat of every matching weapon, e.g. +1 A on all melee weapons."""
+
+    __slots__ = ("stat", "amount")
+
+    def __init__(self, stat: str, amount: int, weapon_type: str = "both",
+                 weapon_name: Optional[str] = None):
+        """
+        Initialize the change.
+
+        Args:
+            stat: The weapon stat to change, e.g. "A" or "AP"; weapons without
+                the stat are left alone
+            amount: The amount to add, see StatColumn.add
+            weapon_type: "ranged", "melee" or "both"
+            weapon_name: Optional weapon name to limit the change to
+        """
+        super().__init__(weapon_type, weapon_name)
+        if stat == "name" or (stat not in RangedWeapon.FIELDS and stat not in MeleeWeapon.FIELDS):
+            raise ValueError(f"Unknown weapon stat: {stat}")
+        self.stat = stat
+        self.amount = amount
+
+    def apply_weapon(self, weapon):
+        if self.stat not in weapon.FIELDS:
+            return weapon
+        value = add_to_value(getattr(weapon, self.stat), self.amount, self.stat in SIGNED_STATS)
+        return weapon.replace(**{self.stat: value})
+
+    def apply_many(self, fields_list: List[ProfileFields]) -> List[ProfileFields]:
+        # Gather the stat of every matching weapon of every profile into one column
+        results = [[stats, list(ranged), list(melee), abilities]
+                   for stats, ranged, melee, abilities in fields_list]
+        positions = []  # (weapon list, index) of each value in the column
+        column = StatColumn()
+        for result in results:
+            for weapons, weapon_type in ((result[1], "ranged"), (result[2], "melee")):
+                if self.weapon_type not in (weapon_type, "both"):
+                    continue
+                for index, weapon in enumerate(weapons):
+                    if self.stat in weapon.FIELDS and self.matches(weapon):
+                        positions.append((weapons, index))
+                        column.extend((getattr(weapon, self.stat),))
+
+        column.add(self.amount, self.stat in SIGNED_STATS)
+        for (weapons, index), value in zip(positions, column.to_strings()):
+            weapons[index] = weapons[index].replace(**{self.stat: value})
+        return [tuple(result) for result in results]
+
+
+def apply_batch(unit_manager, targets: Iterable[Target], change: Change,
+                parse: Callable[[str], ProfileFields] = description_parser.parse_profile
+                ) -> Tuple[List[Target], List[Target]]:
+    """
+    Apply a change to several profiles in one pass.
+
+    Each distinct description is parsed and updated once, the change is
+    applied to all of their fields together (see Change.apply_many), and
+    every affected object is written back in a single save_descriptions call.
+    Only the changed values are rewritten in each description's text (see
+    description_parser.update_description), so color codes and lines the
+    parser does not recognise are kept. Profiles the change does not affect
+    keep their description untouched.
+
+    Args:
+        unit_manager: The unit manager holding the profiles
+        targets: The (unit index, profile index) of each profile to change
+        change: The change to apply
+        parse: Optional parse function, e.g. a cached one
+
+    Returns:
+        The (unit index, profile index) of the profiles that changed, and of
+        those left unchanged because the change couldn't be made in their
+        text, e.g. setting a stat their description doesn't have
+    """
+    target_descriptions: List[Tuple[Target, str]] = []
+    descriptions: Dict[str, None] = {}  # Distinct descriptions, in order
+    for unit_index, profile_index in targets:
+        description = unit_manager.units[unit_index].profiles[profile_index].description
+        target_descriptions.append(((unit_index, profile_index), description))
+        descriptions[description] = None
+
+    fields_list = [parse(description) for description in descriptions]
+    results: Dict[str, Optional[str]] = {}  # Old description -> new description, None if not possible
+    for description, fields, new_fields in zip(descriptions, fields_list,
+                                               change.apply_many(fields_list)):
+        if tuple(new_fields) == tuple(fields):
+            results[description] = description
+        else:
+            results[description] = description_parser.update_description(description, fields, new_fields)
+
+    changes: Dict[Target, str] = {}
+    skipped: List[Target] = []
+    for target, description in target_descriptions:
+        new_description = results[description]
+        if new_description is None:
+            skipped.append(target)
+        elif new_description != description:
+            changes[target] = new_description
+    return unit_manager.save_descriptions(changes), skipped
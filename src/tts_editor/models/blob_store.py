@@ -0,0 +1,176 @@
+"""
+Memory-mapped blob store for large fields the editor never changes.
+"""
+import hashlib
+import json
+import mmap
+import tempfile
+from typing import Any, Dict, Optional, Tuple
+
+
+# Object fields moved out of the JSON tree at load; none of them is read or
+# edited, and ContainedObjects is walked instead so bagged models stay editable
+SPILLED_FIELDS = (
+    "LuaScript", "LuaScriptState", "XmlUI", "States",
+    "Transform", "ColorDiffuse", "CustomMesh", "CustomImage", "CustomDeck",
+    "CustomAssetbundle", "CustomPDF", "AttachedDecals", "AttachedSnapPoints",
+    "PhysicsMaterial", "Rigidbody",
+)
+
+# Strings shorter than this (in characters) stay in the tree
+MIN_SPILL_SIZE = 256
+
+
+class BlobHandle:
+    """Lightweight stand-in for a value stored in a BlobStore."""
+
+    __slots__ = ("store", "offset", "length", "is_json")
+
+    def __init__(self, store: "BlobStore", offset: int, length: int, is_json: bool):
+        """
+        Initialize a blob handle.
+
+        Args:
+            store: The store holding the value
+            offset: The byte offset of the value in the blob file
+            length: The encoded length of the value in bytes
+            is_json: Whether the value was a JSON object rather than a string
+        """
+        self.store = store
+        self.offset = offset
+        self.length = length
+        self.is_json = is_json
+
+    def load(self) -> Any:
+        """
+        Read the value back from the store.
+
+        Returns:
+            The original string or object
+        """
+        return self.store.read(self)
+
+    def __repr__(self):
+        return f"BlobHandle(offset={self.offset}, length={self.length})"
+
+
+class BlobStore:
+    """Append-only, content-deduplicated store backed by a memory-mapped temporary file."""
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self._file = tempfile.TemporaryFile(prefix="tts_editor_blobs_")
+        self._handles: Dict[Tuple[bytes, bool], BlobHandle] = {}
+        self._mmap: Optional[mmap.mmap] = None
+        self._dirty = False
+        self.size = 0
+        self.stored_bytes = 0  # Bytes represented by all handles handed out
+
+    def put(self, value: Any) -> BlobHandle:
+        """
+        Store a string or JSON value.
+
+        Identical values are stored once and share a handle.
+
+        Args:
+            value: The value to store
+
+        Returns:
+            The handle for the value
+        """
+        is_json = not isinstance(value, str)
+        data = (json.dumps(value) if is_json else value).encode("utf-8")
+        key = (hashlib.sha1(data).digest(), is_json)
+        self.stored_bytes += len(data)
+
+        handle = self._handles.get(key)
+        if handle is None:
+            self._file.seek(self.size)
+            self._file.write(data)
+            handle = BlobHandle(self, self.size, len(data), is_json)
+            self._handles[key] = handle
+            self.size += len(data)
+            self._dirty = True
+        return handle
+
+    def read(self, handle: BlobHandle) -> Any:
+        """
+        Read a value from the store.
+
+        Args:
+            handle: The handle returned by put
+
+        Returns:
+            The original string or object
+        """
+        if handle.length == 0:
+            return {} if handle.is_json else ""
+
+        if self._dirty or self._mmap is None:
+            self._remap()
+        text = self._mmap[handle.offset:handle.offset + handle.length].decode("utf-8")
+        return json.loads(text) if handle.is_json else text
+
+    def _remap(self) -> None:
+        """Map the file again after it grew."""
+        self._file.flush()
+        if self._mmap is not None:
+            self._mmap.close()
+        self._mmap = mmap.mmap(self._file.fileno(), self.size, access=mmap.ACCESS_READ)
+        self._dirty = False
+
+    def close(self) -> None:
+        """Release the mapping and delete the blob file."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+        self._handles = {}
+
+
+def _spill_object(obj: Dict[str, Any], store: BlobStore) -> None:
+    """Move the large fields of one object (and the objects it contains) to the store."""
+    for field in SPILLED_FIELDS:
+        value = obj.get(field)
+        if isinstance(value, BlobHandle):
+            if value.store is store:
+                continue
+            # Loaded again from a tree spilled into an older store
+            value = value.load()
+        if value is None:
+            continue
+        if isinstance(value, str):
+            if len(value) >= MIN_SPILL_SIZE:
+                obj[field] = store.put(value)
+        elif isinstance(value, (dict, list)):
+            obj[field] = store.put(value)
+
+    for contained in obj.get("ContainedObjects", ()):
+        if isinstance(contained, dict):
+            _spill_object(contained, store)
+
+
+def spill_fields(json_data: Dict[str, Any], store: BlobStore) -> None:
+    """
+    Replace large non-edited fields in a TTS save with blob handles.
+
+    Covers the save's own scripts and every object in ObjectStates, including
+    objects inside bags.
+
+    Args:
+        json_data: The TTS JSON data, modified in place
+        store: The store to move values into
+    """
+    _spill_object(json_data, store)
+    for obj in json_data.get("ObjectStates", ()):
+        if isinstance(obj, dict):
+            _spill_object(obj, store)
+
+
+class BlobEncoder(json.JSONEncoder):
+    """JSON encoder that streams blob handles back out as their original values."""
+
+    def default(self, o):
+        if isinstance(o, BlobHandle):
+            return o.load()
+        return super().default(o)
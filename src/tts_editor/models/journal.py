@@ -0,0 +1,287 @@
+"""
+Append-only change journal for the Warhammer 40k TTS Unit Editor.
+
+Each batch of description edits is appended to a journal next to the save as
+an RFC 6902 JSON Patch, so edits that were applied but not yet saved survive
+a crash. The journal is a JSON Lines file: a header recording the size and
+modification time of the save it applies to, then one {"time", "patch"}
+entry per batch. Writing the save discards the journal.
+
+Every edited object gets a "test" of its GUID followed by a "replace" of its
+Description, e.g.
+
+    [{"op": "test", "path": "/ObjectStates/12/GUID", "value": "a1b2c3"},
+     {"op": "replace", "path": "/ObjectStates/12/Description", "value": "..."}]
+
+so the exported patch can be applied to other copies of the save with any
+JSON Patch tool, and fails there rather than edit the wrong object when the
+objects are in a different order. resolve_descriptions applies the same
+patches here, finding moved objects by GUID instead of failing.
+"""
+import json
+import os
+import re
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+# Appended to the save's path to name its journal
+JOURNAL_SUFFIX = ".journal"
+
+# Version written in the journal header
+FORMAT_VERSION = 1
+
+_OBJECT_PATH = re.compile(r'^/ObjectStates/(\d+)/(Description|GUID)$')
+
+
+class PatchError(ValueError):
+    """A patch that can't be applied to a save."""
+
+
+def description_operations(index: int, obj: Dict[str, Any], description: str) -> List[Dict[str, Any]]:
+    """
+    Build the patch operations setting an object's description.
+
+    Args:
+        index: The position of the object in ObjectStates
+        obj: The object, before its description is changed
+        description: The new description
+
+    Returns:
+        A test of the object's GUID, if it has one, and a replace of its
+        Description (an add if it had none)
+    """
+    operations = []
+    guid = obj.get("GUID")
+    if guid:
+        operations.append({"op": "test", "path": f"/ObjectStates/{index}/GUID", "value": guid})
+    operations.append({
+        "op": "replace" if "Description" in obj else "add",
+        "path": f"/ObjectStates/{index}/Description",
+        "value": description,
+    })
+    return operations
+
+
+def resolve_descriptions(objects: Sequence[Dict[str, Any]],
+                         operations: Sequence[Dict[str, Any]]) -> List[Tuple[int, str]]:
+    """
+    Work out the descriptions a patch sets, without changing anything.
+
+    Only the operations this journal writes are supported: tests of an
+    object's GUID and adds or replaces of its Description. When a GUID test
+    fails, the following operations on that position go to the object with
+    that GUID instead, so patches from another copy of the save still apply
+    after objects were added, removed or reordered. Objects are only indexed
+    by GUID the first time that happens, so applying a patch to the copy it
+    was recorded from costs time in proportion to the patch, not the save.
+
+    Args:
+        objects: The ObjectStates of the save
+        operations: The patch operations
+
+    Returns:
+        The (object position, new description) of each description set, in
+        patch order
+
+    Raises:
+        PatchError: If an operation is not supported or no object matches it
+    """
+    positions_by_guid: Optional[Dict[str, int]] = None
+    moved: Dict[int, int] = {}  # Patch position -> position in objects
+    descriptions = []
+    for operation in operations:
+        if not isinstance(operation, dict):
+            raise PatchError(f"Not a patch operation: {operation!r}")
+        op = operation.get("op")
+        path = operation.get("path", "")
+        value = operation.get("value")
+        match = _OBJECT_PATH.match(path)
+        if not match:
+            raise PatchError(f"Unsupported path {path!r}; only object descriptions can be patched")
+        index, field = int(match.group(1)), match.group(2)
+
+        if op == "test" and field == "GUID":
+            if index < len(objects) and objects[index].get("GUID") == value:
+                moved.pop(index, None)
+                continue
+            if positions_by_guid is None:
+                positions_by_guid = {
+                    obj.get("GUID"): i for i, obj in enumerate(objects) if isinstance(obj, dict)
+                }
+            if value not in positions_by_guid:
+                raise PatchError(f"No object with GUID {value!r}")
+            moved[index] = positions_by_guid[value]
+        elif op in ("add", "replace") and field == "Description":
+            position = moved.get(index, index)
+            if position >= len(objects):
+                raise PatchError(f"No object at {path!r}")
+            if not isinstance(value, str):
+                raise PatchError(f"Description at {path!r} is not a string")
+            descriptions.append((position, value))
+        else:
+            raise PatchError(f"Unsupported operation {op!r} on {path!r}")
+    return descriptions
+
+
+def _parse_journal(text: str) -> Tuple[Optional[Dict[str, Any]], List[List[Dict[str, Any]]]]:
+    """Parse a journal into its header and patches; a last line cut short by a crash is skipped."""
+    header = None
+    patches = []
+    lines = text.splitlines()
+    for line_number, line in enumerate(lines):
+        if not line.strip():
+            continue
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            if line_number == len(lines) - 1:
+                break
+            raise PatchError(f"Line {line_number + 1} of the journal is not valid JSON")
+        if isinstance(entry, dict) and "journal" in entry:
+            header = entry
+        elif isinstance(entry, dict) and isinstance(entry.get("patch"), list):
+            patches.append(entry["patch"])
+        else:
+            raise PatchError(f"Line {line_number + 1} of the journal is not a journal entry")
+    return header, patches
+
+
+def read_patch(file_path: str) -> List[Dict[str, Any]]:
+    """
+    Read the operations of a patch file: a JSON Patch document, as written
+    by ChangeJournal.export, or a journal itself.
+
+    Args:
+        file_path: The path to the patch or journal
+
+    Returns:
+        The patch operations, in order
+
+    Raises:
+        PatchError: If the file is neither
+    """
+    with open(file_path, 'r', encoding='utf-8') as file:
+        text = file.read()
+
+    if text.lstrip().startswith("["):
+        try:
+            operations = json.loads(text)
+        except ValueError as e:
+            raise PatchError(f"Not a valid JSON Patch: {e}")
+        if not isinstance(operations, list):
+            raise PatchError("Not a valid JSON Patch: expected a list of operations")
+        return operations
+
+    _, patches = _parse_journal(text)
+    return [operation for patch in patches for operation in patch]
+
+
+class ChangeJournal:
+    """The journal of the edits made to a save since it was last written."""
+
+    def __init__(self, file_path: str):
+        """
+        Initialize the journal of a save; nothing is written until an edit is appended.
+
+        Args:
+            file_path: The path to the save
+        """
+        self.file_path = file_path
+        self.path = file_path + JOURNAL_SUFFIX
+
+    def exists(self) -> bool:
+        """
+        Check whether there is a journal for the save.
+
+        Returns:
+            True if edits were journaled and the save wasn't written since
+        """
+        return os.path.exists(self.path)
+
+    def append(self, patch: List[Dict[str, Any]]) -> None:
+        """
+        Append a patch and flush it to disk.
+
+        Args:
+            patch: The operations of one batch of edits
+
+        Raises:
+            OSError: If the journal can't be written
+        """
+        new = not os.path.exists(self.path)
+        with open(self.path, 'a', encoding='utf-8') as file:
+            if new:
+                stat = os.stat(self.file_path)
+                file.write(json.dumps({
+                    "journal": FORMAT_VERSION,
+                    "file": os.path.basename(self.file_path),
+                    "size": stat.st_size,
+                    "mtime": stat.st_mtime,
+                }) + "\n")
+            file.write(json.dumps({"time": time.time(), "patch": patch}) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+
+    def read(self) -> Tuple[Optional[Dict[str, Any]], List[List[Dict[str, Any]]]]:
+        """
+        Read the journal.
+
+        Returns:
+            The header, or None if it is missing, and the patches in order
+
+        Raises:
+            PatchError: If the journal is corrupt
+        """
+        with open(self.path, 'r', encoding='utf-8') as file:
+            return _parse_journal(file.read())
+
+    def save_changed(self, header: Optional[Dict[str, Any]]) -> bool:
+        """
+        Check whether the save was changed by something else since the journal was started.
+
+        Args:
+            header: The header read from the journal
+
+        Returns:
+            True if the save's size or modification time differ from the header's
+        """
+        if header is None:
+            return True
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return True
+        return (stat.st_size, stat.st_mtime) != (header.get("size"), header.get("mtime"))
+
+    def operations(self) -> List[Dict[str, Any]]:
+        """
+        Get every journaled operation.
+
+        Returns:
+            The operations of all the patches, in order
+        """
+        _, patches = self.read()
+        return [operation for patch in patches for operation in patch]
+
+    def export(self, file_path: str) -> int:
+        """
+        Write the journaled edits as a single JSON Patch document.
+
+        Args:
+            file_path: The path to write to
+
+        Returns:
+            The number of operations written
+        """
+        operations = self.operations()
+        with open(file_path, 'w', encoding='utf-8') as file:
+            json.dump(operations, file, indent=2)
+        return len(operations)
+
+    def discard(self) -> None:
+        """Delete the journal, e.g. once its edits were written to the save."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
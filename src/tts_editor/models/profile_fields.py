@@ -0,0 +1,160 @@
+"""
+Structured profile fields for the Warhammer 40k TTS Unit Editor.
+
+Stats, weapons and abilities parsed from a description are small slotted
+value objects. They compare and hash by their fields, so an unchanged
+profile can be detected by comparing what the editor holds against what was
+parsed. Treat them as immutable once built; use replace to derive a changed
+copy.
+"""
+from typing import Any, Tuple
+
+
+class Record:
+    """Base class for slotted value objects compared by their fields."""
+
+    __slots__ = ()
+
+    FIELDS: Tuple[str, ...] = ()
+
+    def astuple(self) -> Tuple[str, ...]:
+        """
+        Get the field values in FIELDS order.
+
+        Returns:
+            A tuple of the field values
+        """
+        return tuple(getattr(self, field) for field in self.FIELDS)
+
+    def replace(self, **changes: Any) -> "Record":
+        """
+        Create a copy with some fields changed.
+
+        Args:
+            **changes: New values by field name
+
+        Returns:
+            The changed copy
+        """
+        values = dict(zip(self.FIELDS, self.astuple()))
+        values.update(changes)
+        return type(self)(**values)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.astuple() == other.astuple()
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self):
+        return hash(self.astuple())
+
+    def __repr__(self):
+        fields = ", ".join(f"{field}={getattr(self, field)!r}" for field in self.FIELDS)
+        return f"{type(self).__name__}({fields})"
+
+
+class StatLine(Record):
+    """The model characteristics of a profile."""
+
+    FIELDS = ("M", "T", "Sv", "W", "Ld", "OC")
+    __slots__ = FIELDS
+
+    def __init__(self, M: str = "", T: str = "", Sv: str = "", W: str = "",
+                 Ld: str = "", OC: str = ""):
+        """
+        Initialize a stat line.
+
+        Args:
+            M: Movement
+            T: Toughness
+            Sv: Save
+            W: Wounds
+            Ld: Leadership
+            OC: Objective control
+        """
+        self.M = M
+        self.T = T
+        self.Sv = Sv
+        self.W = W
+        self.Ld = Ld
+        self.OC = OC
+
+
+class RangedWeapon(Record):
+    """A ranged weapon profile."""
+
+    FIELDS = ("name", "range", "A", "BS", "S", "AP", "D", "abilities")
+    __slots__ = FIELDS
+
+    def __init__(self, name: str, range: str = "", A: str = "", BS: str = "",
+                 S: str = "", AP: str = "", D: str = "", abilities: str = ""):
+        """
+        Initialize a ranged weapon.
+
+        Args:
+            name: The weapon name
+            range: The range, e.g. '24"'
+            A: Attacks
+            BS: Ballistic skill
+            S: Strength
+            AP: Armour penetration
+            D: Damage
+            abilities: The comma separated weapon abilities
+        """
+        self.name = name
+        self.range = range
+        self.A = A
+        self.BS = BS
+        self.S = S
+        self.AP = AP
+        self.D = D
+        self.abilities = abilities
+
+
+class MeleeWeapon(Record):
+    """A melee weapon profile."""
+
+    FIELDS = ("name", "A", "WS", "S", "AP", "D", "abilities")
+    __slots__ = FIELDS
+
+    def __init__(self, name: str, A: str = "", WS: str = "", S: str = "",
+                 AP: str = "", D: str = "", abilities: str = ""):
+        """
+        Initialize a melee weapon.
+
+        Args:
+            name: The weapon name
+            A: Attacks
+            WS: Weapon skill
+            S: Strength
+            AP: Armour penetration
+            D: Damage
+            abilities: The comma separated weapon abilities
+        """
+        self.name = name
+        self.A = A
+        self.WS = WS
+        self.S = S
+        self.AP = AP
+        self.D = D
+        self.abilities = abilities
+
+
+class Ability(Record):
+    """A line of the abilities section."""
+
+    FIELDS = ("text",)
+    __slots__ = FIELDS
+
+    def __init__(self, text: str):
+        """
+        Initialize an ability.
+
+        Args:
+            text: The ability text, without color codes
+        """
+        self.text = text
@@ -1,14 +1,90 @@
 """
 Unit data model for the Warhammer 40k TTS Unit Editor.
 """
+import json
+import os
 import re
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any, Set, Tuple
+
+from ..utils import fuzzy_names
+from ..utils.memory import memory
+from ..utils.profiling import profiler
+from .blob_store import BlobEncoder, BlobStore, spill_fields
+from .journal import ChangeJournal, description_operations, resolve_descriptions
+
+
+class FileChangedError(ValueError):
+    """The loaded file was changed on disk by something else since it was indexed."""
+
+
+def object_key(obj: Dict[str, Any], index: int, seen) -> str:
+    """
+    Get the stable key of an object in ObjectStates.
+    
+    The key is the GUID assigned by TTS. Objects without a GUID, or whose GUID
+    was already used by an earlier object, fall back to "#<index>".
+    
+    Args:
+        obj: The object state
+        index: The position of the object in ObjectStates
+        seen: The keys already assigned to earlier objects
+        
+    Returns:
+        The object key
+    """
+    guid = obj.get("GUID")
+    if not guid or guid in seen:
+        return f"#{index}"
+    return guid
+
+
+def file_signature(file_path: str) -> Tuple[int, float]:
+    """
+    Get what is compared to notice that a file was changed.
+    
+    Args:
+        file_path: The path to the file
+        
+    Returns:
+        The file's (size, modification time)
+    """
+    stat = os.stat(file_path)
+    return stat.st_size, stat.st_mtime
+
+
+def split_nickname(nickname: str) -> Tuple[str, str]:
+    """
+    Split a model's nickname into the unit name and profile name.
+    
+    Color codes and counts like "1/1" are removed; a variant such as
+    "Howling Banshees - Exarch" names the profile.
+    
+    Args:
+        nickname: The nickname from the JSON
+        
+    Returns:
+        The (unit name, profile name) tuple; the profile name is "Standard"
+        for nicknames without a variant
+    """
+    # Extract the base unit name (remove color codes and counts)
+    clean_nickname = re.sub(r'\[[^\]]*\]', '', nickname)  # Remove color codes
+    base_name = re.sub(r'^\d+/\d+\s+', '', clean_nickname).strip()  # Remove counts like "1/1"
+    
+    # Check if this is a variant (like "- Exarch" or "- Fusion Pistol")
+    variant = ""
+    if " - " in base_name:
+        parts = base_name.split(" - ", 1)
+        base_name = parts[0].strip()
+        variant = parts[1].strip()
+    
+    return base_name, variant if variant else "Standard"
 
 
 class UnitProfile:
     """Represents a single unit profile (variant) in the TTS JSON."""
     
-    def __init__(self, index: int, name: str, nickname: str, description: str):
+    def __init__(self, index: int, name: str, nickname: str, description: str,
+                 guid: Optional[str] = None):
         """
         Initialize a unit profile.
         
@@ -17,6 +93,7 @@ class UnitProfile:
             name: The profile name (e.g., "Standard", "Exarch", etc.)
             nickname: The original nickname from the JSON
             description: The description text containing stats, weapons, and abilities
+            guid: The key of the object, see object_key; defaults to "#<index>"
         """
         self.index = index
         self.name = name
@@ -24,6 +101,8 @@ class UnitProfile:
         self.description = description
         self.count = 1
         self.identical_indices = [index]  # List of indices for identical profiles
+        self.guid = guid or f"#{index}"
+        self.identical_guids = [self.guid]  # Stable keys of identical profiles
 
 
 class Unit:
@@ -52,10 +131,29 @@ class Unit:
 class UnitManager:
     """Manages units and their profiles from the TTS JSON data."""
     
-    def __init__(self):
-        """Initialize the unit manager."""
+    def __init__(self, spill_large_fields: bool = True, journal_edits: bool = True):
+        """
+        Initialize the unit manager.
+        
+        Args:
+            spill_large_fields: Whether to move scripts, XML UI, states and
+                other fields the editor never reads out of the JSON tree into a
+                memory-mapped blob store at load, see blob_store.SPILLED_FIELDS
+            journal_edits: Whether to append description edits to a change
+                journal next to the loaded file until it is saved, see
+                journal.ChangeJournal
+        """
         self.units: List[Unit] = []
         self.json_data: Optional[Dict[str, Any]] = None
+        self.file_path: Optional[str] = None
+        self.file_signature: Optional[Tuple[int, float]] = None  # See file_signature
+        self.objects_by_guid: Dict[str, Dict[str, Any]] = {}
+        self.profiles_by_guid: Dict[str, Tuple[int, int]] = {}
+        self.spill_large_fields = spill_large_fields
+        self.blob_store: Optional[BlobStore] = None
+        self.dirty_profiles: Set[Tuple[int, int]] = set()  # Profiles edited since the last save
+        self.dirty_guids: Set[str] = set()  # Objects edited since the last save
+        self.journal_edits = journal_edits
     
     def load_json(self, json_data: Dict[str, Any]) -> None:
         """
@@ -64,9 +162,216 @@ class UnitManager:
         Args:
             json_data: The TTS JSON data
         """
-        self.json_data = json_data
+        with memory.phase("load_json"):
+            self.json_data = json_data
+            self.units = []
+            self.objects_by_guid = {}
+            self.profiles_by_guid = {}
+            self.mark_clean()
+            with profiler.span("group_units"), memory.phase("group_units"):
+                self._group_units()
+            self._spill_fields()
+    
+    def _spill_fields(self) -> None:
+        """Move the large fields of the loaded JSON data into a fresh blob store."""
+        old_store = self.blob_store
+        self.blob_store = None
+        if self.spill_large_fields and self.json_data:
+            self.blob_store = BlobStore()
+            spill_fields(self.json_data, self.blob_store)
+        if old_store is not None:
+            old_store.close()
+    
+    def load_file(self, file_path: str) -> None:
+        """
+        Read, decode and load a TTS JSON file.
+        
+        Args:
+            file_path: The path to the file to load
+        """
+        signature = file_signature(file_path)
+        with memory.phase("read_json"):
+            json_data = self._read_file(file_path)
+        self.load_json(json_data)
+        self.file_path = file_path
+        self.file_signature = signature
+    
+    def _read_file(self, file_path: str) -> Dict[str, Any]:
+        """
+        Read and decode a TTS JSON file.
+        
+        Args:
+            file_path: The path to the file to read
+            
+        Returns:
+            The TTS JSON data
+        """
+        with profiler.span("file_read"):
+            with open(file_path, 'r', encoding='utf-8') as file:
+                text = file.read()
+        
+        with profiler.span("json_decode"):
+            return json.loads(text)
+    
+    def export_roster(self) -> List[Tuple[str, List[tuple]]]:
+        """
+        Export the grouped units as compact, picklable tuples.
+        
+        Returns:
+            A list of (unit name, profiles) tuples, where each profile is an
+            (index, name, nickname, description, identical indices,
+            identical GUIDs) tuple
+        """
+        return [
+            (unit.name, [
+                (p.index, p.name, p.nickname, p.description, p.identical_indices,
+                 p.identical_guids)
+                for p in unit.profiles
+            ])
+            for unit in self.units
+        ]
+    
+    def load_roster(self, roster: List[Tuple[str, List[tuple]]], file_path: str,
+                    signature: Optional[Tuple[int, float]] = None) -> None:
+        """
+        Load units exported by export_roster for a file grouped elsewhere.
+        
+        The JSON data itself is only read from file_path when it is first
+        needed, see ensure_json.
+        
+        Args:
+            roster: The exported roster
+            file_path: The path of the file the roster was grouped from
+            signature: The file_signature of the file when it was grouped;
+                reading it fails if it changed since
+        """
+        self.json_data = None
+        self.file_path = file_path
+        self.file_signature = signature
+        self.objects_by_guid = {}
         self.units = []
-        self._group_units()
+        self.mark_clean()
+        for unit_name, profiles in roster:
+            unit = Unit(unit_name)
+            for index, name, nickname, description, identical_indices, identical_guids in profiles:
+                profile = UnitProfile(index, name, nickname, description, identical_guids[0])
+                profile.count = len(identical_indices)
+                profile.identical_indices = list(identical_indices)
+                profile.identical_guids = list(identical_guids)
+                unit.add_profile(profile)
+            self.units.append(unit)
+        self._index_profiles()
+    
+    def ensure_json(self) -> None:
+        """
+        Read the JSON data of a roster loaded with load_roster, if not read yet.
+        
+        Raises:
+            FileChangedError: If the file changed since the roster was grouped
+        """
+        if self.json_data is not None or not self.file_path:
+            return
+        
+        if self.file_signature is not None and file_signature(self.file_path) != self.file_signature:
+            raise FileChangedError(
+                f"{os.path.basename(self.file_path)} was changed on disk since it was opened. "
+                "Open it again to edit it."
+            )
+        self.json_data = self._read_file(self.file_path)
+        self._index_objects()
+        self._spill_fields()
+    
+    def _index_objects(self) -> None:
+        """Map the key of every object in ObjectStates to the object itself."""
+        self.objects_by_guid = {}
+        for i, obj in enumerate(self.json_data.get("ObjectStates", [])):
+            self.objects_by_guid[object_key(obj, i, self.objects_by_guid)] = obj
+    
+    def _index_profiles(self) -> None:
+        """Map the key of every object to the (unit index, profile index) holding it."""
+        self.profiles_by_guid = {}
+        for unit_index, unit in enumerate(self.units):
+            for profile_index, profile in enumerate(unit.profiles):
+                for guid in profile.identical_guids:
+                    self.profiles_by_guid[guid] = (unit_index, profile_index)
+    
+    def find_profile(self, guid: str) -> Optional[Tuple[int, int]]:
+        """
+        Find the profile an object belongs to.
+        
+        Args:
+            guid: The object's GUID
+            
+        Returns:
+            A (unit index, profile index) tuple, or None if the GUID is unknown
+        """
+        return self.profiles_by_guid.get(guid)
+    
+    def has_data(self) -> bool:
+        """
+        Check whether any save data is loaded.
+        
+        Returns:
+            True if JSON data is loaded or can be read on demand
+        """
+        return bool(self.json_data) or bool(self.file_path and self.units)
+    
+    @property
+    def journal(self) -> Optional[ChangeJournal]:
+        """The change journal of the loaded file, or None if edits are not journaled."""
+        if not self.journal_edits or not self.file_path:
+            return None
+        return ChangeJournal(self.file_path)
+    
+    @property
+    def dirty_count(self) -> int:
+        """The number of profiles edited since the last save."""
+        return len(self.dirty_profiles)
+    
+    def is_dirty(self) -> bool:
+        """
+        Check whether there are edits that have not been saved.
+        
+        Returns:
+            True if any profile was edited since the last save
+        """
+        return bool(self.dirty_profiles)
+    
+    def mark_clean(self) -> None:
+        """Forget pending edits, e.g. after they were written."""
+        self.dirty_profiles = set()
+        self.dirty_guids = set()
+    
+    def save_file(self, file_path: str) -> bool:
+        """
+        Write the JSON data to a file, committing every pending edit at once.
+        
+        Saving to the loaded file with no pending edits does nothing, so the
+        data is not encoded at all. The data is encoded and written chunk by
+        chunk, reading spilled fields back from the blob store one at a time.
+        Once written, the loaded file's change journal is discarded.
+        
+        Args:
+            file_path: The path to write to
+            
+        Returns:
+            True if the file was written, False if there was nothing to save
+        """
+        if (not self.is_dirty() and self.file_path and file_path == self.file_path and
+                os.path.exists(file_path)):
+            return False
+        
+        self.ensure_json()
+        with profiler.span("save"), memory.phase("save"):
+            with open(file_path, 'w', encoding='utf-8') as file:
+                json.dump(self.json_data, file, indent=2, cls=BlobEncoder)
+        self.mark_clean()
+        if file_path == self.file_path:
+            self.file_signature = file_signature(file_path)
+        journal = self.journal
+        if journal is not None:
+            journal.discard()
+        return True
     
     def _group_units(self) -> None:
         """Group models that belong to the same unit."""
@@ -74,21 +379,14 @@ class UnitManager:
             return
             
         unit_map: Dict[str, Unit] = {}
+        self.objects_by_guid = {}
         
         # First pass: identify unique units by nickname (ignoring color codes and counts)
         for i, obj in enumerate(self.json_data["ObjectStates"]):
+            guid = object_key(obj, i, self.objects_by_guid)
+            self.objects_by_guid[guid] = obj
             nickname = obj.get("Nickname", f"Unit {i+1}")
-            
-            # Extract the base unit name (remove color codes and counts)
-            clean_nickname = re.sub(r'\[[^\]]*\]', '', nickname)  # Remove color codes
-            base_name = re.sub(r'^\d+/\d+\s+', '', clean_nickname).strip()  # Remove counts like "1/1"
-            
-            # Check if this is a variant (like "- Exarch" or "- Fusion Pistol")
-            variant = ""
-            if " - " in base_name:
-                parts = base_name.split(" - ", 1)
-                base_name = parts[0].strip()
-                variant = parts[1].strip()
+            base_name, profile_name = split_nickname(nickname)
             
             # Create or update unit entry
             if base_name not in unit_map:
@@ -97,7 +395,6 @@ class UnitManager:
             # Check if this profile matches an existing one
             unit = unit_map[base_name]
             description = obj.get("Description", "")
-            profile_name = variant if variant else "Standard"
             
             # Try to find a matching profile
             matching_profile = None
@@ -111,44 +408,365 @@ class UnitManager:
                 # Update existing profile
                 matching_profile.count += 1
                 matching_profile.identical_indices.append(i)
+                matching_profile.identical_guids.append(guid)
             else:
                 # Add new profile
                 profile = UnitProfile(
                     index=i,
                     name=profile_name,
                     nickname=nickname,
-                    description=description
+                    description=description,
+                    guid=guid
                 )
                 unit.add_profile(profile)
         
         # Convert map to list and sort alphabetically
         self.units = sorted(list(unit_map.values()), key=lambda x: x.name.lower())
+        self._index_profiles()
+    
+    def suggest_merges(self, threshold: float = 0.9) -> List[fuzzy_names.MergeSuggestion]:
+        """
+        Find units whose names look like spellings of one name, e.g.
+        "Intercessor Squad" and "Intercessors Squad".
+        
+        Args:
+            threshold: The minimum similarity of two names, between 0 and 1
+            
+        Returns:
+            The suggested merges; the unit with the most models is the target
+        """
+        weights = {
+            unit.name: sum(profile.count for profile in unit.profiles) for unit in self.units
+        }
+        return fuzzy_names.suggest_merges(weights, threshold)
+    
+    def merge_units(self, target_name: str, source_names: Iterable[str]) -> int:
+        """
+        Merge units into another unit.
+        
+        Profiles with the same name and description are combined. Only the
+        grouping changes; the nicknames in the save are left as they are, so
+        the units are separate again when the file is next loaded.
+        
+        Args:
+            target_name: The name of the unit to keep
+            source_names: The names of the units to merge into it
+            
+        Returns:
+            The number of units merged
+        """
+        units_by_name = {unit.name: unit for unit in self.units}
+        target = units_by_name.get(target_name)
+        if target is None:
+            return 0
+        
+        merged = set()
+        for name in source_names:
+            source = units_by_name.get(name)
+            if source is None or source is target:
+                continue
+            for profile in source.profiles:
+                matching_profile = None
+                for target_profile in target.profiles:
+                    if (target_profile.name == profile.name and
+                            target_profile.description == profile.description):
+                        matching_profile = target_profile
+                        break
+                
+                if matching_profile:
+                    matching_profile.count += profile.count
+                    matching_profile.identical_indices.extend(profile.identical_indices)
+                    matching_profile.identical_guids.extend(profile.identical_guids)
+                else:
+                    target.add_profile(profile)
+            merged.add(name)
+        
+        if not merged:
+            return 0
+        
+        self.units = [unit for unit in self.units if unit.name not in merged]
+        self._index_profiles()
+        # Unit and profile indices moved; find the edited profiles again by GUID
+        self.dirty_profiles = {
+            self.profiles_by_guid[guid] for guid in self.dirty_guids if guid in self.profiles_by_guid
+        }
+        return len(merged)
     
-    def save_profile_changes(self, unit_index: int, profile_index: int, new_description: str) -> None:
+    def save_profile_changes(self, unit_index: int, profile_index: int, new_description: str) -> bool:
         """
         Save changes to a profile's description.
         
+        The change is appended to the change journal, then kept in memory
+        and marked dirty until save_file.
+        
         Args:
             unit_index: The index of the unit in the units list
             profile_index: The index of the profile in the unit's profiles list
             new_description: The new description text
+            
+        Returns:
+            True if the description changed, False if it was already the same
         """
-        if not self.json_data or not self.units:
-            return
+        return bool(self.save_descriptions({(unit_index, profile_index): new_description}))
+    
+    def save_descriptions(self, changes: Dict[Tuple[int, int], str],
+                          journal: bool = True) -> List[Tuple[int, int]]:
+        """
+        Save new descriptions for several profiles in one pass.
         
-        if unit_index < 0 or unit_index >= len(self.units):
-            return
+        Every identical object of every changed profile is updated, and the
+        changes are kept in memory and marked dirty until save_file. The
+        changes are first appended to the change journal as one patch.
+        
+        Args:
+            changes: New descriptions keyed by (unit index, profile index)
+            journal: Whether to journal the changes; False when they are
+                replayed from the journal
             
-        unit = self.units[unit_index]
-        if profile_index < 0 or profile_index >= len(unit.profiles):
-            return
+        Returns:
+            The (unit index, profile index) of the profiles that changed;
+            unknown profiles and unchanged descriptions are skipped
+            
+        Raises:
+            OSError: If the change journal can't be written; nothing is changed
+            FileChangedError: If some of the edited models are no longer in
+                the file; nothing is changed
+        """
+        changed: List[Tuple[int, int]] = []
+        for (unit_index, profile_index), new_description in changes.items():
+            if unit_index < 0 or unit_index >= len(self.units):
+                continue
+            unit = self.units[unit_index]
+            if profile_index < 0 or profile_index >= len(unit.profiles):
+                continue
+            if unit.profiles[profile_index].description != new_description:
+                changed.append((unit_index, profile_index))
+        
+        if not changed:
+            return changed
+        
+        self.ensure_json()
+        if not self.json_data:
+            return []
+        
+        # Find every object before anything is journaled or changed
+        objects: Dict[str, Dict[str, Any]] = {}
+        missing = 0
+        for unit_index, profile_index in changed:
+            for guid in self.units[unit_index].profiles[profile_index].identical_guids:
+                obj = self.objects_by_guid.get(guid)
+                if obj is None:
+                    missing += 1
+                else:
+                    objects[guid] = obj
+        if missing:
+            raise FileChangedError(
+                f"{missing} of the edited models {'is' if missing == 1 else 'are'} no longer in "
+                f"{os.path.basename(self.file_path or '')}; "
+                "it was changed on disk since it was opened. Open it again to edit it."
+            )
+        
+        change_journal = self.journal if journal else None
+        if change_journal is not None:
+            patch = []
+            for unit_index, profile_index in changed:
+                profile = self.units[unit_index].profiles[profile_index]
+                new_description = changes[(unit_index, profile_index)]
+                for index, guid in zip(profile.identical_indices, profile.identical_guids):
+                    patch.extend(description_operations(index, objects[guid], new_description))
+            change_journal.append(patch)
+        
+        for unit_index, profile_index in changed:
+            # Update the profile's description and all identical profiles
+            profile = self.units[unit_index].profiles[profile_index]
+            new_description = changes[(unit_index, profile_index)]
+            profile.description = new_description
+            
+            # Update all identical profiles in the JSON data, by GUID so the
+            # write-back does not depend on object positions
+            for guid in profile.identical_guids:
+                objects[guid]["Description"] = new_description
+            
+            self.dirty_profiles.add((unit_index, profile_index))
+            self.dirty_guids.update(profile.identical_guids)
+        return changed
+    
+    def save_object_descriptions(self, descriptions: Dict[str, str],
+                                 journal: bool = True) -> List[Tuple[int, int]]:
+        """
+        Save new descriptions for individual objects.
+        
+        Objects are no longer identical once only some of a profile's objects
+        change, or they change to different descriptions, so those objects
+        are split off into new profiles of the same unit. A change covering
+        every object of a profile is saved with save_descriptions.
+        
+        Args:
+            descriptions: New descriptions keyed by object key, see object_key
+            journal: Whether to journal the changes; False when they are
+                replayed from the journal
+            
+        Returns:
+            The (unit index, profile index) of the profiles that changed or
+            were split off; unknown objects and unchanged descriptions are skipped
+            
+        Raises:
+            OSError: If the change journal can't be written; nothing is changed
+            FileChangedError: If some of the edited models are no longer in
+                the file; nothing is changed
+        """
+        # Group the changed objects of each profile by their new description
+        groups: Dict[Tuple[int, int], Dict[str, List[str]]] = {}
+        for key, new_description in descriptions.items():
+            location = self.profiles_by_guid.get(key)
+            if location is None:
+                continue
+            unit_index, profile_index = location
+            if self.units[unit_index].profiles[profile_index].description == new_description:
+                continue
+            groups.setdefault(location, {}).setdefault(new_description, []).append(key)
+        
+        if not groups:
+            return []
+        
+        self.ensure_json()
+        if not self.json_data:
+            return []
+        
+        # Find every object before anything is journaled or changed
+        objects: Dict[str, Dict[str, Any]] = {}
+        missing = 0
+        for by_description in groups.values():
+            for keys in by_description.values():
+                for key in keys:
+                    obj = self.objects_by_guid.get(key)
+                    if obj is None:
+                        missing += 1
+                    else:
+                        objects[key] = obj
+        if missing:
+            raise FileChangedError(
+                f"{missing} of the edited models {'is' if missing == 1 else 'are'} no longer in "
+                f"{os.path.basename(self.file_path or '')}; "
+                "it was changed on disk since it was opened. Open it again to edit it."
+            )
+        
+        # A profile keeps its largest group when every object changes; the
+        # other groups, and all of them otherwise, are split off
+        changes: Dict[Tuple[int, int], str] = {}
+        splits: List[Tuple[Tuple[int, int], str, List[str]]] = []
+        for location, by_description in groups.items():
+            profile = self.units[location[0]].profiles[location[1]]
+            kept = None
+            if sum(len(keys) for keys in by_description.values()) == len(profile.identical_guids):
+                kept = max(by_description, key=lambda description: len(by_description[description]))
+                changes[location] = kept
+            for new_description, keys in by_description.items():
+                if new_description != kept:
+                    splits.append((location, new_description, keys))
+        
+        change_journal = self.journal if journal else None
+        if change_journal is not None:
+            patch = []
+            for location, new_description in changes.items():
+                profile = self.units[location[0]].profiles[location[1]]
+                for index, guid in zip(profile.identical_indices, profile.identical_guids):
+                    patch.extend(description_operations(index, objects[guid], new_description))
+            for location, new_description, keys in splits:
+                profile = self.units[location[0]].profiles[location[1]]
+                indices = dict(zip(profile.identical_guids, profile.identical_indices))
+                for key in keys:
+                    patch.extend(description_operations(indices[key], objects[key], new_description))
+            change_journal.append(patch)
+        
+        changed: List[Tuple[int, int]] = []
+        for (unit_index, profile_index), new_description, keys in splits:
+            unit = self.units[unit_index]
+            profile = unit.profiles[profile_index]
+            moved = set(keys)
+            kept_pairs = [
+                (index, guid) for index, guid in zip(profile.identical_indices, profile.identical_guids)
+                if guid not in moved
+            ]
+            moved_pairs = [
+                (index, guid) for index, guid in zip(profile.identical_indices, profile.identical_guids)
+                if guid in moved
+            ]
+            profile.identical_indices = [index for index, _ in kept_pairs]
+            profile.identical_guids = [guid for _, guid in kept_pairs]
+            profile.index = profile.identical_indices[0]
+            profile.guid = profile.identical_guids[0]
+            profile.count = len(kept_pairs)
+            
+            new_profile = UnitProfile(moved_pairs[0][0], profile.name, profile.nickname,
+                                      new_description, moved_pairs[0][1])
+            new_profile.identical_indices = [index for index, _ in moved_pairs]
+            new_profile.identical_guids = [guid for _, guid in moved_pairs]
+            new_profile.count = len(moved_pairs)
+            unit.add_profile(new_profile)
+            location = (unit_index, len(unit.profiles) - 1)
+            
+            for guid in new_profile.identical_guids:
+                objects[guid]["Description"] = new_description
+                self.profiles_by_guid[guid] = location
+            self.dirty_profiles.add(location)
+            self.dirty_guids.update(new_profile.identical_guids)
+            changed.append(location)
+        
+        # The journal already holds these changes
+        return self.save_descriptions(changes, journal=False) + changed
+    
+    def apply_patch(self, operations: List[Dict[str, Any]], journal: bool = True) -> List[Tuple[int, int]]:
+        """
+        Apply the description changes of a JSON Patch, such as a change
+        journal of this save or one exported from another copy of it.
+        
+        Objects are found by position, or by GUID when the patch's GUID test
+        fails there, so the cost is proportional to the patch rather than
+        the save. Each object gets its own description, splitting profiles
+        whose objects no longer match, see save_object_descriptions.
+        
+        Args:
+            operations: The patch operations, see journal.resolve_descriptions
+            journal: Whether to journal the changes; False when replaying
+                this save's own journal
+            
+        Returns:
+            The (unit index, profile index) of the profiles that changed or
+            were split off
             
-        profile = unit.profiles[profile_index]
+        Raises:
+            journal.PatchError: If the patch doesn't apply to this save
+        """
+        self.ensure_json()
+        if not self.json_data:
+            return []
         
-        # Update the profile's description and all identical profiles
-        profile = unit.profiles[profile_index]
-        profile.description = new_description
+        objects = self.json_data.get("ObjectStates", [])
+        descriptions: Dict[str, str] = {}
+        for index, description in resolve_descriptions(objects, operations):
+            # The key of an object is its GUID unless it has none or shares it, see object_key
+            obj = objects[index]
+            guid = obj.get("GUID")
+            key = guid if guid and self.objects_by_guid.get(guid) is obj else f"#{index}"
+            descriptions[key] = description
+        return self.save_object_descriptions(descriptions, journal=journal)
+    
+    def recover_journal(self) -> List[Tuple[int, int]]:
+        """
+        Replay the loaded file's change journal onto it, restoring the edits
+        applied but not saved before the editor last closed.
+        
+        The journal is kept, so the edits stay recoverable until the file is
+        saved.
         
-        # Update all identical profiles in the JSON data
-        for obj_index in profile.identical_indices:
-            self.json_data["ObjectStates"][obj_index]["Description"] = new_description
+        Returns:
+            The (unit index, profile index) of the profiles that changed
+            
+        Raises:
+            journal.PatchError: If the journal is corrupt or doesn't apply
+        """
+        change_journal = self.journal
+        if change_journal is None or not change_journal.exists():
+            return []
+        return self.apply_patch(change_journal.operations(), journal=False)
@@ -0,0 +1,184 @@
+"""
+Workspace model for editing several TTS saves at once.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Optional, Tuple
+
+from .unit import UnitManager
+
+
+def load_roster(file_path: str) -> Tuple[str, list, Tuple[int, float]]:
+    """
+    Read, decode and group a save, returning only its compact roster.
+
+    Runs in a worker process, so the full JSON tree never has to be pickled
+    back to the editor.
+
+    Args:
+        file_path: The path to the save file
+
+    Returns:
+        A (file path, roster, file signature) tuple, see
+        UnitManager.export_roster and unit.file_signature
+    """
+    unit_manager = UnitManager(spill_large_fields=False)
+    unit_manager.load_file(file_path)
+    return file_path, unit_manager.export_roster(), unit_manager.file_signature
+
+
+class WorkspaceFile:
+    """A save file open in the workspace."""
+
+    def __init__(self, file_path: str, unit_manager: UnitManager):
+        """
+        Initialize a workspace file.
+
+        Args:
+            file_path: The path to the save file
+            unit_manager: The unit manager holding the file's units
+        """
+        self.file_path = file_path
+        self.unit_manager = unit_manager
+
+    @property
+    def name(self) -> str:
+        """The file name shown in the unit tree."""
+        return os.path.basename(self.file_path)
+
+    def save(self, file_path: Optional[str] = None) -> bool:
+        """
+        Save this file independently of the rest of the workspace.
+
+        Args:
+            file_path: Optional new path to save to (Save As)
+
+        Returns:
+            True if the file was written, False if it had no pending edits
+        """
+        # Read a lazily loaded file before its path changes
+        self.unit_manager.ensure_json()
+        if file_path:
+            self.file_path = file_path
+        written = self.unit_manager.save_file(self.file_path)
+        self.unit_manager.file_path = self.file_path
+        return written
+
+
+class Workspace:
+    """A set of save files open side by side."""
+
+    def __init__(self):
+        """Initialize an empty workspace."""
+        self.files: List[WorkspaceFile] = []
+
+    def clear(self) -> None:
+        """Close every file in the workspace."""
+        self.files = []
+
+    def add_file(self, file_path: str) -> WorkspaceFile:
+        """
+        Load a single save in this process and add it to the workspace.
+
+        Args:
+            file_path: The path to the save file
+
+        Returns:
+            The added workspace file
+        """
+        unit_manager = UnitManager()
+        unit_manager.load_file(file_path)
+        workspace_file = WorkspaceFile(file_path, unit_manager)
+        self.files.append(workspace_file)
+        return workspace_file
+
+    def open_files(self, file_paths: List[str],
+                   max_workers: Optional[int] = None) -> List[Tuple[str, Exception]]:
+        """
+        Load several saves concurrently and add them to the workspace.
+
+        Each file is read, decoded and grouped in its own worker process, so
+        grouping N saves takes about as long as the slowest one. Only the
+        rosters come back; each file's JSON data is read again in this
+        process the first time it is needed, see UnitManager.ensure_json
+        and EditorPresenter.set_active_file. A single file is loaded in this
+        process instead, keeping its JSON data resident.
+
+        Args:
+            file_paths: The paths to the save files
+            max_workers: Optional cap on the number of worker processes
+
+        Returns:
+            A list of (file path, error) tuples for files that failed to load
+        """
+        errors: List[Tuple[str, Exception]] = []
+        if len(file_paths) == 1:
+            try:
+                self.add_file(file_paths[0])
+            except Exception as e:
+                errors.append((file_paths[0], e))
+            return errors
+
+        workers = min(len(file_paths), max_workers or os.cpu_count() or 1)
+        loaded = {}
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(load_roster, path): path for path in file_paths}
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    _, roster, signature = future.result()
+                except Exception as e:
+                    errors.append((path, e))
+                    continue
+                unit_manager = UnitManager()
+                unit_manager.load_roster(roster, path, signature)
+                loaded[path] = WorkspaceFile(path, unit_manager)
+
+        # Keep the order the files were chosen in
+        self.files.extend(loaded[path] for path in file_paths if path in loaded)
+        return errors
+
+    @property
+    def dirty_count(self) -> int:
+        """The number of profiles edited since they were last saved, across every file."""
+        return sum(workspace_file.unit_manager.dirty_count for workspace_file in self.files)
+
+    def save_all(self) -> List[Tuple[str, Exception]]:
+        """
+        Write every file with pending edits, one write per file.
+
+        Returns:
+            A list of (file path, error) tuples for files that failed to save
+        """
+        errors: List[Tuple[str, Exception]] = []
+        for workspace_file in self.files:
+            if not workspace_file.unit_manager.is_dirty():
+                continue
+            try:
+                workspace_file.save()
+            except Exception as e:
+                errors.append((workspace_file.file_path, e))
+        return errors
+
+    def discard_journals(self) -> None:
+        """Delete the change journals of the files with pending edits, once the user chose not to save them."""
+        for workspace_file in self.files:
+            journal = workspace_file.unit_manager.journal
+            if workspace_file.unit_manager.is_dirty() and journal is not None:
+                journal.discard()
+
+    def index_of(self, file_path: str) -> Optional[int]:
+        """
+        Find an open file by path.
+
+        Args:
+            file_path: The path to look for
+
+        Returns:
+            The index of the file in the workspace, or None if it is not open
+        """
+        target = os.path.abspath(file_path)
+        for i, workspace_file in enumerate(self.files):
+            if os.path.abspath(workspace_file.file_path) == target:
+                return i
+        return None
@@ -0,0 +1,7 @@
+"""
+Presenters for the Warhammer 40k TTS Unit Editor.
+
+Presenters hold the editor's state and logic without depending on a GUI
+toolkit; the widgets in ui/ only display their state and forward user input,
+so editing sessions can be driven headlessly.
+"""
@@ -0,0 +1,599 @@
+"""
+Main editor presenter for the Warhammer 40k TTS Unit Editor.
+"""
+import os
+from typing import List, Optional, Tuple
+
+from ..models.journal import PatchError, read_patch
+from ..models.unit import FileChangedError, UnitManager
+from ..models.workspace import Workspace
+from ..utils.description_linter import DescriptionLinter
+from ..utils.eager_parser import EagerParser
+from ..utils.vocabulary import Vocabulary
+from .structured import StructuredPresenter
+
+
+class EditorView:
+    """
+    What the editor presenter shows; every method does nothing.
+
+    The main window overrides these to update its widgets. A headless driver
+    can use this class as it is.
+    """
+
+    def show_title(self, title: str) -> None:
+        """Show the window title."""
+
+    def show_units(self, labels: List[str]) -> None:
+        """Replace the unit list; one label per row of EditorPresenter.unit_rows."""
+
+    def show_unit_indicators(self, pending_rows: List[int]) -> None:
+        """Grey out the unit rows still being parsed in the background."""
+
+    def select_unit_row(self, row: int) -> None:
+        """Select a single row of the unit list."""
+
+    def show_profiles(self, labels: List[str]) -> None:
+        """Replace the profile list; one label per row of EditorPresenter.profile_rows."""
+
+    def select_profile_row(self, row: int) -> None:
+        """Select a single row of the profile list."""
+
+    def show_profile(self, description: str, fields: tuple) -> None:
+        """Show a profile's description and its parsed fields for editing."""
+
+    def show_text(self, description: str) -> None:
+        """Show an edited description in the text editor and preview."""
+
+    def show_problems(self, unit_manager: UnitManager, results) -> None:
+        """Show the linter results of the active file."""
+
+    def eager_parsing_started(self) -> None:
+        """Call EditorPresenter.poll_eager_parsing periodically until it returns False."""
+
+    def confirm_recovery(self, file_path: str, edit_count: int, save_changed: bool) -> Optional[bool]:
+        """
+        Ask whether to replay a file's journal of unsaved edits (True) or
+        discard it (False); None, the default, leaves it for a later session.
+        """
+        return None
+
+    def show_error(self, message: str) -> None:
+        """Report an error that happened outside a direct user action."""
+
+
+class EditorPresenter:
+    """
+    State and logic of the main editor window.
+
+    Holds the open workspace, the active file, the unit and profile
+    selections and the description being edited, and runs the select, edit,
+    apply and save flow. The view is told what to show; it passes user input
+    back as row indices and description text.
+    """
+
+    def __init__(self, view: Optional[EditorView] = None):
+        """
+        Initialize the presenter.
+
+        Args:
+            view: The view to show state in; a do-nothing EditorView if not given
+        """
+        self.view = view or EditorView()
+        self.workspace = Workspace()
+        self.active_file_index: Optional[int] = None
+        self.unit_manager = UnitManager()
+        self.current_file_path: Optional[str] = None
+        self.unit_rows: List[Tuple[int, Optional[int]]] = []  # (file index, unit index or None for a file header) per unit row
+        self.profile_rows: List[Tuple[int, int]] = []  # (unit index, profile index) per profile row
+        self.selected_unit_indices: List[int] = []  # Units of the active file that are selected
+        self.current_unit_index: Optional[int] = None
+        self.current_profile_index: Optional[int] = None
+        self.description = ""  # The description being edited
+        self.linter = DescriptionLinter()
+        self.vocabulary = Vocabulary()
+        self.eager_parser = EagerParser()
+        self.eager_parse = False  # Whether every profile is parsed in the background
+        self.structured = StructuredPresenter(self.vocabulary)
+
+    @property
+    def has_profile(self) -> bool:
+        """Whether a profile is selected for editing."""
+        return self.current_unit_index is not None and self.current_profile_index is not None
+
+    def title(self) -> str:
+        """
+        Get the window title for the active file and pending edits.
+
+        Returns:
+            The title
+        """
+        title = "Warhammer 40k TTS Unit Editor"
+        if self.current_file_path:
+            title += f" - {os.path.basename(self.current_file_path)}"
+        if len(self.workspace.files) > 1:
+            title += f" ({len(self.workspace.files)} files open)"
+        dirty_count = self.workspace.dirty_count
+        if dirty_count:
+            title += f" - {dirty_count} unsaved change{'s' if dirty_count != 1 else ''}"
+        return title
+
+    def update_title(self) -> None:
+        """Show the current title."""
+        self.view.show_title(self.title())
+
+    def load_file(self, file_path: str) -> None:
+        """
+        Replace the workspace with a single TTS JSON file.
+
+        Args:
+            file_path: The path to the file to load
+        """
+        workspace = Workspace()
+        workspace.add_file(file_path)
+        self.show_workspace(workspace)
+
+    def load_files(self, file_paths: List[str]) -> List[Tuple[str, Exception]]:
+        """
+        Replace the workspace with several TTS JSON files, loaded concurrently.
+
+        Args:
+            file_paths: The paths to the files to load
+
+        Returns:
+            A list of (file path, error) tuples for files that failed to load
+        """
+        workspace = Workspace()
+        errors = workspace.open_files(file_paths)
+        if workspace.files:
+            self.show_workspace(workspace)
+        return errors
+
+    def show_workspace(self, workspace: Workspace) -> None:
+        """
+        Show a newly loaded workspace, activating its first file.
+
+        Args:
+            workspace: The workspace to show
+        """
+        self.workspace = workspace
+        self.recover_journals()
+        self.set_active_file(0)
+        self.load_units()
+
+    def recover_journals(self) -> None:
+        """
+        Offer to replay the change journal of each file in the workspace.
+
+        A journal is left by edits that were applied but never saved, e.g.
+        when the editor crashed. Replayed edits are pending, as if just made;
+        declined journals are discarded and unanswered ones left on disk.
+        """
+        for workspace_file in self.workspace.files:
+            unit_manager = workspace_file.unit_manager
+            journal = unit_manager.journal
+            if journal is None or not journal.exists():
+                continue
+            try:
+                header, patches = journal.read()
+                if not patches:
+                    journal.discard()
+                    continue
+                replay = self.view.confirm_recovery(
+                    workspace_file.file_path, len(patches), journal.save_changed(header)
+                )
+                if replay:
+                    unit_manager.recover_journal()
+                elif replay is not None:
+                    journal.discard()
+            except (OSError, PatchError, FileChangedError) as e:
+                self.view.show_error(
+                    f"Failed to recover the unsaved edits of {workspace_file.name} "
+                    f"from {journal.path}: {str(e)}"
+                )
+
+    def set_active_file(self, file_index: int) -> None:
+        """
+        Make a workspace file the target of editing and saving.
+
+        A file opened through the worker pool has only its roster loaded; its
+        JSON data is read now, when the file is picked, rather than on its
+        first edit.
+
+        Args:
+            file_index: The index of the file in the workspace
+        """
+        workspace_file = self.workspace.files[file_index]
+        self.active_file_index = file_index
+        self.unit_manager = workspace_file.unit_manager
+        self.current_file_path = workspace_file.file_path
+        try:
+            self.unit_manager.ensure_json()
+        except (OSError, ValueError) as e:
+            self.view.show_error(f"Failed to read {workspace_file.name}: {str(e)}")
+        self.update_title()
+        self.lint_active_file()
+        self.vocabulary.refresh(self.unit_manager)
+        self.start_eager_parsing()
+
+    def load_units(self) -> None:
+        """Show the units, grouped by file when several are open."""
+        self.unit_rows = []
+        self.profile_rows = []
+        self.selected_unit_indices = []
+        self.current_unit_index = None
+        self.current_profile_index = None
+
+        labels = []
+        grouped = len(self.workspace.files) > 1
+        for file_index, workspace_file in enumerate(self.workspace.files):
+            if grouped:
+                labels.append(workspace_file.name)
+                self.unit_rows.append((file_index, None))
+
+            for unit_index, unit in enumerate(workspace_file.unit_manager.units):
+                labels.append(f"    {unit.name}" if grouped else unit.name)
+                self.unit_rows.append((file_index, unit_index))
+
+        self.view.show_units(labels)
+        self.view.show_profiles([])
+        self.update_unit_indicators()
+
+    def select_units(self, rows: List[int]) -> None:
+        """
+        Select unit rows; several units of the same file can be selected.
+
+        The first profile of the selected units is selected for editing.
+
+        Args:
+            rows: The selected rows of the unit list
+        """
+        selected = [self.unit_rows[row] for row in rows if row < len(self.unit_rows)]
+        units = [(file_index, unit_index) for file_index, unit_index in selected if unit_index is not None]
+        if not units:
+            # File header row
+            self.current_unit_index = None
+            self.selected_unit_indices = []
+            self.profile_rows = []
+            self.view.show_profiles([])
+            return
+
+        file_index = units[0][0]
+        if file_index != self.active_file_index:
+            self.set_active_file(file_index)
+
+        # Units of other files can't be edited together with the active file's
+        self.selected_unit_indices = [unit_index for f, unit_index in units if f == file_index]
+        self.current_unit_index = self.selected_unit_indices[0]
+        self.load_profiles(self.selected_unit_indices)
+
+        # Auto-select first profile if available
+        if self.profile_rows:
+            self.view.select_profile_row(0)
+            self.select_profiles([0])
+
+    def load_profiles(self, unit_indices: List[int]) -> None:
+        """
+        Show the profiles of the selected units.
+
+        Args:
+            unit_indices: The indices of the units in the unit manager
+        """
+        self.profile_rows = []
+        labels = []
+
+        several = len(unit_indices) > 1
+        for unit_index in unit_indices:
+            if unit_index < 0 or unit_index >= len(self.unit_manager.units):
+                continue
+
+            unit = self.unit_manager.units[unit_index]
+            for profile_index, profile in enumerate(unit.profiles):
+                display_name = profile.name
+                if profile.count > 1:
+                    display_name = f"{profile.name} (×{profile.count})"
+                if several:
+                    display_name = f"{unit.name} / {display_name}"
+                labels.append(display_name)
+                self.profile_rows.append((unit_index, profile_index))
+
+        self.view.show_profiles(labels)
+
+    def select_profiles(self, rows: List[int]) -> None:
+        """
+        Select profile rows; the first selected profile is shown for editing.
+
+        Args:
+            rows: The selected rows of the profile list
+        """
+        rows = [row for row in rows if row < len(self.profile_rows)]
+        if not rows:
+            return
+
+        unit_index, profile_index = self.profile_rows[rows[0]]
+        self.current_unit_index = unit_index
+        self.current_profile_index = profile_index
+        self.show_profile(self.unit_manager.units[unit_index].profiles[profile_index])
+
+    def select_profile(self, unit_index: int, profile_index: int) -> None:
+        """
+        Select a single profile of the active file.
+
+        Args:
+            unit_index: The index of the unit in the active file
+            profile_index: The index of the profile in the unit
+        """
+        try:
+            row = self.unit_rows.index((self.active_file_index, unit_index))
+        except ValueError:
+            return
+
+        self.view.select_unit_row(row)
+        self.current_unit_index = unit_index
+        self.selected_unit_indices = [unit_index]
+        self.load_profiles([unit_index])
+
+        if profile_index < len(self.profile_rows):
+            self.view.select_profile_row(profile_index)
+            self.select_profiles([profile_index])
+
+    def open_profile(self, file_path: str, guid: str) -> bool:
+        """
+        Select the profile of a model, loading its save unless it is already open.
+
+        Args:
+            file_path: The path to the save
+            guid: The GUID of the model, see UnitManager.find_profile
+
+        Returns:
+            False if the save has no model with that GUID, e.g. because it
+            changed since the GUID was found
+
+        Raises:
+            Exception: If the save has to be loaded and can't be
+        """
+        file_index = self.workspace.index_of(file_path)
+        if file_index is None:
+            self.load_file(file_path)
+        elif file_index != self.active_file_index:
+            self.set_active_file(file_index)
+
+        location = self.unit_manager.find_profile(guid)
+        if location is None:
+            return False
+        self.select_profile(*location)
+        return True
+
+    def selected_targets(self, profile_rows: List[int]) -> List[Tuple[int, int]]:
+        """
+        Get the profiles a batch edit applies to.
+
+        Args:
+            profile_rows: The selected rows of the profile list
+
+        Returns:
+            The (unit index, profile index) of the selected profiles, or of
+            every profile of the selected units if no profile is selected
+        """
+        rows = [row for row in profile_rows if row < len(self.profile_rows)]
+        if rows:
+            return [self.profile_rows[row] for row in rows]
+        return [
+            (unit_index, profile_index)
+            for unit_index in self.selected_unit_indices
+            for profile_index in range(len(self.unit_manager.units[unit_index].profiles))
+        ]
+
+    def show_profile(self, profile) -> None:
+        """
+        Load a profile's description into the editors.
+
+        Args:
+            profile: The profile to show
+        """
+        # Reuse the background parse if there is one
+        parsed = self.eager_parser.get(profile.description) if self.eager_parse else None
+        self.description = profile.description
+        self.view.show_profile(profile.description, self.structured.load(profile.description, parsed))
+
+    def reload_current_profile(self) -> None:
+        """Reload the selected profile after its description changed elsewhere."""
+        if not self.has_profile:
+            return
+
+        unit = self.unit_manager.units[self.current_unit_index]
+        self.show_profile(unit.profiles[self.current_profile_index])
+
+    def edit_description(self, description: str) -> None:
+        """
+        Replace the description being edited, e.g. with one generated from fields.
+
+        Args:
+            description: The edited description
+        """
+        self.description = description
+        self.view.show_text(description)
+
+    def generate_description(self, fields: tuple) -> str:
+        """
+        Generate the description being edited from structured fields.
+
+        Args:
+            fields: The (stats, ranged weapons, melee weapons, abilities) to generate from
+
+        Returns:
+            The generated description
+        """
+        description = self.structured.generate(fields)
+        self.edit_description(description)
+        return description
+
+    def apply_changes(self, description: Optional[str] = None) -> bool:
+        """
+        Apply the edited description to the selected profile, pending the next save.
+
+        Args:
+            description: The edited description; the last one given to
+                edit_description if not given
+
+        Returns:
+            True if the description changed, False if it was unchanged or no
+            profile is selected
+        """
+        if not self.has_profile:
+            return False
+        if description is not None:
+            self.description = description
+
+        # An unchanged description is not applied, linted or written
+        if not self.unit_manager.save_profile_changes(
+            self.current_unit_index,
+            self.current_profile_index,
+            self.description
+        ):
+            return False
+
+        # Only the saved profile needs linting again
+        self.linter.relint(self.unit_manager, self.current_unit_index, self.current_profile_index)
+        self.view.show_problems(self.unit_manager, self.linter.results)
+        self.vocabulary.update(self.unit_manager, self.current_unit_index, self.current_profile_index)
+        self.update_title()
+        return True
+
+    def save_pending(self) -> bool:
+        """
+        Write the active file's pending edits in one write.
+
+        Returns:
+            True if the file was written, False if there was nothing to save
+        """
+        if self.active_file_index is None or not self.unit_manager.is_dirty():
+            return False
+        return self.save_to_file(self.current_file_path)
+
+    def save_to_file(self, file_path: str) -> bool:
+        """
+        Save the active file to a path; errors are raised to the caller.
+
+        Args:
+            file_path: The path to write to
+
+        Returns:
+            True if the file was written, False if it had no pending edits
+        """
+        written = self.workspace.files[self.active_file_index].save(file_path)
+        self.current_file_path = file_path
+        self.update_title()
+        return written
+
+    def save_all(self) -> List[Tuple[str, Exception]]:
+        """
+        Write every open file that has pending edits.
+
+        Returns:
+            A list of (file path, error) tuples for files that failed to save
+        """
+        errors = self.workspace.save_all()
+        self.update_title()
+        return errors
+
+    def export_journal(self, file_path: str) -> int:
+        """
+        Write the active file's unsaved edits as a JSON Patch document, to
+        apply to other copies of the save.
+
+        Args:
+            file_path: The path to write to
+
+        Returns:
+            The number of patch operations written; 0 if there is no journal
+        """
+        journal = self.unit_manager.journal
+        if journal is None or not journal.exists():
+            return 0
+        return journal.export(file_path)
+
+    def apply_patch_file(self, file_path: str) -> int:
+        """
+        Apply an exported JSON Patch or a change journal to the active file.
+
+        Args:
+            file_path: The path to the patch or journal
+
+        Returns:
+            The number of profiles changed or split off
+
+        Raises:
+            PatchError: If the patch doesn't apply to the active file
+            OSError: If the patch can't be read or the change journal written
+        """
+        profile_count = sum(len(unit.profiles) for unit in self.unit_manager.units)
+        changed = self.unit_manager.apply_patch(read_patch(file_path))
+        if sum(len(unit.profiles) for unit in self.unit_manager.units) != profile_count:
+            # Objects the patch no longer keeps identical were split into new profiles
+            self.on_units_merged()
+        elif changed:
+            self.on_descriptions_changed()
+        return len(changed)
+
+    def on_units_merged(self) -> None:
+        """Show the regrouped units; unit and profile indices have changed."""
+        self.load_units()
+        self.lint_active_file()
+        self.vocabulary.refresh(self.unit_manager)
+        self.start_eager_parsing()
+        self.update_title()
+
+    def on_descriptions_changed(self) -> None:
+        """Refresh the editors and problems after several descriptions changed."""
+        self.reload_current_profile()
+        self.lint_active_file()
+        self.vocabulary.refresh(self.unit_manager)
+        self.update_title()
+
+    def lint_active_file(self) -> None:
+        """Lint the active file's profiles; cached descriptions are not linted again."""
+        self.view.show_problems(self.unit_manager, self.linter.lint_all(self.unit_manager))
+
+    def set_eager_parsing(self, enabled: bool) -> None:
+        """
+        Start or stop parsing every profile in the background.
+
+        Args:
+            enabled: Whether to parse in the background
+        """
+        self.eager_parse = enabled
+        if enabled:
+            self.start_eager_parsing()
+        else:
+            self.eager_parser.cancel()
+            self.update_unit_indicators()
+
+    def start_eager_parsing(self) -> None:
+        """Parse the active file's profiles in worker processes, if enabled."""
+        if not self.eager_parse:
+            return
+
+        self.eager_parser.start(self.unit_manager)
+        self.update_unit_indicators()
+        if self.eager_parser.running:
+            self.view.eager_parsing_started()
+
+    def poll_eager_parsing(self) -> bool:
+        """
+        Mark units whose profiles finished parsing as ready.
+
+        Returns:
+            True while background parsing is still running
+        """
+        if self.eager_parser.poll():
+            self.update_unit_indicators()
+        return self.eager_parser.running
+
+    def update_unit_indicators(self) -> None:
+        """Grey out units of the active file that are still being parsed."""
+        self.view.show_unit_indicators([
+            row for row, (file_index, unit_index) in enumerate(self.unit_rows)
+            if unit_index is not None and file_index == self.active_file_index and
+            not self.eager_parser.is_ready(unit_index)
+        ])
@@ -0,0 +1,118 @@
+"""
+Structured editor presenter for the Warhammer 40k TTS Unit Editor.
+"""
+from typing import List, Optional, Tuple
+
+from ..utils import description_parser, vocabulary
+from ..utils.profiling import profiler
+
+
+class StructuredPresenter:
+    """
+    State and logic of the structured editor.
+
+    Fields are (stats, ranged weapons, melee weapons, abilities) tuples, as
+    returned by description_parser.parse_profile.
+    """
+
+    def __init__(self, vocabulary_index=None):
+        """
+        Initialize the presenter.
+
+        Args:
+            vocabulary_index: Optional Vocabulary to suggest weapon names,
+                keywords and abilities from
+        """
+        self.vocabulary = vocabulary_index
+        self.loaded_description: Optional[str] = None  # The description the fields were filled from
+        self.loaded_fields: Optional[tuple] = None  # The fields parsed from loaded_description
+
+    def load(self, description: str, parsed: Optional[tuple] = None) -> tuple:
+        """
+        Parse a description into the fields to edit.
+
+        Args:
+            description: The description text to parse
+            parsed: Optional fields already parsed from the description, see
+                description_parser.parse_profile; the description is not
+                parsed again when given
+
+        Returns:
+            The fields
+        """
+        if parsed is None:
+            with profiler.span("parse_description"):
+                parsed = description_parser.parse_profile(description)
+        self.loaded_description = description
+        self.loaded_fields = parsed
+        return parsed
+
+    def clear(self) -> None:
+        """Forget the loaded description."""
+        self.loaded_description = None
+        self.loaded_fields = None
+
+    def is_modified(self, fields: tuple) -> bool:
+        """
+        Check whether fields differ from the description they were loaded from.
+
+        Args:
+            fields: The edited fields
+
+        Returns:
+            True if any field was changed, or nothing was loaded
+        """
+        return self.loaded_fields is None or tuple(fields) != tuple(self.loaded_fields)
+
+    def generate(self, fields: tuple) -> str:
+        """
+        Generate a description from edited fields.
+
+        If no field was changed the loaded description is kept as it is,
+        without regenerating it.
+
+        Args:
+            fields: The edited fields
+
+        Returns:
+            The generated description
+        """
+        if not self.is_modified(fields):
+            return self.loaded_description
+        return description_parser.generate_description(*fields)
+
+    def complete_ability(self, line: str) -> Tuple[str, List[str]]:
+        """
+        Get suggestions for an ability line.
+
+        Args:
+            line: The ability line up to the cursor
+
+        Returns:
+            The (prefix, suggestions) for the line
+        """
+        prefix = line.lstrip()
+        if self.vocabulary is None:
+            return prefix, []
+        return prefix, self.vocabulary.complete(vocabulary.ABILITIES, prefix)
+
+    def complete_weapon_field(self, field: str, text: str) -> Tuple[str, List[str]]:
+        """
+        Get suggestions for a weapon table cell.
+
+        Args:
+            field: The field of the cell being edited
+            text: The cell text up to the cursor
+
+        Returns:
+            The (prefix, suggestions) for the cell; weapon names for the name
+            and the keyword being typed for the abilities
+        """
+        if self.vocabulary is None:
+            return "", []
+        if field == "name":
+            return text, self.vocabulary.complete(vocabulary.WEAPON_NAMES, text)
+        if field == "abilities":
+            prefix = text.split(",")[-1].lstrip()
+            return prefix, self.vocabulary.complete(vocabulary.KEYWORDS, prefix)
+        return "", []
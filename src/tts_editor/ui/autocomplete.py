@@ -0,0 +1,155 @@
+"""
+Autocomplete popup for the Warhammer 40k TTS Unit Editor.
+"""
+import tkinter as tk
+from typing import Callable, List, Tuple
+
+# Returns the (prefix, suggestions) for the text of the cursor's line up to the cursor
+CompleteFunction = Callable[[str], Tuple[str, List[str]]]
+
+
+class Autocomplete:
+    """
+    Suggestion popup attached to a Text or Entry widget.
+
+    Suggestions are looked up on every key release; Up/Down move through
+    them, Tab or Return accepts one and Escape closes the popup. The widget's
+    own Tab/Return/Escape bindings only run while the popup is closed, so
+    they must be added after the popup with add="+".
+    """
+
+    # Keys that navigate rather than edit; releasing them does not look up suggestions
+    NAVIGATION_KEYS = {"Up", "Down", "Left", "Right", "Return", "Tab", "Escape",
+                       "Home", "End", "Prior", "Next"}
+
+    # Milliseconds between the widget losing focus and the popup closing
+    HIDE_DELAY = 150
+
+    def __init__(self, widget, complete: CompleteFunction, max_rows: int = 8):
+        """
+        Attach an autocomplete popup to a widget.
+
+        Args:
+            widget: The Text or Entry widget to complete in
+            complete: Function giving the (prefix, suggestions) for the line
+                before the cursor; suggestions replace the prefix when accepted
+            max_rows: The maximum number of suggestions shown at once
+        """
+        self.widget = widget
+        self.complete = complete
+        self.max_rows = max_rows
+        self.prefix = ""
+        self.popup = None
+        self.listbox = None
+        self.visible = False  # Whether the popup is showing suggestions
+
+        widget.bind("<KeyRelease>", self._on_key_release, add="+")
+        widget.bind("<Down>", lambda event: self._move(1), add="+")
+        widget.bind("<Up>", lambda event: self._move(-1), add="+")
+        widget.bind("<Return>", self._on_accept, add="+")
+        widget.bind("<Tab>", self._on_accept, add="+")
+        widget.bind("<Escape>", self._on_escape, add="+")
+        # Deferred, so a click on the popup is handled before it closes
+        widget.bind("<FocusOut>", lambda event: widget.after(self.HIDE_DELAY, self.hide), add="+")
+
+    def _line_before_cursor(self) -> str:
+        """Get the text of the cursor's line up to the cursor."""
+        if isinstance(self.widget, tk.Text):
+            return self.widget.get("insert linestart", "insert")
+        return self.widget.get()[:self.widget.index(tk.INSERT)]
+
+    def _on_key_release(self, event):
+        """Look up suggestions for the text before the cursor."""
+        if event.keysym in self.NAVIGATION_KEYS or (not event.char and event.keysym != "BackSpace"):
+            return
+        self.prefix, suggestions = self.complete(self._line_before_cursor())
+        if suggestions:
+            self.show(suggestions)
+        else:
+            self.hide()
+
+    def show(self, suggestions: List[str]):
+        """
+        Show suggestions below the cursor.
+
+        Args:
+            suggestions: The suggestions
+        """
+        if self.popup is None:
+            self.popup = tk.Toplevel(self.widget)
+            self.popup.overrideredirect(True)
+            self.listbox = tk.Listbox(self.popup, exportselection=False, takefocus=0)
+            self.listbox.pack(fill=tk.BOTH, expand=True)
+            self.listbox.bind("<Button-1>", self._on_click)
+
+        self.listbox.delete(0, tk.END)
+        self.listbox.insert(tk.END, *suggestions)
+        self.listbox.config(height=min(len(suggestions), self.max_rows),
+                            width=max(len(suggestion) for suggestion in suggestions) + 2)
+        self.listbox.selection_set(0)
+
+        bbox = self.widget.bbox(tk.INSERT)
+        x, y, height = (bbox[0], bbox[1], bbox[3]) if bbox else (0, 0, 0)
+        x += self.widget.winfo_rootx()
+        y += self.widget.winfo_rooty() + height
+        self.popup.geometry(f"+{x}+{y}")
+        self.popup.deiconify()
+        self.popup.lift()
+        self.visible = True
+
+    def hide(self):
+        """Hide the popup."""
+        if self.popup is not None:
+            self.popup.withdraw()
+        self.visible = False
+
+    def _move(self, step: int):
+        """Move the selected suggestion."""
+        if not self.visible:
+            return None
+        selection = self.listbox.curselection()
+        index = (selection[0] if selection else 0) + step
+        index = min(max(index, 0), self.listbox.size() - 1)
+        self.listbox.selection_clear(0, tk.END)
+        self.listbox.selection_set(index)
+        self.listbox.see(index)
+        return "break"
+
+    def _on_accept(self, event):
+        """Accept the selected suggestion, if the popup is showing."""
+        if not self.visible:
+            return None
+        selection = self.listbox.curselection()
+        if selection:
+            self.accept(self.listbox.get(selection[0]))
+        self.hide()
+        return "break"
+
+    def _on_escape(self, event):
+        """Close the popup, if it is showing."""
+        if not self.visible:
+            return None
+        self.hide()
+        return "break"
+
+    def _on_click(self, event):
+        """Accept the clicked suggestion without taking focus from the widget."""
+        self.accept(self.listbox.get(self.listbox.nearest(event.y)))
+        self.hide()
+        return "break"
+
+    def accept(self, suggestion: str):
+        """
+        Replace the prefix before the cursor with a suggestion.
+
+        Args:
+            suggestion: The suggestion
+        """
+        if isinstance(self.widget, tk.Text):
+            self.widget.delete(f"insert-{len(self.prefix)}c", tk.INSERT)
+            self.widget.insert(tk.INSERT, suggestion)
+        else:
+            position = self.widget.index(tk.INSERT)
+            self.widget.delete(position - len(self.prefix), position)
+            self.widget.insert(position - len(self.prefix), suggestion)
+        self.prefix = ""
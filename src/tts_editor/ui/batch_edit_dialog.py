@@ -0,0 +1,187 @@
+"""
+Batch edit dialog for the Warhammer 40k TTS Unit Editor.
+"""
+import tkinter as tk
+from tkinter import ttk, messagebox
+from typing import Callable, List, Optional, Tuple
+
+from ..models.batch_edit import (
+    AddAbility, AddWeaponAbility, AdjustStat, AdjustWeaponStat, RemoveAbility, SetStat,
+    SetWeaponStat, apply_batch
+)
+from ..models.profile_fields import StatLine
+from ..models.unit import FileChangedError
+
+
+class BatchEditDialog(tk.Toplevel):
+    """Dialog for applying one structured change to several selected profiles."""
+
+    CHANGE_TYPES = [
+        "Add weapon ability",
+        "Set weapon stat",
+        "Adjust weapon stat",
+        "Set stat",
+        "Adjust stat",
+        "Add ability",
+        "Remove ability",
+    ]
+
+    WEAPON_STATS = ["range", "A", "BS", "WS", "S", "AP", "D"]
+
+    def __init__(self, parent, unit_manager, targets: List[Tuple[int, int]],
+                 on_apply: Optional[Callable] = None, parse: Optional[Callable] = None):
+        """
+        Initialize the batch edit dialog.
+
+        Args:
+            parent: The parent widget
+            unit_manager: The unit manager holding the profiles
+            targets: The (unit index, profile index) of each selected profile
+            on_apply: Optional callback for after the change is applied
+            parse: Optional parse function passed to apply_batch
+        """
+        super().__init__(parent)
+        self.title("Batch Edit")
+        self.resizable(False, False)
+        self.unit_manager = unit_manager
+        self.targets = targets
+        self.on_apply = on_apply
+        self.parse = parse
+        self.create_widgets()
+        self.on_change_type()
+
+    def create_widgets(self):
+        """Create the dialog widgets."""
+        frame = ttk.Frame(self, padding="10")
+        frame.pack(fill=tk.BOTH, expand=True)
+        frame.columnconfigure(1, weight=1)
+
+        models = sum(self.unit_manager.units[u].profiles[p].count for u, p in self.targets)
+        ttk.Label(
+            frame, text=f"{len(self.targets)} profiles selected ({models} models)"
+        ).grid(row=0, column=0, columnspan=2, sticky=tk.W, pady=(0, 5))
+
+        ttk.Label(frame, text="Change:").grid(row=1, column=0, sticky=tk.W, padx=(0, 5))
+        self.change_var = tk.StringVar(value=self.CHANGE_TYPES[0])
+        change_combo = ttk.Combobox(
+            frame, textvariable=self.change_var, values=self.CHANGE_TYPES, state="readonly"
+        )
+        change_combo.grid(row=1, column=1, sticky=tk.EW, pady=2)
+        change_combo.bind('<<ComboboxSelected>>', lambda event: self.on_change_type())
+
+        ttk.Label(frame, text="Weapons:").grid(row=2, column=0, sticky=tk.W, padx=(0, 5))
+        self.weapon_type_var = tk.StringVar(value="both")
+        self.weapon_type_combo = ttk.Combobox(
+            frame, textvariable=self.weapon_type_var, values=["both", "ranged", "melee"],
+            state="readonly"
+        )
+        self.weapon_type_combo.grid(row=2, column=1, sticky=tk.EW, pady=2)
+
+        ttk.Label(frame, text="Weapon name:").grid(row=3, column=0, sticky=tk.W, padx=(0, 5))
+        self.weapon_name_entry = ttk.Entry(frame)
+        self.weapon_name_entry.grid(row=3, column=1, sticky=tk.EW, pady=2)
+
+        ttk.Label(frame, text="Stat:").grid(row=4, column=0, sticky=tk.W, padx=(0, 5))
+        self.stat_var = tk.StringVar()
+        self.stat_combo = ttk.Combobox(frame, textvariable=self.stat_var, state="readonly")
+        self.stat_combo.grid(row=4, column=1, sticky=tk.EW, pady=2)
+
+        ttk.Label(frame, text="Value:").grid(row=5, column=0, sticky=tk.W, padx=(0, 5))
+        self.value_entry = ttk.Entry(frame, width=40)
+        self.value_entry.grid(row=5, column=1, sticky=tk.EW, pady=2)
+
+        button_frame = ttk.Frame(frame)
+        button_frame.grid(row=6, column=0, columnspan=2, sticky=tk.EW, pady=(10, 0))
+
+        self.status_label = ttk.Label(button_frame, text="")
+        self.status_label.pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Close", command=self.destroy).pack(side=tk.RIGHT)
+        ttk.Button(button_frame, text="Apply", command=self.apply).pack(side=tk.RIGHT, padx=(0, 5))
+
+    def on_change_type(self):
+        """Enable the fields used by the chosen change."""
+        change_type = self.change_var.get()
+        weapon_change = change_type in ("Add weapon ability", "Set weapon stat", "Adjust weapon stat")
+        state = "readonly" if weapon_change else tk.DISABLED
+        self.weapon_type_combo.config(state=state)
+        self.weapon_name_entry.config(state=tk.NORMAL if weapon_change else tk.DISABLED)
+
+        if change_type in ("Set stat", "Adjust stat"):
+            self.stat_combo.config(values=list(StatLine.FIELDS), state="readonly")
+            self.stat_var.set(StatLine.FIELDS[0])
+        elif change_type in ("Set weapon stat", "Adjust weapon stat"):
+            self.stat_combo.config(values=self.WEAPON_STATS, state="readonly")
+            self.stat_var.set(self.WEAPON_STATS[0])
+        else:
+            self.stat_combo.config(state=tk.DISABLED)
+            self.stat_var.set("")
+
+    def build_change(self):
+        """
+        Build the change described by the fields.
+
+        Returns:
+            The change to apply
+        """
+        change_type = self.change_var.get()
+        value = self.value_entry.get()
+        weapon_type = self.weapon_type_var.get()
+        weapon_name = self.weapon_name_entry.get().strip() or None
+
+        if change_type == "Add weapon ability":
+            return AddWeaponAbility(value, weapon_type, weapon_name)
+        if change_type == "Set weapon stat":
+            return SetWeaponStat(self.stat_var.get(), value.strip(), weapon_type, weapon_name)
+        if change_type == "Adjust weapon stat":
+            return AdjustWeaponStat(self.stat_var.get(), self.parse_amount(value), weapon_type,
+                                    weapon_name)
+        if change_type == "Set stat":
+            return SetStat(self.stat_var.get(), value.strip())
+        if change_type == "Adjust stat":
+            return AdjustStat(self.stat_var.get(), self.parse_amount(value))
+        if change_type == "Add ability":
+            return AddAbility(value)
+        return RemoveAbility(value)
+
+    @staticmethod
+    def parse_amount(value: str) -> int:
+        """
+        Parse the amount of an adjustment.
+
+        Args:
+            value: The value field, e.g. "1" or "-1"
+
+        Returns:
+            The amount
+        """
+        try:
+            return int(value.strip())
+        except ValueError:
+            raise ValueError("The amount must be a whole number, e.g. 1 or -1") from None
+
+    def apply(self):
+        """Apply the change to every selected profile."""
+        try:
+            change = self.build_change()
+        except ValueError as e:
+            messagebox.showerror("Error", str(e), parent=self)
+            return
+
+        try:
+            if self.parse:
+                changed, skipped = apply_batch(self.unit_manager, self.targets, change, self.parse)
+            else:
+                changed, skipped = apply_batch(self.unit_manager, self.targets, change)
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to write the change journal: {str(e)}", parent=self)
+            return
+        except FileChangedError as e:
+            messagebox.showerror("Error", str(e), parent=self)
+            return
+        status = f"{len(changed)} profiles changed"
+        if skipped:
+            status += f"; {len(skipped)} skipped, their descriptions don't have the changed values"
+        self.status_label.config(text=status)
+
+        if changed and self.on_apply:
+            self.on_apply()
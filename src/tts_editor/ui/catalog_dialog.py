@@ -0,0 +1,173 @@
+"""
+Saves catalog dialog for the Warhammer 40k TTS Unit Editor.
+"""
+import os
+import time
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+from typing import Callable
+
+from ..utils.save_catalog import SaveCatalog, default_saves_directory
+
+
+class CatalogDialog(tk.Toplevel):
+    """Dialog listing the catalogued saves of a directory, to find and open one."""
+
+    COLUMNS = [
+        ("units", "Units", 60),
+        ("models", "Models", 70),
+        ("modified", "Modified", 130),
+        ("file", "File", 220),
+    ]
+
+    def __init__(self, parent, catalog: SaveCatalog, on_open: Callable[[str], None]):
+        """
+        Initialize the catalog dialog.
+
+        Args:
+            parent: The parent widget
+            catalog: The catalog to show and refresh
+            on_open: Callback with the path of the save to open
+        """
+        super().__init__(parent)
+        self.title("Saves Catalog")
+        self.geometry("760x520")
+        self.catalog = catalog
+        self.on_open = on_open
+        self.paths = {}  # Tree item -> save path
+
+        self.directory_var = tk.StringVar(value=catalog.last_directory() or default_saves_directory())
+        self.filter_var = tk.StringVar()
+        self.status_var = tk.StringVar()
+
+        self.create_widgets()
+        self.refresh()
+
+    def create_widgets(self):
+        """Create the dialog widgets."""
+        frame = ttk.Frame(self, padding="10")
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        directory_frame = ttk.Frame(frame)
+        directory_frame.pack(fill=tk.X)
+        ttk.Label(directory_frame, text="Saves directory:").pack(side=tk.LEFT)
+        ttk.Entry(directory_frame, textvariable=self.directory_var).pack(
+            side=tk.LEFT, fill=tk.X, expand=True, padx=5
+        )
+        ttk.Button(directory_frame, text="Browse...", command=self.browse).pack(side=tk.LEFT)
+        ttk.Button(directory_frame, text="Scan", command=self.scan).pack(side=tk.LEFT, padx=(5, 0))
+
+        filter_frame = ttk.Frame(frame)
+        filter_frame.pack(fill=tk.X, pady=(5, 5))
+        ttk.Label(filter_frame, text="Filter by save or unit name:").pack(side=tk.LEFT)
+        filter_entry = ttk.Entry(filter_frame, textvariable=self.filter_var)
+        filter_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 0))
+        filter_entry.bind("<KeyRelease>", lambda event: self.refresh())
+
+        paned = ttk.PanedWindow(frame, orient=tk.VERTICAL)
+        paned.pack(fill=tk.BOTH, expand=True)
+
+        self.tree = ttk.Treeview(
+            paned,
+            columns=[key for key, _, _ in self.COLUMNS],
+            height=12,
+            selectmode=tk.BROWSE
+        )
+        self.tree.heading("#0", text="Save")
+        self.tree.column("#0", width=220)
+        for key, heading, width in self.COLUMNS:
+            self.tree.heading(key, text=heading)
+            self.tree.column(key, width=width, anchor=tk.W if key == "file" else tk.E)
+        self.tree.bind("<<TreeviewSelect>>", self.on_select)
+        self.tree.bind("<Double-1>", lambda event: self.open_selected())
+        paned.add(self.tree, weight=3)
+
+        self.unit_listbox = tk.Listbox(paned, height=6)
+        paned.add(self.unit_listbox, weight=1)
+
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(fill=tk.X, pady=(5, 0))
+        ttk.Label(button_frame, textvariable=self.status_var).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Close", command=self.destroy).pack(side=tk.RIGHT)
+        ttk.Button(button_frame, text="Open", command=self.open_selected).pack(side=tk.RIGHT, padx=(0, 5))
+
+    def browse(self):
+        """Choose the directory to scan."""
+        directory = filedialog.askdirectory(
+            parent=self, title="Choose Saves Directory", initialdir=self.directory_var.get()
+        )
+        if directory:
+            self.directory_var.set(directory)
+
+    def scan(self):
+        """Scan the directory, reading only new and changed saves."""
+        directory = self.directory_var.get().strip()
+        if not os.path.isdir(directory):
+            messagebox.showwarning("Warning", f"{directory} is not a directory.", parent=self)
+            return
+
+        self.config(cursor="watch")
+        self.update_idletasks()
+        try:
+            counts = self.catalog.refresh(directory)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to scan saves: {str(e)}", parent=self)
+            return
+        finally:
+            self.config(cursor="")
+
+        self.status_var.set(
+            f"{counts['added']} added, {counts['updated']} updated, {counts['removed']} removed, "
+            f"{counts['unchanged']} unchanged" +
+            (f", {counts['failed']} unreadable" if counts["failed"] else "")
+        )
+        self.refresh()
+
+    def refresh(self):
+        """Reload the saves matching the filter."""
+        self.tree.delete(*self.tree.get_children())
+        self.unit_listbox.delete(0, tk.END)
+        self.paths = {}
+
+        directory = self.directory_var.get().strip()
+        for save_id, path, save_name, unit_count, object_count, mtime, error in self.catalog.saves(
+                self.filter_var.get().strip()):
+            try:
+                file_name = os.path.relpath(path, directory)
+            except ValueError:
+                file_name = path  # On another drive
+            item = self.tree.insert(
+                "", tk.END, iid=str(save_id), text=save_name,
+                values=[
+                    unit_count if not error else "",
+                    object_count if not error else "unreadable",
+                    time.strftime("%Y-%m-%d %H:%M", time.localtime(mtime)),
+                    file_name,
+                ]
+            )
+            self.paths[item] = path
+
+    def on_select(self, event):
+        """Show the units of the selected save."""
+        self.unit_listbox.delete(0, tk.END)
+        selection = self.tree.selection()
+        if not selection:
+            return
+
+        for unit_name, model_count in self.catalog.units(int(selection[0])):
+            self.unit_listbox.insert(tk.END, f"{unit_name} (×{model_count})" if model_count > 1 else unit_name)
+
+    def open_selected(self):
+        """Open the selected save in the editor."""
+        selection = self.tree.selection()
+        if not selection:
+            messagebox.showwarning("Warning", "No save selected.", parent=self)
+            return
+
+        path = self.paths[selection[0]]
+        if not os.path.exists(path):
+            messagebox.showerror("Error", f"{path} no longer exists; scan again.", parent=self)
+            return
+
+        self.destroy()
+        self.on_open(path)
@@ -0,0 +1,160 @@
+"""
+Find and replace dialog for the Warhammer 40k TTS Unit Editor.
+"""
+import re
+import tkinter as tk
+from tkinter import ttk, messagebox
+from typing import Callable, List, Optional
+
+from ..models.unit import FileChangedError
+from ..utils.find_replace import FindReplace, Replacement, apply_replacements
+
+
+class FindReplaceDialog(tk.Toplevel):
+    """Dialog for previewing and applying a roster-wide find and replace."""
+
+    def __init__(self, parent, unit_manager, on_apply: Optional[Callable] = None):
+        """
+        Initialize the find and replace dialog.
+
+        Args:
+            parent: The parent widget
+            unit_manager: The unit manager to search
+            on_apply: Optional callback for after replacements are applied
+        """
+        super().__init__(parent)
+        self.title("Find and Replace")
+        self.geometry("700x520")
+        self.unit_manager = unit_manager
+        self.on_apply = on_apply
+        self.replacements: List[Replacement] = []
+        self.create_widgets()
+
+    def create_widgets(self):
+        """Create the dialog widgets."""
+        frame = ttk.Frame(self, padding="5")
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        form = ttk.Frame(frame)
+        form.pack(fill=tk.X)
+        form.columnconfigure(1, weight=1)
+
+        ttk.Label(form, text="Find:").grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
+        self.find_entry = ttk.Entry(form)
+        self.find_entry.grid(row=0, column=1, sticky=tk.EW, pady=2)
+
+        ttk.Label(form, text="Replace:").grid(row=1, column=0, sticky=tk.W, padx=(0, 5))
+        self.replace_entry = ttk.Entry(form)
+        self.replace_entry.grid(row=1, column=1, sticky=tk.EW, pady=2)
+
+        options = ttk.Frame(frame)
+        options.pack(fill=tk.X, pady=(2, 5))
+
+        self.regex_var = tk.BooleanVar(value=False)
+        self.ignore_case_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(options, text="Regular expression", variable=self.regex_var).pack(side=tk.LEFT)
+        ttk.Checkbutton(options, text="Ignore case", variable=self.ignore_case_var).pack(side=tk.LEFT, padx=(10, 0))
+        ttk.Button(options, text="Preview", command=self.preview).pack(side=tk.RIGHT)
+
+        # Affected units and profiles
+        self.tree = ttk.Treeview(frame, columns=("profile", "models", "matches"), height=8)
+        self.tree.heading("#0", text="Unit")
+        self.tree.heading("profile", text="Profile")
+        self.tree.heading("models", text="Models")
+        self.tree.heading("matches", text="Matches")
+        self.tree.column("#0", width=260)
+        self.tree.column("models", width=60, anchor=tk.E)
+        self.tree.column("matches", width=60, anchor=tk.E)
+        self.tree.pack(fill=tk.BOTH, expand=True)
+        self.tree.bind('<<TreeviewSelect>>', self.on_select)
+
+        # Diff of the selected profile
+        self.diff_text = tk.Text(frame, wrap=tk.NONE, height=10, state=tk.DISABLED)
+        self.diff_text.tag_configure("removed", foreground="#e85545")
+        self.diff_text.tag_configure("added", foreground="#2e9e3e")
+        self.diff_text.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
+
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(fill=tk.X, pady=(5, 0))
+
+        self.status_label = ttk.Label(button_frame, text="")
+        self.status_label.pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Close", command=self.destroy).pack(side=tk.RIGHT)
+        self.apply_button = ttk.Button(button_frame, text="Apply", command=self.apply, state=tk.DISABLED)
+        self.apply_button.pack(side=tk.RIGHT, padx=(0, 5))
+
+    def preview(self):
+        """Run a dry run and list the profiles that would change."""
+        pattern = self.find_entry.get()
+        if not pattern:
+            return
+
+        try:
+            operation = FindReplace(
+                pattern,
+                self.replace_entry.get(),
+                use_regex=self.regex_var.get(),
+                ignore_case=self.ignore_case_var.get()
+            )
+            self.replacements = operation.plan(self.unit_manager)
+        except (re.error, IndexError) as e:
+            messagebox.showerror("Error", f"Invalid pattern or replacement: {str(e)}", parent=self)
+            return
+
+        self.tree.delete(*self.tree.get_children())
+        for i, replacement in enumerate(self.replacements):
+            self.tree.insert(
+                "", tk.END, iid=str(i), text=replacement.unit_name,
+                values=(replacement.profile_name, replacement.model_count, replacement.match_count)
+            )
+
+        models = sum(r.model_count for r in self.replacements)
+        self.status_label.config(text=f"{len(self.replacements)} profiles, {models} models affected")
+        self.apply_button.config(state=tk.NORMAL if self.replacements else tk.DISABLED)
+        self.show_diff("")
+
+    def on_select(self, event):
+        """Show the diff of the selected profile."""
+        selection = self.tree.selection()
+        if selection:
+            self.show_diff(self.replacements[int(selection[0])].diff())
+
+    def show_diff(self, diff: str):
+        """
+        Show a diff in the diff area.
+
+        Args:
+            diff: The unified diff text
+        """
+        self.diff_text.config(state=tk.NORMAL)
+        self.diff_text.delete(1.0, tk.END)
+        for line in diff.splitlines(True):
+            tag = ()
+            if line.startswith("-") and not line.startswith("---"):
+                tag = ("removed",)
+            elif line.startswith("+") and not line.startswith("+++"):
+                tag = ("added",)
+            self.diff_text.insert(tk.END, line, tag)
+        self.diff_text.config(state=tk.DISABLED)
+
+    def apply(self):
+        """Apply the previewed replacements."""
+        if not self.replacements:
+            return
+
+        try:
+            count = apply_replacements(self.unit_manager, self.replacements)
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to write the change journal: {str(e)}", parent=self)
+            return
+        except FileChangedError as e:
+            messagebox.showerror("Error", str(e), parent=self)
+            return
+        self.replacements = []
+        self.tree.delete(*self.tree.get_children())
+        self.apply_button.config(state=tk.DISABLED)
+        self.status_label.config(text=f"{count} profiles changed; save to write them to the file")
+        self.show_diff("")
+
+        if self.on_apply:
+            self.on_apply()
@@ -7,12 +7,29 @@ import os
 import re
 from typing import Optional, Dict, Any
 
-from ..models.unit import UnitManager
+from ..models.unit import FileChangedError, UnitManager
+from ..models.workspace import Workspace
+from ..presenters.editor import EditorPresenter, EditorView
+from ..utils.memory import memory
+from ..utils.profiling import profiled, profiler
+from ..utils.sqlite_export import export_roster
+from ..utils.html_export import export_html
+from ..utils.save_catalog import SaveCatalog
+from ..utils.color_formatter import ColorFormatter
 from .text_editor import TextEditor
 from .structured_editor import StructuredEditor
+from .performance_panel import PerformancePanel
+from .memory_panel import MemoryPanel
+from .stall_log_panel import StallLogPanel
+from .find_replace_dialog import FindReplaceDialog
+from .problems_panel import ProblemsPanel
+from .batch_edit_dialog import BatchEditDialog
+from .merge_dialog import MergeDialog
+from .catalog_dialog import CatalogDialog
+from .search_dialog import SearchDialog
 
 
-class MainWindow:
+class MainWindow(EditorView):
     """Main window for the Warhammer 40k TTS Unit Editor."""
     
     # Common color codes used in TTS descriptions
@@ -25,6 +42,12 @@ class MainWindow:
         {"code": "56f442", "name": "Bright Green", "display": "#56f442"}
     ]
     
+    # Unit list color of units still being parsed in the background
+    PENDING_UNIT_COLOR = "gray55"
+    
+    # Milliseconds between checks for background parsing results
+    EAGER_POLL_INTERVAL = 100
+    
     def __init__(self, root: tk.Tk):
         """
         Initialize the main window.
@@ -36,13 +59,30 @@ class MainWindow:
         self.root.title("Warhammer 40k TTS Unit Editor")
         self.root.geometry("900x700")
         
-        self.unit_manager = UnitManager()
-        self.current_unit_index = None
-        self.current_profile_index = None
-        self.current_file_path = None
+        self.presenter = EditorPresenter(self)
+        self.performance_panel = None
+        self.memory_panel = None
+        self.stall_log_panel = None
+        self.catalog = None
+        self.eager_parse_var = tk.BooleanVar(value=False)
+        self.eager_poll_id = None
         
         self.create_menu()
         self.create_ui()
+        self.text_editor.vocabulary = self.presenter.vocabulary
+        self.root.protocol("WM_DELETE_WINDOW", self.exit)
+        self.root.bind_all("<Control-s>", lambda event: self.save_pending())
+        self.root.bind_all("<Control-F>", lambda event: self.show_search())
+    
+    @property
+    def workspace(self) -> Workspace:
+        """The open workspace."""
+        return self.presenter.workspace
+    
+    @property
+    def unit_manager(self) -> UnitManager:
+        """The unit manager of the active file."""
+        return self.presenter.unit_manager
     
     def create_menu(self):
         """Create the application menu."""
@@ -50,11 +90,44 @@ class MainWindow:
         
         file_menu = tk.Menu(menubar, tearoff=0)
         file_menu.add_command(label="Open", command=self.open_file)
+        file_menu.add_command(label="Open Multiple...", command=self.open_multiple_files)
+        file_menu.add_command(label="Saves Catalog...", command=self.show_catalog)
+        file_menu.add_command(label="Search Saves...", command=self.show_search, accelerator="Ctrl+Shift+F")
+        file_menu.add_command(label="Save", command=self.save_pending, accelerator="Ctrl+S")
+        file_menu.add_command(label="Save All", command=self.save_all)
         file_menu.add_command(label="Save as...", command=self.save_file)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
+        file_menu.add_command(label="Export Roster to SQLite...", command=self.export_sqlite)
+        file_menu.add_command(label="Export Datasheets to HTML...", command=self.export_html)
+        file_menu.add_command(label="Export Change Journal...", command=self.export_journal)
+        file_menu.add_command(label="Apply Change Journal...", command=self.apply_journal)
+        file_menu.add_separator()
+        file_menu.add_command(label="Exit", command=self.exit)
         
         menubar.add_cascade(label="File", menu=file_menu)
+        
+        edit_menu = tk.Menu(menubar, tearoff=0)
+        edit_menu.add_command(label="Find and Replace...", command=self.show_find_replace)
+        edit_menu.add_command(label="Batch Edit Selected Profiles...", command=self.show_batch_edit)
+        edit_menu.add_command(label="Merge Similar Units...", command=self.show_merge_suggestions)
+        
+        menubar.add_cascade(label="Edit", menu=edit_menu)
+        
+        view_menu = tk.Menu(menubar, tearoff=0)
+        view_menu.add_checkbutton(
+            label="Parse All Profiles on Load",
+            variable=self.eager_parse_var,
+            command=self.toggle_eager_parsing
+        )
+        
+        menubar.add_cascade(label="View", menu=view_menu)
+        
+        debug_menu = tk.Menu(menubar, tearoff=0)
+        debug_menu.add_command(label="Performance...", command=self.show_performance_panel)
+        debug_menu.add_command(label="Memory...", command=self.show_memory_panel)
+        debug_menu.add_command(label="Stall Log...", command=self.show_stall_log_panel)
+        
+        menubar.add_cascade(label="Debug", menu=debug_menu)
         self.root.config(menu=menubar)
     
     def create_ui(self):
@@ -71,7 +144,9 @@ class MainWindow:
         units_frame = ttk.LabelFrame(left_frame, text="Units", padding="5")
         units_frame.pack(fill=tk.BOTH, expand=True)
         
-        self.unit_listbox = tk.Listbox(units_frame, width=30, height=10)
+        self.unit_listbox = tk.Listbox(
+            units_frame, width=30, height=10, selectmode=tk.EXTENDED, exportselection=False
+        )
         self.unit_listbox.pack(fill=tk.BOTH, expand=True)
         self.unit_listbox.bind('<<ListboxSelect>>', self.on_unit_select)
         
@@ -79,10 +154,16 @@ class MainWindow:
         profiles_frame = ttk.LabelFrame(left_frame, text="Profiles", padding="5")
         profiles_frame.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
         
-        self.profile_listbox = tk.Listbox(profiles_frame, width=30, height=10)
+        self.profile_listbox = tk.Listbox(
+            profiles_frame, width=30, height=10, selectmode=tk.EXTENDED, exportselection=False
+        )
         self.profile_listbox.pack(fill=tk.BOTH, expand=True)
         self.profile_listbox.bind('<<ListboxSelect>>', self.on_profile_select)
         
+        # Problems found by the description linter
+        self.problems_panel = ProblemsPanel(left_frame, on_select=self.select_profile)
+        self.problems_panel.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
+        
         # Right panel - Description editor
         right_frame = ttk.LabelFrame(main_frame, text="Unit Description", padding="5")
         right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
@@ -97,7 +178,8 @@ class MainWindow:
         
         self.structured_editor = StructuredEditor(
             structured_tab, 
-            on_generate=self.on_description_generated
+            on_generate=self.on_description_generated,
+            presenter=self.presenter.structured
         )
         self.structured_editor.pack(fill=tk.BOTH, expand=True)
         
@@ -170,12 +252,15 @@ class MainWindow:
         
         ttk.Button(
             button_frame, 
-            text="Save Changes", 
+            text="Apply Changes", 
             command=self.save_changes
         ).pack(side=tk.RIGHT)
     
     def open_file(self):
         """Open a TTS JSON file."""
+        if not self.confirm_pending_changes():
+            return
+        
         file_path = filedialog.askopenfilename(
             title="Open TTS JSON File",
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
@@ -185,95 +270,225 @@ class MainWindow:
             return
             
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                json_data = file.read()
-                
-            # Parse JSON
-            import json
-            json_data = json.loads(json_data)
-            
-            # Load the data into the unit manager
-            self.unit_manager.load_json(json_data)
-            
-            # Update the UI
-            self.load_units()
-            self.current_file_path = file_path
-            self.root.title(f"Warhammer 40k TTS Unit Editor - {os.path.basename(file_path)}")
-            
+            self.load_file(file_path)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open file: {str(e)}")
     
-    def load_units(self):
-        """Load units into the unit listbox."""
-        self.unit_listbox.delete(0, tk.END)
-        self.profile_listbox.delete(0, tk.END)
+    def open_multiple_files(self):
+        """Open several TTS JSON files side by side in the workspace."""
+        if not self.confirm_pending_changes():
+            return
         
-        for unit in self.unit_manager.units:
-            self.unit_listbox.insert(tk.END, unit.name)
-    
-    def on_unit_select(self, event):
-        """Handle unit selection."""
-        selection = self.unit_listbox.curselection()
-        if not selection:
+        file_paths = filedialog.askopenfilenames(
+            title="Open TTS JSON Files",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+        )
+        
+        if not file_paths:
             return
-            
-        self.current_unit_index = selection[0]
-        self.load_profiles(self.current_unit_index)
         
-        # Auto-select first profile if available
-        if self.profile_listbox.size() > 0:
-            self.profile_listbox.selection_clear(0, tk.END)
-            self.profile_listbox.selection_set(0)
-            self.profile_listbox.event_generate('<<ListboxSelect>>')
+        errors = self.load_files(list(file_paths))
+        if errors:
+            details = "\n".join(f"{os.path.basename(path)}: {error}" for path, error in errors)
+            messagebox.showerror("Error", f"Failed to open some files:\n{details}")
     
-    def load_profiles(self, unit_index):
+    def open_catalog(self) -> Optional[SaveCatalog]:
         """
-        Load profiles for the selected unit.
+        Open the saves catalog the first time it is needed.
         
-        Args:
-            unit_index: The index of the unit in the unit manager
+        Returns:
+            The catalog, or None if it couldn't be opened
         """
-        self.profile_listbox.delete(0, tk.END)
+        if self.catalog is None:
+            try:
+                self.catalog = SaveCatalog()
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to open the saves catalog: {str(e)}")
+        return self.catalog
+    
+    def show_catalog(self):
+        """Show the catalog of saves, to find one and open it."""
+        catalog = self.open_catalog()
+        if catalog is not None:
+            CatalogDialog(self.root, catalog, on_open=self.open_from_catalog)
+    
+    def show_search(self):
+        """Search every catalogued save for a unit, weapon or ability."""
+        catalog = self.open_catalog()
+        if catalog is None:
+            return
         
-        if unit_index < 0 or unit_index >= len(self.unit_manager.units):
+        if not catalog.saves():
+            messagebox.showinfo(
+                "Search Saves",
+                "No saves are catalogued yet. Scan your saves folder in File > Saves Catalog... first."
+            )
             return
-            
-        unit = self.unit_manager.units[unit_index]
-        for profile in unit.profiles:
-            display_name = profile.name
-            if profile.count > 1:
-                display_name = f"{profile.name} (×{profile.count})"
-            self.profile_listbox.insert(tk.END, display_name)
+        
+        SearchDialog(self.root, catalog, on_open=self.open_search_result)
     
-    def on_profile_select(self, event):
-        """Handle profile selection."""
-        if self.current_unit_index is None:
-            return
-            
-        selection = self.profile_listbox.curselection()
-        if not selection:
+    def open_search_result(self, file_path: str, guid: str):
+        """
+        Open a save found by a search, with the matching profile selected.
+        
+        Args:
+            file_path: The path to the save
+            guid: The GUID of a model with the matching profile
+        """
+        if self.workspace.index_of(file_path) is None and not self.confirm_pending_changes():
             return
-            
-        self.current_profile_index = selection[0]
         
-        if self.current_unit_index < 0 or self.current_unit_index >= len(self.unit_manager.units):
+        try:
+            found = self.presenter.open_profile(file_path, guid)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to open file: {str(e)}")
             return
-            
-        unit = self.unit_manager.units[self.current_unit_index]
-        if self.current_profile_index < 0 or self.current_profile_index >= len(unit.profiles):
+        
+        if not found:
+            messagebox.showwarning(
+                "Warning",
+                f"{os.path.basename(file_path)} has changed since it was catalogued and the profile "
+                "wasn't found. Scan the folder again in File > Saves Catalog..."
+            )
+    
+    def open_from_catalog(self, file_path: str):
+        """
+        Open a save picked in the catalog.
+        
+        Args:
+            file_path: The path to the save
+        """
+        if not self.confirm_pending_changes():
             return
+        
+        try:
+            self.load_file(file_path)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to open file: {str(e)}")
+    
+    def load_file(self, file_path: str) -> None:
+        """
+        Replace the workspace with a single TTS JSON file.
+        
+        Args:
+            file_path: The path to the file to load
+        """
+        self.presenter.load_file(file_path)
+    
+    def load_files(self, file_paths):
+        """
+        Replace the workspace with several TTS JSON files, loaded concurrently.
+        
+        Args:
+            file_paths: The paths to the files to load
             
-        profile = unit.profiles[self.current_profile_index]
+        Returns:
+            A list of (file path, error) tuples for files that failed to load
+        """
+        return self.presenter.load_files(file_paths)
+    
+    def show_title(self, title: str):
+        """Show the window title."""
+        self.root.title(title)
+    
+    def show_units(self, labels):
+        """
+        Replace the unit listbox rows.
+        
+        Args:
+            labels: The label of each row
+        """
+        self.unit_listbox.delete(0, tk.END)
+        self.unit_listbox.insert(tk.END, *labels)
+    
+    def select_unit_row(self, row: int):
+        """Select and show a single unit listbox row."""
+        self.unit_listbox.selection_clear(0, tk.END)
+        self.unit_listbox.selection_set(row)
+        self.unit_listbox.see(row)
+    
+    def on_unit_select(self, event):
+        """Handle unit selection; several units of the same file can be selected."""
+        self.presenter.select_units(list(self.unit_listbox.curselection()))
+    
+    def show_profiles(self, labels):
+        """
+        Replace the profile listbox rows.
+        
+        Args:
+            labels: The label of each row
+        """
+        self.profile_listbox.delete(0, tk.END)
+        self.profile_listbox.insert(tk.END, *labels)
+    
+    def select_profile_row(self, row: int):
+        """Select and show a single profile listbox row."""
+        self.profile_listbox.selection_clear(0, tk.END)
+        self.profile_listbox.selection_set(row)
+        self.profile_listbox.see(row)
+    
+    def on_profile_select(self, event):
+        """Handle profile selection; the first selected profile is shown for editing."""
+        self.presenter.select_profiles(list(self.profile_listbox.curselection()))
+    
+    def show_profile(self, description: str, fields: tuple):
+        """
+        Load a profile's description into the editors and preview.
         
+        Args:
+            description: The profile's description
+            fields: The fields parsed from the description
+        """
         # Update the text editor
-        self.text_editor.set_text(profile.description)
+        self.text_editor.set_text(description)
         
         # Update the structured editor
-        self.structured_editor.populate_from_description(profile.description)
+        with profiler.span("populate_structured_editor"), memory.phase("populate_structured_editor"):
+            self.structured_editor.show_fields(fields)
         
         # Update the preview
         self.update_preview()
     
+    def show_text(self, description: str):
+        """
+        Show an edited description in the text editor and preview.
+        
+        Args:
+            description: The edited description
+        """
+        self.text_editor.set_text(description)
+        self.update_preview()
+    
+    def show_problems(self, unit_manager, results):
+        """Show the linter results of the active file in the problems panel."""
+        self.problems_panel.show(unit_manager, results)
+    
+    def confirm_recovery(self, file_path: str, edit_count: int, save_changed: bool) -> bool:
+        """
+        Ask whether to recover the unsaved edits journaled for a file.
+        
+        Args:
+            file_path: The path to the file
+            edit_count: The number of journaled edits
+            save_changed: Whether the file was changed since the edits were made
+            
+        Returns:
+            True to replay the edits, False to discard them
+        """
+        edits = f"{edit_count} edits that were" if edit_count != 1 else "1 edit that was"
+        message = (
+            f"{os.path.basename(file_path)} has {edits} applied but never saved, "
+            "probably because the editor closed unexpectedly."
+        )
+        if save_changed:
+            message += "\n\nThe file has been changed since; edits are matched to the models by GUID."
+        message += "\n\nRecover them? If not, they are discarded."
+        return messagebox.askyesno("Recover Unsaved Edits", message)
+    
+    def show_error(self, message: str):
+        """Show an error message."""
+        messagebox.showerror("Error", message)
+    
     def insert_color_code(self, color_code):
         """
         Insert a color code at the current cursor position.
@@ -283,33 +498,11 @@ class MainWindow:
         """
         self.text_editor.insert_at_cursor(f"[{color_code}]")
     
+    @profiled("preview_render")
     def update_preview(self):
         """Update the preview area with formatted text."""
         description = self.text_editor.get_text()
-        self.apply_formatting(self.preview_text, description)
-    
-    def apply_formatting(self, text_widget: tk.Text, description: str) -> None:
-        """
-        Apply formatting to a text widget based on the description text.
-        
-        Args:
-            text_widget: The tkinter Text widget to apply formatting to
-            description: The description text with color codes
-        """
-        # Enable editing of text widget temporarily if it's disabled
-        was_disabled = text_widget.cget("state") == tk.DISABLED
-        if was_disabled:
-            text_widget.config(state=tk.NORMAL)
-        
-        # Clear the text widget
-        text_widget.delete(1.0, tk.END)
-        
-        # Just insert the text without formatting for now
-        text_widget.insert(tk.END, description)
-        
-        # Restore the disabled state if needed
-        if was_disabled:
-            text_widget.config(state=tk.DISABLED)
+        ColorFormatter.apply_formatting(self.preview_text, description)
     
     def on_description_generated(self, description):
         """
@@ -318,47 +511,80 @@ class MainWindow:
         Args:
             description: The generated description
         """
-        self.text_editor.set_text(description)
-        self.update_preview()
+        self.presenter.edit_description(description)
     
     def save_changes(self):
-        """Save changes to the current profile and to the file."""
-        if self.current_unit_index is None or self.current_profile_index is None:
+        """Apply the edited description to the current profile, pending the next save."""
+        if not self.presenter.has_profile:
             messagebox.showwarning("Warning", "No unit profile selected.")
             return
-            
-        # Get the updated description
-        description = self.text_editor.get_text()
         
-        # Save the changes to the profile
-        self.unit_manager.save_profile_changes(
-            self.current_unit_index,
-            self.current_profile_index,
-            description
-        )
+        try:
+            self.presenter.apply_changes(self.text_editor.get_text())
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to write the change journal: {str(e)}")
+        except FileChangedError as e:
+            messagebox.showerror("Error", str(e))
+    
+    def save_pending(self):
+        """Write the active file's pending edits in one write; does nothing if there are none."""
+        if self.presenter.active_file_index is None or not self.unit_manager.is_dirty():
+            return
+        
+        self.save_to_file(self.presenter.current_file_path)
+    
+    def save_all(self) -> bool:
+        """
+        Write every open file that has pending edits.
+        
+        Returns:
+            True if every file was saved
+        """
+        errors = self.presenter.save_all()
+        if errors:
+            details = "\n".join(f"{os.path.basename(path)}: {error}" for path, error in errors)
+            messagebox.showerror("Error", f"Failed to save some files:\n{details}")
+            return False
+        return True
+    
+    def confirm_pending_changes(self) -> bool:
+        """
+        Offer to save pending edits before they would be discarded.
+        
+        Returns:
+            False if the user cancelled, True otherwise
+        """
+        dirty_count = self.workspace.dirty_count
+        if not dirty_count:
+            return True
         
-        # Save to file
-        if self.current_file_path:
-            self.save_to_file(self.current_file_path)
-            messagebox.showinfo("Success", "Changes saved to file.")
-        else:
-            # No current file, prompt to save
-            self.save_file()
+        answer = messagebox.askyesnocancel(
+            "Unsaved Changes",
+            f"Save {dirty_count} unsaved profile change{'s' if dirty_count != 1 else ''} first?"
+        )
+        if answer is None:
+            return False
+        if answer:
+            return self.save_all()
+        self.workspace.discard_journals()
+        return True
+    
+    def exit(self):
+        """Quit the application, offering to save pending edits first."""
+        if self.confirm_pending_changes():
+            self.root.quit()
     
     def save_to_file(self, file_path):
-        """Save the JSON data to the specified file path."""
-        if not self.unit_manager.json_data:
+        """Save the active file's JSON data to the specified file path; returns whether it was written."""
+        if not self.unit_manager.has_data():
             messagebox.showwarning("Warning", "No data to save.")
             return False
             
         try:
-            import json
-            with open(file_path, 'w', encoding='utf-8') as file:
-                json.dump(self.unit_manager.json_data, file, indent=2)
-            
-            self.current_file_path = file_path
-            self.root.title(f"Warhammer 40k TTS Unit Editor - {os.path.basename(file_path)}")
-            return True
+            written = self.presenter.save_to_file(file_path)
+            if not written:
+                messagebox.showinfo("Save", "There are no changes to save; the file was not written.")
+            return written
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save file: {str(e)}")
@@ -366,7 +592,7 @@ class MainWindow:
     
     def save_file(self):
         """Save the JSON file with a file dialog (Save As)."""
-        if not self.unit_manager.json_data:
+        if not self.unit_manager.has_data():
             messagebox.showwarning("Warning", "No data to save.")
             return
             
@@ -381,3 +607,203 @@ class MainWindow:
         
         if self.save_to_file(file_path):
             messagebox.showinfo("Success", "File saved successfully.")
+    
+    def export_journal(self):
+        """Export the active file's unsaved edits as a JSON Patch, to apply to other copies of the save."""
+        journal = self.unit_manager.journal
+        if journal is None or not journal.exists():
+            messagebox.showwarning("Warning", "There are no unsaved edits to export.")
+            return
+        
+        file_path = filedialog.asksaveasfilename(
+            title="Export Change Journal",
+            filetypes=[("JSON Patch files", "*.json-patch *.json"), ("All files", "*.*")],
+            defaultextension=".json-patch"
+        )
+        
+        if not file_path:
+            return
+        
+        try:
+            count = self.presenter.export_journal(file_path)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to export the change journal: {str(e)}")
+            return
+        messagebox.showinfo("Success", f"Exported {count} patch operations.")
+    
+    def apply_journal(self):
+        """Apply an exported JSON Patch or a change journal to the active file."""
+        if not self.unit_manager.units:
+            messagebox.showwarning("Warning", "No data loaded.")
+            return
+        
+        file_path = filedialog.askopenfilename(
+            title="Apply Change Journal",
+            filetypes=[("JSON Patch files", "*.json-patch *.json"), ("Change journals", "*.journal"),
+                       ("All files", "*.*")]
+        )
+        
+        if not file_path:
+            return
+        
+        try:
+            count = self.presenter.apply_patch_file(file_path)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to apply the change journal: {str(e)}")
+            return
+        messagebox.showinfo(
+            "Apply Change Journal",
+            f"{count} profile{'s' if count != 1 else ''} changed; save to write them to the file."
+        )
+    
+    def export_sqlite(self):
+        """Export the active file's roster to an SQLite database, updating it if it exists."""
+        if not self.unit_manager.units:
+            messagebox.showwarning("Warning", "No data to export.")
+            return
+        
+        file_path = filedialog.asksaveasfilename(
+            title="Export Roster to SQLite",
+            filetypes=[("SQLite databases", "*.sqlite *.db"), ("All files", "*.*")],
+            defaultextension=".sqlite",
+            confirmoverwrite=False
+        )
+        
+        if not file_path:
+            return
+        
+        try:
+            result = export_roster(self.unit_manager, file_path)
+            messagebox.showinfo(
+                "Success",
+                f"Roster exported: {result['inserted']} profiles added, "
+                f"{result['updated']} updated, {result['deleted']} removed."
+            )
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to export roster: {str(e)}")
+    
+    def export_html(self):
+        """Export the active file's units and profiles to an HTML datasheet."""
+        if not self.unit_manager.units:
+            messagebox.showwarning("Warning", "No data to export.")
+            return
+        
+        file_path = filedialog.asksaveasfilename(
+            title="Export Datasheets to HTML",
+            filetypes=[("HTML files", "*.html"), ("All files", "*.*")],
+            defaultextension=".html"
+        )
+        
+        if not file_path:
+            return
+        
+        title = os.path.splitext(os.path.basename(self.presenter.current_file_path or ""))[0] or None
+        try:
+            count = export_html(self.unit_manager, file_path, title)
+            messagebox.showinfo("Success", f"{count} profiles exported to {file_path}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to export datasheets: {str(e)}")
+    
+    def show_find_replace(self):
+        """Show the roster-wide find and replace dialog for the active file."""
+        if not self.unit_manager.units:
+            messagebox.showwarning("Warning", "No data loaded.")
+            return
+        
+        FindReplaceDialog(self.root, self.unit_manager, on_apply=self.presenter.on_descriptions_changed)
+    
+    def show_batch_edit(self):
+        """Show the batch edit dialog for the selected profiles."""
+        targets = self.presenter.selected_targets(list(self.profile_listbox.curselection()))
+        if not targets:
+            messagebox.showwarning("Warning", "No unit profiles selected.")
+            return
+        
+        parse = self.presenter.eager_parser.get_or_parse if self.presenter.eager_parse else None
+        BatchEditDialog(
+            self.root, self.unit_manager, targets,
+            on_apply=self.presenter.on_descriptions_changed, parse=parse
+        )
+    
+    def show_merge_suggestions(self):
+        """Find units of the active file with near-identical names and offer to merge them."""
+        if not self.unit_manager.units:
+            messagebox.showwarning("Warning", "No data loaded.")
+            return
+        
+        suggestions = self.unit_manager.suggest_merges()
+        if not suggestions:
+            messagebox.showinfo("Merge Similar Units", "No similar unit names found.")
+            return
+        
+        MergeDialog(self.root, self.unit_manager, suggestions, on_apply=self.presenter.on_units_merged)
+    
+    def toggle_eager_parsing(self):
+        """Start or stop parsing every profile in the background."""
+        self.presenter.set_eager_parsing(self.eager_parse_var.get())
+    
+    def eager_parsing_started(self):
+        """Poll background parsing until it finishes."""
+        if self.eager_poll_id is None:
+            self.eager_poll_id = self.root.after(self.EAGER_POLL_INTERVAL, self.poll_eager_parsing)
+    
+    def poll_eager_parsing(self):
+        """Mark units whose profiles finished parsing as ready."""
+        self.eager_poll_id = None
+        if self.presenter.poll_eager_parsing():
+            self.eager_poll_id = self.root.after(self.EAGER_POLL_INTERVAL, self.poll_eager_parsing)
+    
+    def show_unit_indicators(self, pending_rows):
+        """
+        Grey out unit rows that are still being parsed.
+        
+        Args:
+            pending_rows: The rows of units still being parsed
+        """
+        pending = set(pending_rows)
+        for row in range(self.unit_listbox.size()):
+            self.unit_listbox.itemconfig(row, foreground=self.PENDING_UNIT_COLOR if row in pending else "")
+    
+    def select_profile(self, unit_index: int, profile_index: int):
+        """
+        Select a profile of the active file in the unit and profile lists.
+        
+        Args:
+            unit_index: The index of the unit in the active file
+            profile_index: The index of the profile in the unit
+        """
+        self.presenter.select_profile(unit_index, profile_index)
+    
+    def show_performance_panel(self):
+        """Show the performance panel, recording spans while it is open."""
+        if self.performance_panel is not None and self.performance_panel.winfo_exists():
+            self.performance_panel.lift()
+            return
+        
+        self.performance_panel = PerformancePanel(self.root)
+    
+    def show_memory_panel(self):
+        """Show the memory use recorded for each phase, if memory accounting is on."""
+        if not memory.enabled:
+            messagebox.showinfo(
+                "Memory",
+                "Memory accounting is off. Start the editor with --memory-profile "
+                "to record the memory used by loading, editing and saving."
+            )
+            return
+        
+        if self.memory_panel is not None and self.memory_panel.winfo_exists():
+            self.memory_panel.refresh()
+            self.memory_panel.lift()
+            return
+        
+        self.memory_panel = MemoryPanel(self.root)
+    
+    def show_stall_log_panel(self):
+        """Show the event handlers that recently stalled the user interface."""
+        if self.stall_log_panel is not None and self.stall_log_panel.winfo_exists():
+            self.stall_log_panel.refresh()
+            self.stall_log_panel.lift()
+            return
+        
+        self.stall_log_panel = StallLogPanel(self.root)
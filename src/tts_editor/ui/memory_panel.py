@@ -0,0 +1,111 @@
+"""
+Memory panel component for the Warhammer 40k TTS Unit Editor.
+"""
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+
+from ..utils.memory import memory
+
+
+def format_size(size: int) -> str:
+    """Format a signed byte count in KiB."""
+    return f"{size / 1024:+,.1f}"
+
+
+class MemoryPanel(tk.Toplevel):
+    """Window showing the memory left allocated by each phase, by module."""
+
+    COLUMNS = [
+        ("count", "Runs", 60),
+        ("size", "Size (KiB)", 110),
+        ("allocations", "Allocations", 100),
+    ]
+
+    def __init__(self, parent):
+        """
+        Initialize the memory panel.
+
+        Phases are only recorded when the editor is started with
+        --memory-profile or --memory-report.
+
+        Args:
+            parent: The parent widget
+        """
+        super().__init__(parent)
+        self.title("Memory")
+        self.geometry("620x360")
+
+        self.create_widgets()
+        self.refresh()
+
+    def create_widgets(self):
+        """Create the panel widgets."""
+        frame = ttk.Frame(self, padding="5")
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        self.summary_label = ttk.Label(frame)
+        self.summary_label.pack(anchor=tk.W, pady=(0, 5))
+
+        self.tree = ttk.Treeview(
+            frame,
+            columns=[key for key, _, _ in self.COLUMNS],
+            height=12
+        )
+        self.tree.heading("#0", text="Phase / Module")
+        self.tree.column("#0", width=260)
+        for key, heading, width in self.COLUMNS:
+            self.tree.heading(key, text=heading)
+            self.tree.column(key, width=width, anchor=tk.E)
+        self.tree.pack(fill=tk.BOTH, expand=True)
+
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(fill=tk.X, pady=(5, 0))
+
+        ttk.Button(button_frame, text="Refresh", command=self.refresh).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Clear", command=self.clear).pack(side=tk.LEFT, padx=(5, 0))
+        ttk.Button(button_frame, text="Export JSON...", command=self.export_json).pack(side=tk.RIGHT)
+
+    def refresh(self):
+        """Reload the memory report into the table."""
+        self.tree.delete(*self.tree.get_children())
+
+        report = memory.report()
+        self.summary_label.config(
+            text=f"Traced: {report['traced_bytes'] / 1048576:.1f} MiB, "
+                 f"peak: {report['peak_bytes'] / 1048576:.1f} MiB"
+        )
+
+        phases = report["phases"]
+        for name in sorted(phases, key=lambda n: phases[n]["size_bytes"], reverse=True):
+            entry = phases[name]
+            item = self.tree.insert(
+                "", tk.END, text=name, open=True,
+                values=[entry["count"], format_size(entry["size_bytes"]), ""]
+            )
+            for module in entry["modules"]:
+                self.tree.insert(
+                    item, tk.END, text=module["module"],
+                    values=["", format_size(module["size_bytes"]), module["allocations"]]
+                )
+
+    def clear(self):
+        """Remove all recorded phases."""
+        memory.clear()
+        self.refresh()
+
+    def export_json(self):
+        """Export the memory report to a JSON file."""
+        file_path = filedialog.asksaveasfilename(
+            parent=self,
+            title="Export Memory Report",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+            defaultextension=".json"
+        )
+
+        if not file_path:
+            return
+
+        try:
+            memory.export_json(file_path)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to export memory report: {str(e)}", parent=self)
@@ -0,0 +1,82 @@
+"""
+Unit merge suggestions dialog for the Warhammer 40k TTS Unit Editor.
+"""
+import tkinter as tk
+from tkinter import ttk, messagebox
+from typing import Callable, List, Optional
+
+from ..utils.fuzzy_names import MergeSuggestion
+
+
+class MergeDialog(tk.Toplevel):
+    """Dialog listing units with near-identical names, to confirm merging them."""
+
+    def __init__(self, parent, unit_manager, suggestions: List[MergeSuggestion],
+                 on_apply: Optional[Callable] = None):
+        """
+        Initialize the merge dialog.
+
+        Args:
+            parent: The parent widget
+            unit_manager: The unit manager holding the units
+            suggestions: The suggested merges, see UnitManager.suggest_merges
+            on_apply: Optional callback for after units are merged
+        """
+        super().__init__(parent)
+        self.title("Merge Similar Units")
+        self.geometry("600x400")
+        self.unit_manager = unit_manager
+        self.suggestions = suggestions
+        self.on_apply = on_apply
+        self.create_widgets()
+
+    def create_widgets(self):
+        """Create the dialog widgets."""
+        frame = ttk.Frame(self, padding="10")
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        ttk.Label(
+            frame,
+            text=f"{len(self.suggestions)} groups of similar unit names found. "
+                 "Select the merges to apply:"
+        ).pack(anchor=tk.W, pady=(0, 5))
+
+        list_frame = ttk.Frame(frame)
+        list_frame.pack(fill=tk.BOTH, expand=True)
+        scrollbar = ttk.Scrollbar(list_frame)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.listbox = tk.Listbox(
+            list_frame, selectmode=tk.EXTENDED, exportselection=False,
+            yscrollcommand=scrollbar.set
+        )
+        self.listbox.pack(fill=tk.BOTH, expand=True)
+        scrollbar.config(command=self.listbox.yview)
+
+        for suggestion in self.suggestions:
+            self.listbox.insert(
+                tk.END, f"{', '.join(suggestion.sources)}  →  {suggestion.target}"
+            )
+        self.listbox.selection_set(0, tk.END)
+
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(fill=tk.X, pady=(10, 0))
+        ttk.Button(button_frame, text="Close", command=self.destroy).pack(side=tk.RIGHT)
+        ttk.Button(
+            button_frame, text="Merge Selected", command=self.apply
+        ).pack(side=tk.RIGHT, padx=(0, 5))
+
+    def apply(self):
+        """Merge the units of every selected suggestion."""
+        selected = [self.suggestions[index] for index in self.listbox.curselection()]
+        if not selected:
+            messagebox.showwarning("Warning", "No merges selected.", parent=self)
+            return
+
+        merged = 0
+        for suggestion in selected:
+            merged += self.unit_manager.merge_units(suggestion.target, suggestion.sources)
+
+        if merged and self.on_apply:
+            self.on_apply()
+        messagebox.showinfo("Merged", f"{merged} units merged.", parent=self)
+        self.destroy()
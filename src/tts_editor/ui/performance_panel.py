@@ -0,0 +1,106 @@
+"""
+Performance panel component for the Warhammer 40k TTS Unit Editor.
+"""
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+
+from ..utils.profiling import profiler
+
+
+class PerformancePanel(tk.Toplevel):
+    """Window showing statistics for recent profiling spans."""
+
+    COLUMNS = [
+        ("count", "Count", 60),
+        ("total_ms", "Total (ms)", 90),
+        ("mean_ms", "Mean (ms)", 90),
+        ("max_ms", "Max (ms)", 90),
+        ("last_ms", "Last (ms)", 90),
+    ]
+
+    # Refresh interval in milliseconds
+    REFRESH_INTERVAL = 1000
+
+    def __init__(self, parent):
+        """
+        Initialize the performance panel.
+
+        Spans are only recorded while the panel is open.
+
+        Args:
+            parent: The parent widget
+        """
+        super().__init__(parent)
+        self.title("Performance")
+        self.geometry("560x320")
+        self._refresh_job = None
+
+        profiler.enabled = True
+
+        self.create_widgets()
+        self.protocol("WM_DELETE_WINDOW", self.close)
+        self.refresh()
+
+    def create_widgets(self):
+        """Create the panel widgets."""
+        frame = ttk.Frame(self, padding="5")
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        self.tree = ttk.Treeview(
+            frame,
+            columns=[key for key, _, _ in self.COLUMNS],
+            height=10
+        )
+        self.tree.heading("#0", text="Span")
+        self.tree.column("#0", width=160)
+        for key, heading, width in self.COLUMNS:
+            self.tree.heading(key, text=heading)
+            self.tree.column(key, width=width, anchor=tk.E)
+        self.tree.pack(fill=tk.BOTH, expand=True)
+
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(fill=tk.X, pady=(5, 0))
+
+        ttk.Button(button_frame, text="Clear", command=self.clear).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Export JSON...", command=self.export_json).pack(side=tk.RIGHT)
+
+    def refresh(self):
+        """Reload the span statistics into the table."""
+        self.tree.delete(*self.tree.get_children())
+
+        stats = profiler.statistics()
+        for name in sorted(stats, key=lambda n: stats[n]["total_ms"], reverse=True):
+            entry = stats[name]
+            values = [entry["count"]]
+            values.extend(f"{entry[key]:.2f}" for key, _, _ in self.COLUMNS[1:])
+            self.tree.insert("", tk.END, text=name, values=values)
+
+        self._refresh_job = self.after(self.REFRESH_INTERVAL, self.refresh)
+
+    def clear(self):
+        """Remove all recorded spans."""
+        profiler.clear()
+
+    def export_json(self):
+        """Export the recorded spans to a JSON file."""
+        file_path = filedialog.asksaveasfilename(
+            parent=self,
+            title="Export Performance Spans",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+            defaultextension=".json"
+        )
+
+        if not file_path:
+            return
+
+        try:
+            profiler.export_json(file_path)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to export spans: {str(e)}", parent=self)
+
+    def close(self):
+        """Stop recording and close the panel."""
+        if self._refresh_job is not None:
+            self.after_cancel(self._refresh_job)
+        profiler.enabled = False
+        self.destroy()
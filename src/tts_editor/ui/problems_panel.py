@@ -0,0 +1,69 @@
+"""
+Problems panel component for the Warhammer 40k TTS Unit Editor.
+"""
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..utils.description_linter import LintIssue
+
+
+class ProblemsPanel(ttk.LabelFrame):
+    """Panel listing description problems found by the linter."""
+
+    def __init__(self, parent, on_select: Optional[Callable[[int, int], None]] = None):
+        """
+        Initialize the problems panel.
+
+        Args:
+            parent: The parent widget
+            on_select: Optional callback taking (unit index, profile index) when a
+                problem is chosen
+        """
+        super().__init__(parent, text="Problems", padding="5")
+        self.on_select = on_select
+        self.rows: Dict[str, Tuple[int, int]] = {}
+        self.create_widgets()
+
+    def create_widgets(self):
+        """Create the panel widgets."""
+        self.tree = ttk.Treeview(self, columns=("line",), height=5)
+        self.tree.heading("#0", text="Problem")
+        self.tree.heading("line", text="Line")
+        self.tree.column("#0", width=190)
+        self.tree.column("line", width=40, anchor=tk.E)
+        self.tree.pack(fill=tk.BOTH, expand=True)
+        self.tree.bind('<<TreeviewSelect>>', self._on_tree_select)
+
+    def show(self, unit_manager, results: Dict[Tuple[int, int], List[LintIssue]]):
+        """
+        Show lint results grouped by profile.
+
+        Args:
+            unit_manager: The unit manager the results belong to
+            results: The problems keyed by (unit index, profile index)
+        """
+        self.tree.delete(*self.tree.get_children())
+        self.rows = {}
+
+        for key in sorted(results):
+            unit_index, profile_index = key
+            unit = unit_manager.units[unit_index]
+            profile = unit.profiles[profile_index]
+            parent = self.tree.insert(
+                "", tk.END, text=f"{unit.name} / {profile.name}", open=True
+            )
+            self.rows[parent] = key
+            for issue in results[key]:
+                item = self.tree.insert(
+                    parent, tk.END, text=issue.message, values=(issue.line or "",)
+                )
+                self.rows[item] = key
+
+        self.config(text=f"Problems ({sum(len(issues) for issues in results.values())})")
+
+    def _on_tree_select(self, event):
+        """Select the profile of the chosen problem."""
+        selection = self.tree.selection()
+        if selection and self.on_select and selection[0] in self.rows:
+            self.on_select(*self.rows[selection[0]])
@@ -0,0 +1,135 @@
+"""
+Search across catalogued saves for the Warhammer 40k TTS Unit Editor.
+"""
+import os
+import time
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable
+
+from ..utils.save_catalog import KIND_NAMES, SaveCatalog
+
+
+class SearchDialog(tk.Toplevel):
+    """Dialog searching every catalogued save for unit, weapon and ability names."""
+
+    COLUMNS = [
+        ("profile", "Profile", 110),
+        ("matches", "Matches", 260),
+        ("save", "Save", 160),
+        ("file", "File", 200),
+    ]
+
+    # Maximum number of results shown
+    LIMIT = 200
+
+    def __init__(self, parent, catalog: SaveCatalog, on_open: Callable[[str, str], None]):
+        """
+        Initialize the search dialog.
+
+        Args:
+            parent: The parent widget
+            catalog: The catalog to search
+            on_open: Callback with the save path and model GUID of a clicked result
+        """
+        super().__init__(parent)
+        self.title("Search Saves")
+        self.geometry("900x480")
+        self.catalog = catalog
+        self.on_open = on_open
+        self.results = {}  # Tree item -> SearchResult
+
+        self.query_var = tk.StringVar()
+        self.status_var = tk.StringVar()
+
+        self.create_widgets()
+        self.show_results()
+
+    def create_widgets(self):
+        """Create the dialog widgets."""
+        frame = ttk.Frame(self, padding="10")
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        query_frame = ttk.Frame(frame)
+        query_frame.pack(fill=tk.X, pady=(0, 5))
+        ttk.Label(query_frame, text="Unit, weapon or ability:").pack(side=tk.LEFT)
+        query_entry = ttk.Entry(query_frame, textvariable=self.query_var)
+        query_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 0))
+        query_entry.bind("<KeyRelease>", lambda event: self.show_results())
+        query_entry.bind("<Return>", lambda event: self.open_selected())
+        query_entry.bind("<Down>", self.focus_results)
+        query_entry.focus_set()
+
+        tree_frame = ttk.Frame(frame)
+        tree_frame.pack(fill=tk.BOTH, expand=True)
+        self.tree = ttk.Treeview(
+            tree_frame,
+            columns=[key for key, _, _ in self.COLUMNS],
+            selectmode=tk.BROWSE
+        )
+        self.tree.heading("#0", text="Unit")
+        self.tree.column("#0", width=200)
+        for key, heading, width in self.COLUMNS:
+            self.tree.heading(key, text=heading)
+            self.tree.column(key, width=width)
+        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.bind("<ButtonRelease-1>", lambda event: self.open_selected())
+        self.tree.bind("<Return>", lambda event: self.open_selected())
+
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(fill=tk.X, pady=(5, 0))
+        ttk.Label(button_frame, textvariable=self.status_var).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Close", command=self.destroy).pack(side=tk.RIGHT)
+
+    def show_results(self):
+        """Search for the query and list the results, best first."""
+        self.tree.delete(*self.tree.get_children())
+        self.results = {}
+
+        query = self.query_var.get().strip()
+        if not query:
+            self.status_var.set("Type a unit, weapon or ability name to search every catalogued save.")
+            return
+
+        start = time.perf_counter()
+        results = self.catalog.search(query, self.LIMIT)
+        elapsed = time.perf_counter() - start
+
+        for result in results:
+            item = self.tree.insert(
+                "", tk.END, text=result.unit_name,
+                values=[
+                    result.profile_name,
+                    ", ".join(f"{KIND_NAMES[kind]}: {text}" for kind, text in result.matches),
+                    result.save_name,
+                    os.path.basename(result.path),
+                ]
+            )
+            self.results[item] = result
+
+        more = "+" if len(results) == self.LIMIT else ""
+        self.status_var.set(f"{len(results)}{more} results in {elapsed * 1000:.1f} ms")
+
+    def focus_results(self, event):
+        """Move from the query to the first result."""
+        children = self.tree.get_children()
+        if children:
+            self.tree.focus_set()
+            self.tree.focus(children[0])
+            self.tree.selection_set(children[0])
+        return "break"
+
+    def open_selected(self):
+        """Open the save of the selected result with its profile selected."""
+        selection = self.tree.selection()
+        if not selection:
+            children = self.tree.get_children()
+            if not children:
+                return
+            selection = children[:1]
+
+        result = self.results[selection[0]]
+        self.on_open(result.path, result.guid)
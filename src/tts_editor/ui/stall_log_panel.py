@@ -0,0 +1,105 @@
+"""
+Stall log panel component for the Warhammer 40k TTS Unit Editor.
+"""
+import time
+import tkinter as tk
+from tkinter import ttk
+
+from ..utils.watchdog import watchdog
+
+
+class StallLogPanel(tk.Toplevel):
+    """Window listing recent event loop stalls and where they happened."""
+
+    COLUMNS = [
+        ("time", "Time", 80),
+        ("duration", "Duration (ms)", 100),
+    ]
+
+    def __init__(self, parent):
+        """
+        Initialize the stall log panel.
+
+        Args:
+            parent: The parent widget
+        """
+        super().__init__(parent)
+        self.title("Stall Log")
+        self.geometry("720x480")
+        self.shown_stalls = []
+
+        self.create_widgets()
+        self.refresh()
+
+    def create_widgets(self):
+        """Create the panel widgets."""
+        frame = ttk.Frame(self, padding="5")
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        log_text = (
+            f"Log file: {watchdog.log_path}" if watchdog.log_path else "Not writing a log file"
+        )
+        ttk.Label(
+            frame,
+            text=f"Handlers and event loop delays over {watchdog.threshold * 1000:.0f} ms. {log_text}",
+            wraplength=700
+        ).pack(anchor=tk.W, pady=(0, 5))
+
+        paned = ttk.PanedWindow(frame, orient=tk.VERTICAL)
+        paned.pack(fill=tk.BOTH, expand=True)
+
+        self.tree = ttk.Treeview(
+            paned,
+            columns=[key for key, _, _ in self.COLUMNS],
+            height=8,
+            selectmode=tk.BROWSE
+        )
+        self.tree.heading("#0", text="Handler")
+        self.tree.column("#0", width=480)
+        for key, heading, width in self.COLUMNS:
+            self.tree.heading(key, text=heading)
+            self.tree.column(key, width=width, anchor=tk.E)
+        self.tree.bind("<<TreeviewSelect>>", self.on_select)
+        paned.add(self.tree, weight=1)
+
+        self.stack_text = tk.Text(paned, height=12, wrap=tk.NONE, font=("Courier", 9))
+        self.stack_text.config(state=tk.DISABLED)
+        paned.add(self.stack_text, weight=1)
+
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(fill=tk.X, pady=(5, 0))
+
+        ttk.Button(button_frame, text="Refresh", command=self.refresh).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Clear", command=self.clear).pack(side=tk.LEFT, padx=(5, 0))
+
+    def refresh(self):
+        """Reload the recent stalls, newest first."""
+        self.tree.delete(*self.tree.get_children())
+        self.shown_stalls = list(reversed(watchdog.stalls))
+        for index, stall in enumerate(self.shown_stalls):
+            self.tree.insert(
+                "", tk.END, iid=str(index), text=stall["name"],
+                values=[
+                    time.strftime("%H:%M:%S", time.localtime(stall["time"])),
+                    f"{stall['duration_ms']:.0f}",
+                ]
+            )
+        self.show_stack("")
+
+    def on_select(self, event):
+        """Show the stack of the selected stall."""
+        selection = self.tree.selection()
+        if selection:
+            self.show_stack("".join(self.shown_stalls[int(selection[0])]["stack"]))
+
+    def show_stack(self, text: str):
+        """Replace the stack shown below the list."""
+        self.stack_text.config(state=tk.NORMAL)
+        self.stack_text.delete("1.0", tk.END)
+        self.stack_text.insert("1.0", text)
+        self.stack_text.config(state=tk.DISABLED)
+
+    def clear(self):
+        """Remove the recent stalls; the log file is kept."""
+        watchdog.clear()
+        self.refresh()
@@ -3,27 +3,44 @@ Structured editor component for the Warhammer 40k TTS Unit Editor.
 """
 import tkinter as tk
 from tkinter import ttk
-from typing import Dict, List, Callable, Optional, Any
+from typing import List, Callable, Optional, Any
 
-from tts_editor.utils import description_parser
+from tts_editor.models.profile_fields import Ability, MeleeWeapon, RangedWeapon, StatLine
+from tts_editor.presenters.structured import StructuredPresenter
+from tts_editor.ui.autocomplete import Autocomplete
+from tts_editor.ui.weapon_table import WeaponTable
 
 
 class StructuredEditor(ttk.Frame):
     """Structured editor component for editing unit descriptions."""
     
-    def __init__(self, parent, on_generate: Optional[Callable] = None):
+    # (field, heading, width in characters) of the weapon table columns
+    RANGED_COLUMNS = [
+        ("name", "Name", 20), ("range", "Range", 5), ("A", "A", 3), ("BS", "BS", 4),
+        ("S", "S", 3), ("AP", "AP", 4), ("D", "D", 4), ("abilities", "Abilities", 15)
+    ]
+    MELEE_COLUMNS = [
+        ("name", "Name", 20), ("A", "A", 3), ("WS", "WS", 4), ("S", "S", 3),
+        ("AP", "AP", 4), ("D", "D", 4), ("abilities", "Abilities", 15)
+    ]
+    
+    def __init__(self, parent, on_generate: Optional[Callable] = None,
+                 presenter: Optional[StructuredPresenter] = None):
         """
         Initialize the structured editor.
         
         Args:
             parent: The parent widget
             on_generate: Optional callback for when description is generated
+            presenter: Optional presenter holding the editor's state; a new
+                one is created if not given
         """
         super().__init__(parent)
         self.on_generate = on_generate
+        self.presenter = presenter or StructuredPresenter()
         self.stat_entries = {}
-        self.ranged_weapons_frame = None
-        self.melee_weapons_frame = None
+        self.ranged_table = None
+        self.melee_table = None
         self.abilities_text = None
         self.create_widgets()
     
@@ -66,26 +83,26 @@ class StructuredEditor(ttk.Frame):
         ranged_frame = ttk.LabelFrame(self.structured_frame, text="Ranged Weapons", padding="5")
         ranged_frame.pack(fill=tk.X, pady=(0, 5))
         
-        self.ranged_weapons_frame = ttk.Frame(ranged_frame)
-        self.ranged_weapons_frame.pack(fill=tk.X)
+        self.ranged_table = WeaponTable(ranged_frame, RangedWeapon, self.RANGED_COLUMNS)
+        self.ranged_table.pack(fill=tk.X)
         
         ttk.Button(
             ranged_frame, 
             text="Add Ranged Weapon", 
-            command=lambda: self.add_weapon_row(self.ranged_weapons_frame, "ranged")
+            command=self.ranged_table.add_row
         ).pack(anchor=tk.W, pady=(5, 0))
         
         # Melee Weapons section
         melee_frame = ttk.LabelFrame(self.structured_frame, text="Melee Weapons", padding="5")
         melee_frame.pack(fill=tk.X, pady=(0, 5))
         
-        self.melee_weapons_frame = ttk.Frame(melee_frame)
-        self.melee_weapons_frame.pack(fill=tk.X)
+        self.melee_table = WeaponTable(melee_frame, MeleeWeapon, self.MELEE_COLUMNS)
+        self.melee_table.pack(fill=tk.X)
         
         ttk.Button(
             melee_frame, 
             text="Add Melee Weapon", 
-            command=lambda: self.add_weapon_row(self.melee_weapons_frame, "melee")
+            command=self.melee_table.add_row
         ).pack(anchor=tk.W, pady=(5, 0))
         
         # Abilities section
@@ -94,6 +111,9 @@ class StructuredEditor(ttk.Frame):
         
         self.abilities_text = tk.Text(abilities_frame, wrap=tk.WORD, height=6)
         self.abilities_text.pack(fill=tk.X)
+        Autocomplete(self.abilities_text, self.presenter.complete_ability)
+        self.ranged_table.completer = self.presenter.complete_weapon_field
+        self.melee_table.completer = self.presenter.complete_weapon_field
         
         # Button to update text editor from structured editor
         ttk.Button(
@@ -102,236 +122,117 @@ class StructuredEditor(ttk.Frame):
             command=self.generate_description
         ).pack(pady=10)
     
-    def add_weapon_row(self, parent, weapon_type):
-        """
-        Add a new weapon row to the specified weapon frame.
-        
-        Args:
-            parent: The parent frame to add the row to
-            weapon_type: The type of weapon ("ranged" or "melee")
-        """
-        row_frame = ttk.Frame(parent)
-        row_frame.pack(fill=tk.X, pady=(2, 0))
-        
-        # Weapon name
-        ttk.Label(row_frame, text="Name:").pack(side=tk.LEFT, padx=(0, 2))
-        name_entry = ttk.Entry(row_frame, width=20)
-        name_entry.pack(side=tk.LEFT, padx=(0, 5))
-        
-        # Common weapon stats
-        stats = []
-        
-        if weapon_type == "ranged":
-            stats = [
-                {"label": "Range:", "width": 5},
-                {"label": "A:", "width": 3},
-                {"label": "BS:", "width": 4},
-                {"label": "S:", "width": 3},
-                {"label": "AP:", "width": 4},
-                {"label": "D:", "width": 4},
-                {"label": "Abilities:", "width": 15}
-            ]
-        else:  # melee
-            stats = [
-                {"label": "A:", "width": 3},
-                {"label": "WS:", "width": 4},
-                {"label": "S:", "width": 3},
-                {"label": "AP:", "width": 4},
-                {"label": "D:", "width": 4},
-                {"label": "Abilities:", "width": 15}
-            ]
-        
-        entries = []
-        for stat in stats:
-            ttk.Label(row_frame, text=stat["label"]).pack(side=tk.LEFT, padx=(0, 2))
-            entry = ttk.Entry(row_frame, width=stat["width"])
-            entry.pack(side=tk.LEFT, padx=(0, 5))
-            entries.append(entry)
-        
-        # Delete button
-        ttk.Button(
-            row_frame, 
-            text="X", 
-            width=2,
-            command=lambda: row_frame.destroy()
-        ).pack(side=tk.LEFT)
-        
-        # Store the row data
-        row_data = {
-            "name": name_entry,
-            "entries": entries,
-            "type": weapon_type
-        }
-        
-        # Attach the data to the frame for later retrieval
-        row_frame.data = row_data
-    
     def clear(self):
         """Clear all fields."""
+        self.clear_fields()
+        self.presenter.clear()
+    
+    def clear_fields(self):
+        """Clear the field widgets."""
         # Clear stat entries
         for entry in self.stat_entries.values():
             entry.delete(0, tk.END)
         
-        # Clear weapon rows
-        for child in self.ranged_weapons_frame.winfo_children():
-            child.destroy()
-        for child in self.melee_weapons_frame.winfo_children():
-            child.destroy()
+        # Clear weapon tables
+        self.ranged_table.clear()
+        self.melee_table.clear()
         
         # Clear abilities text
         self.abilities_text.delete(1.0, tk.END)
     
-    
-    def populate_from_description(self, description: str):
+    def show_fields(self, fields: tuple):
         """
-        Populate the structured editor from a description.
+        Fill the editor fields.
         
         Args:
-            description: The description text to parse
+            fields: The (stats, ranged weapons, melee weapons, abilities) to show
         """
-        # Clear existing data
-        self.clear()
-        
-        # Parse the description
-        sections = description_parser.parse_description(description)
-        
-        # Extract and populate stats
-        stats = description_parser.extract_stats(sections["stats"])
-        for key, value in stats.items():
-            if key in self.stat_entries:
-                self.stat_entries[key].insert(0, value)
-        
-        # Extract and populate ranged weapons
-        ranged_weapons = description_parser.extract_weapons(sections["ranged"], "ranged")
-        for weapon in ranged_weapons:
-            self.add_weapon_row(self.ranged_weapons_frame, "ranged")
-            row_frame = self.ranged_weapons_frame.winfo_children()[-1]
-            row_frame.data["name"].insert(0, weapon["name"])
-            
-            entries = row_frame.data["entries"]
-            if len(entries) >= 7:
-                entries[0].insert(0, weapon.get("range", ""))
-                entries[1].insert(0, weapon.get("A", ""))
-                entries[2].insert(0, weapon.get("BS", ""))
-                entries[3].insert(0, weapon.get("S", ""))
-                entries[4].insert(0, weapon.get("AP", ""))
-                entries[5].insert(0, weapon.get("D", ""))
-                entries[6].insert(0, weapon.get("abilities", ""))
-        
-        # Extract and populate melee weapons
-        melee_weapons = description_parser.extract_weapons(sections["melee"], "melee")
-        for weapon in melee_weapons:
-            self.add_weapon_row(self.melee_weapons_frame, "melee")
-            row_frame = self.melee_weapons_frame.winfo_children()[-1]
-            row_frame.data["name"].insert(0, weapon["name"])
-            
-            entries = row_frame.data["entries"]
-            if len(entries) >= 6:
-                entries[0].insert(0, weapon.get("A", ""))
-                entries[1].insert(0, weapon.get("WS", ""))
-                entries[2].insert(0, weapon.get("S", ""))
-                entries[3].insert(0, weapon.get("AP", ""))
-                entries[4].insert(0, weapon.get("D", ""))
-                entries[5].insert(0, weapon.get("abilities", ""))
-        
-        # Extract and populate abilities
-        abilities = description_parser.extract_abilities(sections["abilities"])
+        stats, ranged_weapons, melee_weapons, abilities = fields
+        self.clear_fields()
+        
+        # Populate stats
+        for key in StatLine.FIELDS:
+            self.stat_entries[key].insert(0, getattr(stats, key))
+        
+        # Populate weapons
+        self.ranged_table.set_weapons(ranged_weapons)
+        self.melee_table.set_weapons(melee_weapons)
+        
+        # Populate abilities
         for ability in abilities:
-            self.abilities_text.insert(tk.END, ability + "\n")
+            self.abilities_text.insert(tk.END, ability.text + "\n")
     
-    def get_stats(self) -> Dict[str, str]:
+    def get_stats(self) -> StatLine:
         """
         Get the stats from the editor.
         
         Returns:
-            A dictionary of stat values
+            The stat line
         """
-        stats = {}
-        for key, entry in self.stat_entries.items():
-            stats[key] = entry.get()
-        return stats
+        return StatLine(*(self.stat_entries[key].get() for key in StatLine.FIELDS))
     
-    def get_ranged_weapons(self) -> List[Dict[str, str]]:
+    def get_ranged_weapons(self) -> List[RangedWeapon]:
         """
         Get the ranged weapons from the editor.
         
         Returns:
-            A list of ranged weapon dictionaries
+            The ranged weapons
         """
-        weapons = []
-        for child in self.ranged_weapons_frame.winfo_children():
-            if hasattr(child, 'data'):
-                data = child.data
-                weapon = {"name": data["name"].get()}
-                
-                entries = data["entries"]
-                if len(entries) >= 7:
-                    weapon["range"] = entries[0].get()
-                    weapon["A"] = entries[1].get()
-                    weapon["BS"] = entries[2].get()
-                    weapon["S"] = entries[3].get()
-                    weapon["AP"] = entries[4].get()
-                    weapon["D"] = entries[5].get()
-                    weapon["abilities"] = entries[6].get()
-                
-                weapons.append(weapon)
-        
-        return weapons
+        return self.ranged_table.get_weapons()
     
-    def get_melee_weapons(self) -> List[Dict[str, str]]:
+    def get_melee_weapons(self) -> List[MeleeWeapon]:
         """
         Get the melee weapons from the editor.
         
         Returns:
-            A list of melee weapon dictionaries
+            The melee weapons
         """
-        weapons = []
-        for child in self.melee_weapons_frame.winfo_children():
-            if hasattr(child, 'data'):
-                data = child.data
-                weapon = {"name": data["name"].get()}
-                
-                entries = data["entries"]
-                if len(entries) >= 6:
-                    weapon["A"] = entries[0].get()
-                    weapon["WS"] = entries[1].get()
-                    weapon["S"] = entries[2].get()
-                    weapon["AP"] = entries[3].get()
-                    weapon["D"] = entries[4].get()
-                    weapon["abilities"] = entries[5].get()
-                
-                weapons.append(weapon)
-        
-        return weapons
+        return self.melee_table.get_weapons()
     
-    def get_abilities(self) -> List[str]:
+    def get_abilities(self) -> List[Ability]:
         """
         Get the abilities from the editor.
         
         Returns:
-            A list of ability strings
+            The abilities, one per non-empty line
         """
         abilities_text = self.abilities_text.get(1.0, tk.END).strip()
         if not abilities_text:
             return []
         
-        return [line.strip() for line in abilities_text.split('\n') if line.strip()]
+        return [Ability(line.strip()) for line in abilities_text.split('\n') if line.strip()]
+    
+    def get_fields(self) -> tuple:
+        """
+        Get every field from the editor.
+        
+        Returns:
+            A (stats, ranged weapons, melee weapons, abilities) tuple, comparable
+            with description_parser.parse_profile results
+        """
+        return (self.get_stats(), self.get_ranged_weapons(),
+                self.get_melee_weapons(), self.get_abilities())
+    
+    def is_modified(self) -> bool:
+        """
+        Check whether the fields differ from the description they were filled from.
+        
+        Returns:
+            True if any field was changed, or nothing was loaded
+        """
+        return self.presenter.is_modified(self.get_fields())
     
     def generate_description(self) -> str:
         """
         Generate a description from the editor fields.
         
+        If no field was changed the loaded description is kept as it is,
+        without regenerating it.
+        
         Returns:
             The generated description
         """
-        stats = self.get_stats()
-        ranged_weapons = self.get_ranged_weapons()
-        melee_weapons = self.get_melee_weapons()
-        abilities = self.get_abilities()
-        
-        description = description_parser.generate_description(
-            stats, ranged_weapons, melee_weapons, abilities
-        )
+        description = self.presenter.generate(self.get_fields())
         
         if self.on_generate:
             self.on_generate(description)
@@ -5,6 +5,9 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Callable, Optional
 
+from ..utils import vocabulary
+from .autocomplete import Autocomplete
+
 
 class TextEditor(ttk.Frame):
     """Text editor component for editing unit descriptions."""
@@ -19,6 +22,7 @@ class TextEditor(ttk.Frame):
         """
         super().__init__(parent)
         self.on_text_change = on_text_change
+        self.vocabulary = None  # Optional Vocabulary to suggest weapon names, keywords and abilities from
         self.create_widgets()
     
     def create_widgets(self):
@@ -33,6 +37,7 @@ class TextEditor(ttk.Frame):
         self.description_text = tk.Text(text_frame, wrap=tk.WORD, yscrollcommand=scrollbar.set)
         self.description_text.pack(fill=tk.BOTH, expand=True)
         scrollbar.config(command=self.description_text.yview)
+        Autocomplete(self.description_text, self.complete)
         
         # Bind text change event
         if self.on_text_change:
@@ -45,6 +50,27 @@ class TextEditor(ttk.Frame):
                 self.on_text_change()
             self.description_text.edit_modified(False)
     
+    def complete(self, line: str):
+        """
+        Get suggestions for what is being typed at the cursor.
+        
+        Args:
+            line: The cursor's line up to the cursor
+            
+        Returns:
+            The (prefix, suggestions) at the cursor
+        """
+        if self.vocabulary is None:
+            return "", []
+        in_abilities = vocabulary.in_abilities_section(
+            self.description_text.get(1.0, "insert linestart")
+        )
+        context = vocabulary.completion_context(line, in_abilities)
+        if context is None:
+            return "", []
+        category, prefix = context
+        return prefix, self.vocabulary.complete(category, prefix)
+    
     def get_text(self) -> str:
         """
         Get the current text content.
@@ -0,0 +1,280 @@
+"""
+Virtualized weapon table for the Warhammer 40k TTS Unit Editor.
+"""
+import tkinter as tk
+import tkinter.font as tkfont
+from tkinter import ttk
+from typing import Callable, List, Optional, Sequence, Tuple, Type
+
+from ..models.profile_fields import Record
+from .autocomplete import Autocomplete
+
+
+class WeaponTable(ttk.Frame):
+    """
+    Table of weapons drawn on a canvas.
+
+    Only a fixed number of rows is drawn: scrolling rebinds the drawn rows to
+    other weapons instead of creating widgets, and a single entry is moved
+    over a cell to edit it. Widget count and layout cost stay the same no
+    matter how many weapons a profile has.
+    """
+
+    DELETE_MARK = "✕"
+
+    def __init__(self, parent, weapon_class: Type[Record], columns: Sequence[Tuple[str, str, int]],
+                 visible_rows: int = 6):
+        """
+        Initialize the weapon table.
+
+        Args:
+            parent: The parent widget
+            weapon_class: The weapon model class, RangedWeapon or MeleeWeapon
+            columns: A (field, heading, width in characters) tuple per column,
+                covering every field of weapon_class in order
+            visible_rows: The number of rows drawn at once
+        """
+        super().__init__(parent)
+        self.weapon_class = weapon_class
+        self.columns = list(columns)
+        self.visible_rows = visible_rows
+        self.rows: List[List[str]] = []
+        self.top = 0  # Index of the first drawn row
+        self.editing: Optional[Tuple[int, int]] = None  # (row, column) of the open cell editor
+        # Optional function giving the (prefix, suggestions) for a field and the text before the cursor
+        self.completer: Optional[Callable[[str, str], Tuple[str, List[str]]]] = None
+
+        font = tkfont.nametofont("TkDefaultFont")
+        char_width = font.measure("0")
+        self.row_height = font.metrics("linespace") + 6
+        self.column_x = [0]
+        for _, _, width in self.columns:
+            self.column_x.append(self.column_x[-1] + width * char_width + 8)
+        self.delete_width = char_width * 2 + 8
+
+        self.create_widgets()
+
+    def create_widgets(self):
+        """Create the canvas, the drawn cells and the cell editor."""
+        width = self.column_x[-1] + self.delete_width
+        height = self.row_height * (self.visible_rows + 1)
+
+        self.canvas = tk.Canvas(self, width=width, height=height, highlightthickness=0,
+                                background="white")
+        self.canvas.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # Header
+        self.canvas.create_rectangle(0, 0, width, self.row_height, fill="#e8e8e8", outline="")
+        for (field, heading, _), x in zip(self.columns, self.column_x):
+            self.canvas.create_text(x + 4, self.row_height // 2, text=heading, anchor=tk.W)
+
+        # A fixed grid of cell items, rebound to rows on every redraw
+        self.cell_items: List[List[int]] = []
+        self.delete_items: List[int] = []
+        for slot in range(self.visible_rows):
+            y = self.row_height * (slot + 1)
+            self.canvas.create_line(0, y, width, y, fill="#d0d0d0")
+            self.cell_items.append([
+                self.canvas.create_text(x + 4, y + self.row_height // 2, text="", anchor=tk.W)
+                for x in self.column_x[:-1]
+            ])
+            self.delete_items.append(self.canvas.create_text(
+                self.column_x[-1] + self.delete_width // 2, y + self.row_height // 2, text=""
+            ))
+        for x in self.column_x[1:]:
+            self.canvas.create_line(x, 0, x, height, fill="#d0d0d0")
+
+        self.editor = ttk.Entry(self.canvas)
+        self.editor_window = self.canvas.create_window(0, 0, window=self.editor, anchor=tk.NW,
+                                                       state=tk.HIDDEN)
+        # The popup's key bindings come first, so they can stop the editor's own
+        self.autocomplete = Autocomplete(self.editor, self._complete)
+        self.editor.bind("<Return>", lambda event: self.commit_edit(), add="+")
+        self.editor.bind("<Tab>", self._on_tab, add="+")
+        self.editor.bind("<Escape>", lambda event: self.cancel_edit(), add="+")
+        self.editor.bind("<FocusOut>", lambda event: self.commit_edit(), add="+")
+
+        self.canvas.bind("<Button-1>", self._on_click)
+        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
+        self.canvas.bind("<Button-4>", lambda event: self.yview("scroll", -1, "units"))
+        self.canvas.bind("<Button-5>", lambda event: self.yview("scroll", 1, "units"))
+
+    def redraw(self):
+        """Bind the drawn rows to the rows currently scrolled into view."""
+        for slot in range(self.visible_rows):
+            row_index = self.top + slot
+            values = self.rows[row_index] if row_index < len(self.rows) else None
+            for column, item in enumerate(self.cell_items[slot]):
+                text = values[column] if values else ""
+                self.canvas.itemconfig(item, text=self._clip(text, column))
+            self.canvas.itemconfig(self.delete_items[slot], text=self.DELETE_MARK if values else "")
+
+        if self.rows:
+            first = self.top / len(self.rows)
+            last = min(self.top + self.visible_rows, len(self.rows)) / len(self.rows)
+        else:
+            first, last = 0.0, 1.0
+        self.scrollbar.set(first, last)
+
+    def _clip(self, text: str, column: int) -> str:
+        """Shorten a value to the width of its column."""
+        max_chars = self.columns[column][2]
+        return text if len(text) <= max_chars else text[:max_chars - 1] + "…"
+
+    def yview(self, *args):
+        """
+        Scroll the table; the command of the scrollbar.
+
+        Args:
+            *args: ("moveto", fraction) or ("scroll", amount, "units" or "pages")
+        """
+        self.commit_edit()
+        max_top = max(len(self.rows) - self.visible_rows, 0)
+        if args and args[0] == "moveto":
+            top = int(round(float(args[1]) * len(self.rows)))
+        elif args and args[0] == "scroll":
+            step = self.visible_rows if args[2] == "pages" else 1
+            top = self.top + int(args[1]) * step
+        else:
+            return
+        top = min(max(top, 0), max_top)
+        if top != self.top:
+            self.top = top
+            self.redraw()
+
+    def _complete(self, line: str) -> Tuple[str, List[str]]:
+        """Get suggestions for the cell being edited from the completer."""
+        if self.completer is None or self.editing is None:
+            return "", []
+        return self.completer(self.columns[self.editing[1]][0], line)
+
+    def _on_mousewheel(self, event):
+        """Scroll with the mouse wheel."""
+        self.yview("scroll", -1 if event.delta > 0 else 1, "units")
+
+    def _cell_at(self, x: int, y: int) -> Tuple[Optional[int], Optional[int]]:
+        """Get the (row, column) under a canvas position; column is len(columns) for delete."""
+        slot = y // self.row_height - 1
+        if slot < 0 or slot >= self.visible_rows or self.top + slot >= len(self.rows):
+            return None, None
+        for column in range(len(self.columns)):
+            if self.column_x[column] <= x < self.column_x[column + 1]:
+                return self.top + slot, column
+        return self.top + slot, len(self.columns)
+
+    def _on_click(self, event):
+        """Edit the clicked cell, or delete the clicked row."""
+        row, column = self._cell_at(event.x, event.y)
+        self.commit_edit()
+        if row is None:
+            return
+        if column == len(self.columns):
+            self.delete_row(row)
+        else:
+            self.edit_cell(row, column)
+
+    def _on_tab(self, event):
+        """Move the cell editor to the next cell."""
+        if self.editing is None:
+            return "break"
+        row, column = self.editing
+        self.commit_edit()
+        column += 1
+        if column == len(self.columns):
+            row, column = row + 1, 0
+        if row < len(self.rows):
+            self.edit_cell(row, column)
+        return "break"
+
+    def edit_cell(self, row: int, column: int):
+        """
+        Open the cell editor over a cell, scrolling it into view.
+
+        Args:
+            row: The row index
+            column: The column index
+        """
+        if row < self.top:
+            self.top = row
+            self.redraw()
+        elif row >= self.top + self.visible_rows:
+            self.top = row - self.visible_rows + 1
+            self.redraw()
+
+        y = self.row_height * (row - self.top + 1)
+        self.canvas.coords(self.editor_window, self.column_x[column], y)
+        self.canvas.itemconfig(
+            self.editor_window, state=tk.NORMAL,
+            width=self.column_x[column + 1] - self.column_x[column], height=self.row_height
+        )
+        self.editor.delete(0, tk.END)
+        self.editor.insert(0, self.rows[row][column])
+        self.editor.select_range(0, tk.END)
+        self.editor.focus_set()
+        self.editing = (row, column)
+
+    def commit_edit(self):
+        """Store the cell editor's value and hide it."""
+        if self.editing is None:
+            return
+        row, column = self.editing
+        self.editing = None
+        self.canvas.itemconfig(self.editor_window, state=tk.HIDDEN)
+        if row < len(self.rows):
+            self.rows[row][column] = self.editor.get()
+            self.redraw()
+
+    def cancel_edit(self):
+        """Hide the cell editor without storing its value."""
+        self.editing = None
+        self.canvas.itemconfig(self.editor_window, state=tk.HIDDEN)
+
+    def add_row(self):
+        """Add an empty weapon and start editing its name."""
+        self.commit_edit()
+        self.rows.append([""] * len(self.columns))
+        self.redraw()
+        self.edit_cell(len(self.rows) - 1, 0)
+
+    def delete_row(self, row: int):
+        """
+        Delete a weapon.
+
+        Args:
+            row: The row index
+        """
+        self.cancel_edit()
+        del self.rows[row]
+        self.top = min(self.top, max(len(self.rows) - self.visible_rows, 0))
+        self.redraw()
+
+    def clear(self):
+        """Remove every weapon."""
+        self.cancel_edit()
+        self.rows = []
+        self.top = 0
+        self.redraw()
+
+    def set_weapons(self, weapons: Sequence[Record]):
+        """
+        Show a list of weapons.
+
+        Args:
+            weapons: The weapons, instances of weapon_class
+        """
+        self.cancel_edit()
+        self.rows = [list(weapon.astuple()) for weapon in weapons]
+        self.top = 0
+        self.redraw()
+
+    def get_weapons(self) -> List[Record]:
+        """
+        Get the weapons in the table, including an edit in progress.
+
+        Returns:
+            The weapons, instances of weapon_class
+        """
+        self.commit_edit()
+        return [self.weapon_class(*row) for row in self.rows]
@@ -3,8 +3,182 @@ Color formatting utilities for the Warhammer 40k TTS Unit Editor.
 """
 import re
 import tkinter as tk
+from array import array
+from collections import OrderedDict
 from typing import Dict, List, Tuple, Optional
 
+from .description_parser import description_hash
+
+
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+# Formatting tags TTS understands besides colors; never shown as text
+_MARKUP_TAGS = frozenset(["-", "b", "/b", "i", "/i", "u", "/u", "s", "/s", "sub", "/sub", "sup", "/sup"])
+
+
+class FormattedText:
+    """A description tokenized for display: plain text plus colored runs."""
+    
+    __slots__ = ("text", "colors", "starts", "ends")
+    
+    def __init__(self, text: str, colors: List[str], starts: array, ends: array):
+        """
+        Initialize formatted text.
+        
+        Args:
+            text: The text to display, without color codes
+            colors: The hex color of each run
+            starts: The start offset of each run in text
+            ends: The end offset of each run in text
+        """
+        self.text = text
+        self.colors = colors
+        self.starts = starts
+        self.ends = ends
+    
+    def size(self) -> int:
+        """
+        Get the approximate size of the entry, in characters.
+        
+        Returns:
+            The text length plus a few characters per run
+        """
+        return len(self.text) + 8 * len(self.colors)
+
+
+def tokenize(description: str, literal_brackets: bool = False) -> FormattedText:
+    """
+    Split a description into display text and colored runs.
+    
+    Matches how the preview has always rendered color codes: a color only
+    applies to the text up to the next '[', codes that are not six hex
+    digits are dropped, an unclosed '[' is shown as text, and every line
+    (including the last) ends with a newline.
+    
+    Args:
+        description: The description text with color codes
+        literal_brackets: Whether to show bracketed text that is not a color
+            or formatting tag, such as the weapon keywords in
+            "[7bc596][Assault, Heavy][-]", as text in the color before it
+            instead of dropping it
+        
+    Returns:
+        The tokenized description
+    """
+    parts: List[str] = []
+    colors: List[str] = []
+    starts = array('l')
+    ends = array('l')
+    length = 0
+    
+    for line in description.split('\n'):
+        line_pos = 0
+        line_length = len(line)
+        run_color = None  # The color of literal brackets, until an end marker
+        while line_pos < line_length:
+            color_start = line.find('[', line_pos)
+            if color_start == -1:
+                parts.append(line[line_pos:])
+                length += line_length - line_pos
+                break
+            
+            if color_start > line_pos:
+                parts.append(line[line_pos:color_start])
+                length += color_start - line_pos
+            
+            color_end = line.find(']', color_start)
+            if color_end == -1:
+                # Malformed color code, shown as text
+                parts.append(line[color_start:])
+                length += line_length - color_start
+                break
+            
+            hex_color = line[color_start + 1:color_end]
+            line_pos = color_end + 1
+            if len(hex_color) != 6 or not _HEX_DIGITS.issuperset(hex_color):
+                # End marker, or not a color; the code itself is not shown
+                if hex_color == "-":
+                    run_color = None
+                elif literal_brackets and hex_color.lower() not in _MARKUP_TAGS:
+                    bracketed = line[color_start:line_pos]
+                    parts.append(bracketed)
+                    if run_color is not None:
+                        colors.append(run_color)
+                        starts.append(length)
+                        ends.append(length + len(bracketed))
+                    length += len(bracketed)
+                continue
+            run_color = hex_color
+            
+            # The color applies until the next color code
+            next_color_start = line.find('[', line_pos)
+            if next_color_start == -1:
+                next_color_start = line_length
+            if next_color_start > line_pos:
+                parts.append(line[line_pos:next_color_start])
+                colors.append(hex_color)
+                starts.append(length)
+                length += next_color_start - line_pos
+                ends.append(length)
+            line_pos = next_color_start
+        
+        parts.append('\n')
+        length += 1
+    
+    return FormattedText(''.join(parts), colors, starts, ends)
+
+
+class FormatCache:
+    """Least recently used cache of tokenized descriptions, bounded by size."""
+    
+    def __init__(self, max_chars: int = 2000000):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_chars: The maximum total size of cached entries, see FormattedText.size
+        """
+        self.max_chars = max_chars
+        self.entries: "OrderedDict[str, FormattedText]" = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, description: str) -> FormattedText:
+        """
+        Get a tokenized description, tokenizing it if it is not cached.
+        
+        Args:
+            description: The description text with color codes
+            
+        Returns:
+            The tokenized description
+        """
+        key = description_hash(description)
+        formatted = self.entries.get(key)
+        if formatted is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return formatted
+        
+        self.misses += 1
+        formatted = tokenize(description)
+        entry_size = formatted.size()
+        if entry_size > self.max_chars:
+            return formatted
+        
+        self.entries[key] = formatted
+        self.size += entry_size
+        while self.size > self.max_chars:
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= evicted.size()
+        return formatted
+    
+    def clear(self) -> None:
+        """Remove every entry."""
+        self.entries.clear()
+        self.size = 0
+
 
 class ColorFormatter:
     """Handles color formatting for TTS description text."""
@@ -19,15 +193,23 @@ class ColorFormatter:
         {"code": "56f442", "name": "Bright Green", "display": "#56f442"}
     ]
     
+    # Tokenized descriptions shared by every preview
+    cache = FormatCache()
+    
     @staticmethod
     def apply_formatting(text_widget: tk.Text, description: str) -> None:
         """
         Apply color formatting to a text widget based on the description text.
         
+        Descriptions are tokenized once and cached (see FormatCache), so
+        previewing a description again only repaints the widget.
+        
         Args:
             text_widget: The tkinter Text widget to apply formatting to
             description: The description text with color codes
         """
+        formatted = ColorFormatter.cache.get(description)
+        
         # Enable editing of text widget temporarily if it's disabled
         was_disabled = text_widget.cget("state") == tk.DISABLED
         if was_disabled:
@@ -36,69 +218,26 @@ class ColorFormatter:
         # Clear the text widget
         text_widget.delete(1.0, tk.END)
         
-        # Process the text and add it to the widget with formatting
-        current_color = None
+        # Create a tag for each color that doesn't have one yet
+        tag_names = set(text_widget.tag_names())
+        for color in set(formatted.colors):
+            tag_name = f"color_{color}"
+            if tag_name not in tag_names:
+                text_widget.tag_configure(tag_name, foreground=f"#{color}")
         
-        lines = description.split('\n')
-        for line in lines:
-            line_pos = 0
-            while line_pos < len(line):
-                # Find the next color code or end marker
-                color_start = line.find('[', line_pos)
-                if color_start == -1:
-                    # No more color codes, add the rest of the line
-                    text_widget.insert(tk.END, line[line_pos:])
-                    line_pos = len(line)
-                else:
-                    # Add text before the color code
-                    if color_start > line_pos:
-                        text_widget.insert(tk.END, line[line_pos:color_start])
-                    
-                    # Find the end of the color code
-                    color_end = line.find(']', color_start)
-                    if color_end == -1:
-                        # Malformed color code, just add it as text
-                        text_widget.insert(tk.END, line[color_start:])
-                        line_pos = len(line)
-                    else:
-                        color_code = line[color_start:color_end+1]
-                        if color_code == "[-]":
-                            # End of color
-                            current_color = None
-                            line_pos = color_end + 1
-                        else:
-                            # New color
-                            hex_color = color_code[1:-1]
-                            if len(hex_color) == 6:
-                                try:
-                                    # Create a tag for this color if it doesn't exist
-                                    tag_name = f"color_{hex_color}"
-                                    if tag_name not in text_widget.tag_names():
-                                        text_widget.tag_configure(tag_name, foreground=f"#{hex_color}")
-                                    current_color = tag_name
-                                    
-                                    # Apply the color to the next text
-                                    next_text_start = color_end + 1
-                                    next_color_start = line.find('[', next_text_start)
-                                    
-                                    if next_color_start == -1:
-                                        # No more color codes, apply to the rest of the line
-                                        text_to_color = line[next_text_start:]
-                                        text_widget.insert(tk.END, text_to_color, current_color)
-                                        line_pos = len(line)
-                                    else:
-                                        # Apply color until the next color code
-                                        text_to_color = line[next_text_start:next_color_start]
-                                        text_widget.insert(tk.END, text_to_color, current_color)
-                                        line_pos = next_color_start
-                                except:
-                                    # Invalid color code
-                                    line_pos = color_end + 1
-                            else:
-                                line_pos = color_end + 1
-            
-            # Add a newline at the end of each line
-            text_widget.insert(tk.END, '\n')
+        # Insert the whole text in one call as alternating (text, tags) pairs
+        text = formatted.text
+        args = []
+        pos = 0
+        for color, start, end in zip(formatted.colors, formatted.starts, formatted.ends):
+            if start > pos:
+                args.extend((text[pos:start], ()))
+            args.extend((text[start:end], f"color_{color}"))
+            pos = end
+        if pos < len(text):
+            args.extend((text[pos:], ()))
+        if args:
+            text_widget.insert(tk.END, *args)
         
         # Restore the disabled state if needed
         if was_disabled:
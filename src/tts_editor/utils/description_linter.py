@@ -0,0 +1,208 @@
+"""
+Description linter for the Warhammer 40k TTS Unit Editor.
+"""
+import re
+from typing import Dict, List, Sequence, Tuple
+
+from . import description_parser
+from .description_parser import description_hash
+from .parallel import map_chunks
+
+
+# Bracketed text that is meant to be a color code: hex-like, with at least one digit
+_COLOR_LIKE = re.compile(r'^#?(?=[0-9a-zA-Z]*\d)[0-9a-zA-Z]{3,8}$')
+_HEX_COLOR = re.compile(r'^[0-9a-fA-F]{6}$')
+_WEAPON_NAME = re.compile(r'\(\s*(Ranged|Melee) Weapons\s*\)')
+
+
+class LintIssue:
+    """A problem found in a description."""
+
+    __slots__ = ("line", "code", "message")
+
+    def __init__(self, line: int, code: str, message: str):
+        """
+        Initialize a lint issue.
+
+        Args:
+            line: The 1-based line number in the description, or 0 for the
+                whole description
+            code: A short identifier for the kind of problem
+            message: A human readable description of the problem
+        """
+        self.line = line
+        self.code = code
+        self.message = message
+
+    def __eq__(self, other):
+        return (isinstance(other, LintIssue) and
+                (self.line, self.code, self.message) == (other.line, other.code, other.message))
+
+    def __repr__(self):
+        return f"LintIssue({self.line}, {self.code!r}, {self.message!r})"
+
+
+def _lint_colors(line_number: int, line: str, issues: List[LintIssue]) -> None:
+    """Check the color codes on one line."""
+    open_colors = 0
+    pos = 0
+    while True:
+        start = line.find('[', pos)
+        if start == -1:
+            break
+        end = line.find(']', start)
+        if end == -1:
+            issues.append(LintIssue(line_number, "unclosed-bracket", "'[' without a closing ']'"))
+            break
+
+        code = line[start + 1:end]
+        if code == "-":
+            open_colors = max(open_colors - 1, 0)
+        elif _HEX_COLOR.match(code):
+            open_colors += 1
+        elif _COLOR_LIKE.match(code):
+            issues.append(LintIssue(line_number, "invalid-color", f"Invalid color code [{code}]"))
+        pos = end + 1
+
+    if open_colors:
+        issues.append(LintIssue(line_number, "unbalanced-color", "Color code not ended with [-]"))
+
+
+def _lint_weapons(line_numbers: List[int], lines: List[str], issues: List[LintIssue]) -> None:
+    """
+    Check that a weapon section is made of name/stats line pairs.
+
+    Each line is reported by its number in line_numbers, as a section
+    may be repeated in a description.
+
+    extract_weapons reads the lines after the header strictly in pairs, so a
+    missing stats line or a stray line silently shifts every following weapon.
+    """
+    clean_lines = [description_parser.COLOR_CODE.sub('', line) for line in lines]
+    end = len(clean_lines)
+    while end > 1 and not clean_lines[end - 1].strip():
+        end -= 1
+
+    i = 1
+    while i < end:
+        clean_line = clean_lines[i]
+        if "(" in clean_line and ")" in clean_line:
+            stats_line = clean_lines[i + 1] if i + 1 < end else ""
+            if "D:" not in stats_line or _WEAPON_NAME.search(stats_line):
+                weapon_name = clean_line.split('(')[0].strip()
+                issues.append(LintIssue(
+                    line_numbers[i], "missing-weapon-stats",
+                    f"Weapon '{weapon_name}' has no stats line after it"
+                ))
+                i += 1
+                continue
+            i += 2
+        else:
+            if "D:" in clean_line:
+                message = "Weapon stats line without a weapon name line before it"
+            else:
+                message = "Unexpected line between weapons; following weapons are misread"
+            issues.append(LintIssue(line_numbers[i], "weapon-pairing", message))
+            i += 1
+
+
+def lint_description(description: str) -> List[LintIssue]:
+    """
+    Check a description for formatting problems.
+
+    Args:
+        description: The description text
+
+    Returns:
+        The problems found, in line order
+    """
+    issues: List[LintIssue] = []
+    lines = description.split('\n')
+    for i, line in enumerate(lines, 1):
+        _lint_colors(i, line, issues)
+
+    sections = description_parser.parse_description(description)
+    if not sections["stats"]:
+        issues.append(LintIssue(0, "missing-stats", "No stats header (M T Sv W Ld OC) found"))
+    elif len(sections["stats"]) < 2 or not any(
+            description_parser.extract_stats(sections["stats"]).astuple()):
+        issues.append(LintIssue(0, "missing-stats", "Stats header is not followed by six stat values"))
+
+    # Keep the line number of every section line
+    line_sections = description_parser._line_sections(lines)
+    for section in ("ranged", "melee"):
+        line_numbers = [i for i, line_section in enumerate(line_sections, 1) if line_section == section]
+        if not line_numbers:
+            continue
+        _lint_weapons(line_numbers, [lines[i - 1] for i in line_numbers], issues)
+
+    issues.sort(key=lambda issue: issue.line)
+    return issues
+
+
+def _lint_chunk(descriptions: Sequence[str]) -> List[List[LintIssue]]:
+    """Lint a chunk of descriptions in a worker process."""
+    return [lint_description(description) for description in descriptions]
+
+
+class DescriptionLinter:
+    """Lints the profiles of a unit manager, caching results by description hash."""
+
+    def __init__(self):
+        """Initialize the linter."""
+        self.cache: Dict[str, List[LintIssue]] = {}
+        self.results: Dict[Tuple[int, int], List[LintIssue]] = {}
+
+    def lint_all(self, unit_manager) -> Dict[Tuple[int, int], List[LintIssue]]:
+        """
+        Lint every profile, linting each unseen description once across a worker pool.
+
+        Args:
+            unit_manager: The unit manager to lint
+
+        Returns:
+            A dictionary mapping (unit index, profile index) to the profile's
+            problems, for profiles with problems
+        """
+        keys: Dict[Tuple[int, int], str] = {}
+        pending: Dict[str, str] = {}
+        for unit_index, unit in enumerate(unit_manager.units):
+            for profile_index, profile in enumerate(unit.profiles):
+                digest = description_hash(profile.description)
+                keys[(unit_index, profile_index)] = digest
+                if digest not in self.cache:
+                    pending[digest] = profile.description
+
+        if pending:
+            digests = list(pending)
+            results = map_chunks(_lint_chunk, [pending[digest] for digest in digests])
+            self.cache.update(zip(digests, results))
+
+        self.results = {
+            key: self.cache[digest] for key, digest in keys.items() if self.cache[digest]
+        }
+        return self.results
+
+    def relint(self, unit_manager, unit_index: int, profile_index: int) -> List[LintIssue]:
+        """
+        Lint a single profile again, e.g. after save_profile_changes.
+
+        Args:
+            unit_manager: The unit manager holding the profile
+            unit_index: The index of the unit
+            profile_index: The index of the profile in the unit
+
+        Returns:
+            The profile's problems
+        """
+        description = unit_manager.units[unit_index].profiles[profile_index].description
+        digest = description_hash(description)
+        issues = self.cache.get(digest)
+        if issues is None:
+            issues = self.cache[digest] = lint_description(description)
+
+        if issues:
+            self.results[(unit_index, profile_index)] = issues
+        else:
+            self.results.pop((unit_index, profile_index), None)
+        return issues
@@ -1,54 +1,91 @@
 """
 Parser for Warhammer 40k unit descriptions.
 """
+import hashlib
 import re
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
+from ..models.profile_fields import Ability, MeleeWeapon, RangedWeapon, StatLine
 
-def parse_description(description: str) -> Dict[str, List[str]]:
+
+Weapon = Union[RangedWeapon, MeleeWeapon]
+
+
+# Color codes such as [56f442] and [-]; stripped before parsing
+COLOR_CODE = re.compile(r'\[[^\]]*\]')
+
+
+def description_hash(description: str) -> str:
     """
-    Parse a description into sections (stats, ranged weapons, melee weapons, abilities).
+    Hash a description for caching and change detection.
     
     Args:
-        description: The description text to parse
+        description: The description text
         
     Returns:
-        A dictionary with sections as keys and lists of lines as values
+        The hex digest of the description
     """
-    sections = {
-        "stats": [],
-        "ranged": [],
-        "melee": [],
-        "abilities": []
-    }
+    return hashlib.sha1(description.encode("utf-8")).hexdigest()
+
+
+def _line_sections(lines: List[str]) -> List[Optional[str]]:
+    """
+    Find the section of every line of a description.
     
+    Args:
+        lines: The lines of the description
+        
+    Returns:
+        "stats", "ranged", "melee" or "abilities" for each line; None for
+        lines before the first section header
+    """
+    line_sections: List[Optional[str]] = []
     current_section = None
-    lines = description.split('\n')
     
     for line in lines:
         # Remove color codes for parsing
-        clean_line = re.sub(r'\[[^\]]*\]', '', line)
+        clean_line = COLOR_CODE.sub('', line)
         
         # Check for section headers
         if "M" in clean_line and "T" in clean_line and "Sv" in clean_line and "W" in clean_line:
             current_section = "stats"
-            sections[current_section].append(line)
         elif "Ranged weapons" in clean_line:
             current_section = "ranged"
-            sections[current_section].append(line)
         elif "Melee weapons" in clean_line:
             current_section = "melee"
-            sections[current_section].append(line)
         elif "Abilities" in clean_line:
             current_section = "abilities"
-            sections[current_section].append(line)
-        elif current_section:
-            sections[current_section].append(line)
+        line_sections.append(current_section)
+    
+    return line_sections
+
+
+def parse_description(description: str) -> Dict[str, List[str]]:
+    """
+    Parse a description into sections (stats, ranged weapons, melee weapons, abilities).
+    
+    Args:
+        description: The description text to parse
+        
+    Returns:
+        A dictionary with sections as keys and lists of lines as values
+    """
+    sections = {
+        "stats": [],
+        "ranged": [],
+        "melee": [],
+        "abilities": []
+    }
+    
+    lines = description.split('\n')
+    for line, section in zip(lines, _line_sections(lines)):
+        if section:
+            sections[section].append(line)
     
     return sections
 
 
-def extract_stats(stats_lines: List[str]) -> Dict[str, str]:
+def extract_stats(stats_lines: List[str]) -> StatLine:
     """
     Extract stats from the stats section lines.
     
@@ -56,35 +93,90 @@ def extract_stats(stats_lines: List[str]) -> Dict[str, str]:
         stats_lines: The lines from the stats section
         
     Returns:
-        A dictionary with stat names as keys and values as values
-    """
-    stats = {
-        "M": "",
-        "T": "",
-        "Sv": "",
-        "W": "",
-        "Ld": "",
-        "OC": ""
-    }
-    
+        The stat line; stats are empty if no values line was found
+    """
     if len(stats_lines) < 2:
-        return stats
+        return StatLine()
     
     # Skip the header line and process the values line
     values_line = stats_lines[1]
-    clean_line = re.sub(r'\[[^\]]*\]', '', values_line)
+    clean_line = COLOR_CODE.sub('', values_line)
     parts = re.split(r'\s+', clean_line.strip())
     
     if len(parts) >= 6:
-        stat_keys = list(stats.keys())
-        for i, key in enumerate(stat_keys):
-            if i < len(parts):
-                stats[key] = parts[i]
+        return StatLine(*parts[:6])
+    return StatLine()
+
+
+# Weapon stats, matched on the stats line with color codes removed
+_RANGE = re.compile(r'(\d+\")')
+_ATTACKS = re.compile(r'A:(\S+)')
+_BALLISTIC_SKILL = re.compile(r'BS:(\S+)')
+_WEAPON_SKILL = re.compile(r'WS:(\S+)')
+_STRENGTH = re.compile(r'(?<!\w)S:(\S+)')
+_ARMOUR_PENETRATION = re.compile(r'AP:(\S+)')
+_DAMAGE = re.compile(r'D:(\S+)')
+
+# Weapon abilities, matched on the original stats line
+_ABILITIES = re.compile(r'\[7bc596\]\[([^\]]*)\]')
+_AFTER_DAMAGE = re.compile(r'D:\s*\S+\s+')
+_BRACKETED = re.compile(r'\[([^\]]*)\]')
+
+
+def _search(pattern, line: str) -> str:
+    """Get the first group of a pattern's first match in a line, or an empty string."""
+    match = pattern.search(line)
+    return match.group(1) if match else ""
+
+
+def _weapon_abilities(stats_line: str) -> str:
+    """
+    Extract the abilities of a weapon from its stats line.
+    
+    Args:
+        stats_line: The stats line, including color codes
+        
+    Returns:
+        The abilities text, or an empty string
+    """
+    # First try to find abilities in the format [7bc596][abilities][-]
+    abilities_match = _ABILITIES.search(stats_line)
+    if abilities_match:
+        return abilities_match.group(1).strip()
+    
+    # If that fails, try to find abilities after the D: value
+    if "D:" in stats_line:
+        # Split the line at D: and take everything after the value
+        parts = _AFTER_DAMAGE.split(stats_line, 1)
+        if len(parts) > 1 and parts[1].strip():
+            # Extract text between [ and ]
+            ability_match = _BRACKETED.search(parts[1])
+            if ability_match:
+                return ability_match.group(1).strip()
+    return ""
+
+
+def _weapon_rows(weapon_lines: List[str]) -> Iterator[Tuple[int, str]]:
+    """
+    Find the weapons of a weapon section.
     
-    return stats
+    Args:
+        weapon_lines: The lines from the weapon section
+        
+    Yields:
+        The position of each weapon's stats line in weapon_lines and the
+        weapon's name
+    """
+    # Process the lines in pairs (name line followed by stats line), after the header
+    i = 1
+    while i < len(weapon_lines) - 1:
+        clean_name_line = COLOR_CODE.sub('', weapon_lines[i])
+        if "(" in clean_name_line and ")" in clean_name_line:
+            yield i + 1, clean_name_line.split('(')[0].strip()
+        i += 2  # Move to the next pair of lines
 
 
-def extract_weapons(weapon_lines: List[str], weapon_type: str) -> List[Dict[str, str]]:
+def extract_weapons(weapon_lines: List[str], weapon_type: str) -> List[Weapon]:
     """
     Extract weapons from the weapon section lines.
     
@@ -93,144 +185,44 @@ def extract_weapons(weapon_lines: List[str], weapon_type: str) -> List[Dict[str,
         weapon_type: The type of weapon ("ranged" or "melee")
         
     Returns:
-        A list of dictionaries with weapon properties
+        A list of RangedWeapon or MeleeWeapon objects
     """
     weapons = []
     
-    # Skip the first line (section header)
-    if len(weapon_lines) <= 1:
-        return weapons
-    
-    # Process the lines in pairs (name line followed by stats line)
-    i = 1  # Start after the header
-    while i < len(weapon_lines) - 1:
-        # Get the name line and stats line
-        name_line = weapon_lines[i]
-        stats_line = weapon_lines[i + 1]
+    for stats_position, weapon_name in _weapon_rows(weapon_lines):
+        stats_line = weapon_lines[stats_position]
         
         # Remove color codes for parsing
-        clean_name_line = re.sub(r'\[[^\]]*\]', '', name_line)
-        clean_stats_line = re.sub(r'\[[^\]]*\]', '', stats_line)
+        clean_stats_line = COLOR_CODE.sub('', stats_line)
         
-        # Extract weapon name
-        if "(" in clean_name_line and ")" in clean_name_line:
-            weapon_name = clean_name_line.split('(')[0].strip()
-            
-            # Create weapon dictionary
-            weapon = {"name": weapon_name}
-            
-            if weapon_type == "ranged":
-                weapon.update({
-                    "range": "",
-                    "A": "",
-                    "BS": "",
-                    "S": "",
-                    "AP": "",
-                    "D": "",
-                    "abilities": ""
-                })
-                
-                # Try to extract range
-                range_match = re.match(r'(\d+\")', clean_stats_line)
-                if range_match:
-                    weapon["range"] = range_match.group(1)
-                
-                # Use regex to extract each stat precisely
-                a_match = re.search(r'A:(\S+)', clean_stats_line)
-                if a_match:
-                    weapon["A"] = a_match.group(1)
-                
-                bs_match = re.search(r'BS:(\S+)', clean_stats_line)
-                if bs_match:
-                    weapon["BS"] = bs_match.group(1)
-                
-                s_match = re.search(r'(?<!\w)S:(\S+)', clean_stats_line)
-                if s_match:
-                    weapon["S"] = s_match.group(1)
-                
-                ap_match = re.search(r'AP:(\S+)', clean_stats_line)
-                if ap_match:
-                    weapon["AP"] = ap_match.group(1)
-                
-                d_match = re.search(r'D:(\S+)', clean_stats_line)
-                if d_match:
-                    weapon["D"] = d_match.group(1)
-                
-                # Extract abilities - look for anything in square brackets after the D: value
-                # The original stats line might have color codes, so we need to check the original line
-                original_stats_line = stats_line
-                
-                # First try to find abilities in the format [7bc596][abilities][-]
-                abilities_match = re.search(r'\[7bc596\]\[([^\]]*)\]', original_stats_line)
-                if abilities_match:
-                    weapon["abilities"] = abilities_match.group(1).strip()
-                # If that fails, try to find abilities after the D: value
-                elif "D:" in original_stats_line:
-                    # Split the line at D: and take everything after the value
-                    parts = re.split(r'D:\s*\S+\s+', original_stats_line, 1)
-                    if len(parts) > 1 and parts[1].strip():
-                        # Extract text between [ and ]
-                        ability_match = re.search(r'\[([^\]]*)\]', parts[1])
-                        if ability_match:
-                            weapon["abilities"] = ability_match.group(1).strip()
-            
-            elif weapon_type == "melee":
-                weapon.update({
-                    "A": "",
-                    "WS": "",
-                    "S": "",
-                    "AP": "",
-                    "D": "",
-                    "abilities": ""
-                })
-                
-                # Use regex to extract each stat precisely
-                a_match = re.search(r'A:(\S+)', clean_stats_line)
-                if a_match:
-                    weapon["A"] = a_match.group(1)
-                
-                ws_match = re.search(r'WS:(\S+)', clean_stats_line)
-                if ws_match:
-                    weapon["WS"] = ws_match.group(1)
-                
-                s_match = re.search(r'(?<!\w)S:(\S+)', clean_stats_line)
-                if s_match:
-                    weapon["S"] = s_match.group(1)
-                
-                ap_match = re.search(r'AP:(\S+)', clean_stats_line)
-                if ap_match:
-                    weapon["AP"] = ap_match.group(1)
-                
-                d_match = re.search(r'D:(\S+)', clean_stats_line)
-                if d_match:
-                    weapon["D"] = d_match.group(1)
-                
-                # Extract abilities - look for anything in square brackets after the D: value
-                # The original stats line might have color codes, so we need to check the original line
-                original_stats_line = stats_line
-                
-                # First try to find abilities in the format [7bc596][abilities][-]
-                abilities_match = re.search(r'\[7bc596\]\[([^\]]*)\]', original_stats_line)
-                if abilities_match:
-                    weapon["abilities"] = abilities_match.group(1).strip()
-                # If that fails, try to find abilities after the D: value
-                elif "D:" in original_stats_line:
-                    # Split the line at D: and take everything after the value
-                    parts = re.split(r'D:\s*\S+\s+', original_stats_line, 1)
-                    if len(parts) > 1 and parts[1].strip():
-                        # Extract text between [ and ]
-                        ability_match = re.search(r'\[([^\]]*)\]', parts[1])
-                        if ability_match:
-                            weapon["abilities"] = ability_match.group(1).strip()
-            
-            weapons.append(weapon)
+        if weapon_type == "ranged":
+            range_match = _RANGE.match(clean_stats_line)
+            weapons.append(RangedWeapon(
+                weapon_name,
+                range_match.group(1) if range_match else "",
+                _search(_ATTACKS, clean_stats_line),
+                _search(_BALLISTIC_SKILL, clean_stats_line),
+                _search(_STRENGTH, clean_stats_line),
+                _search(_ARMOUR_PENETRATION, clean_stats_line),
+                _search(_DAMAGE, clean_stats_line),
+                _weapon_abilities(stats_line)
+            ))
         
-        i += 2  # Move to the next pair of lines
+        elif weapon_type == "melee":
+            weapons.append(MeleeWeapon(
+                weapon_name,
+                _search(_ATTACKS, clean_stats_line),
+                _search(_WEAPON_SKILL, clean_stats_line),
+                _search(_STRENGTH, clean_stats_line),
+                _search(_ARMOUR_PENETRATION, clean_stats_line),
+                _search(_DAMAGE, clean_stats_line),
+                _weapon_abilities(stats_line)
+            ))
     
     return weapons
 
 
-def extract_abilities(ability_lines: List[str]) -> List[str]:
+def extract_abilities(ability_lines: List[str]) -> List[Ability]:
     """
     Extract abilities from the abilities section lines.
     
@@ -238,7 +230,7 @@ def extract_abilities(ability_lines: List[str]) -> List[str]:
         ability_lines: The lines from the abilities section
         
     Returns:
-        A list of ability strings
+        A list of abilities
     """
     abilities = []
     
@@ -248,89 +240,341 @@ def extract_abilities(ability_lines: List[str]) -> List[str]:
             continue
             
         # Remove color codes for parsing
-        clean_line = re.sub(r'\[[^\]]*\]', '', line)
+        clean_line = COLOR_CODE.sub('', line)
         
         if clean_line.strip():
-            abilities.append(clean_line.strip())
+            abilities.append(Ability(clean_line.strip()))
     
     return abilities
 
 
-def generate_description(stats: Dict[str, str], 
-                         ranged_weapons: List[Dict[str, str]], 
-                         melee_weapons: List[Dict[str, str]], 
-                         abilities: List[str]) -> str:
+def parse_profile(description: str) -> Tuple[StatLine, List[RangedWeapon],
+                                             List[MeleeWeapon], List[Ability]]:
+    """
+    Parse a description into the structured fields of a profile.
+    
+    Args:
+        description: The description text to parse
+        
+    Returns:
+        A (stats, ranged weapons, melee weapons, abilities) tuple
+    """
+    sections = parse_description(description)
+    return (
+        extract_stats(sections["stats"]),
+        extract_weapons(sections["ranged"], "ranged"),
+        extract_weapons(sections["melee"], "melee"),
+        extract_abilities(sections["abilities"]),
+    )
+
+
+# Output layout; section writers append fragments to a list that is joined once
+_STATS_HEADER = "[56f442] M    T   Sv    W    Ld   OC  [-]\n"
+_RANGED_HEADER = "[e85545]Ranged weapons[-]\n"
+_MELEE_HEADER = "[e85545]Melee weapons[-]\n"
+_ABILITIES_HEADER = "[dc61ed]Abilities[-]\n"
+
+
+def _write_stats(out: List[str], stats: StatLine) -> None:
+    """
+    Write the stats section into an output buffer.
+    
+    Args:
+        out: The list of output fragments to append to
+        stats: The stat line
+    """
+    out.append(_STATS_HEADER)
+    out.append(
+        f"{stats.M}   {stats.T}   {stats.Sv}   "
+        f"{stats.W}   {stats.Ld}   {stats.OC}   [-][-]\n\n"
+    )
+
+
+def _write_ranged_weapons(out: List[str], weapons: List[RangedWeapon]) -> None:
+    """
+    Write the ranged weapons section into an output buffer.
+    
+    Args:
+        out: The list of output fragments to append to
+        weapons: The ranged weapons
+    """
+    append = out.append
+    append(_RANGED_HEADER)
+    for weapon in weapons:
+        append(
+            f"[c6c930]{weapon.name} (Ranged Weapons)[-]\n"
+            f"{weapon.range} A:{weapon.A} BS:{weapon.BS} S:{weapon.S} "
+            f"AP:{weapon.AP} D:{weapon.D} "
+        )
+        append(f"[7bc596][{weapon.abilities}][-] \n" if weapon.abilities else "\n")
+    append("\n")
+
+
+def _write_melee_weapons(out: List[str], weapons: List[MeleeWeapon]) -> None:
+    """
+    Write the melee weapons section into an output buffer.
+    
+    Args:
+        out: The list of output fragments to append to
+        weapons: The melee weapons
+    """
+    append = out.append
+    append(_MELEE_HEADER)
+    for weapon in weapons:
+        append(
+            f"[c6c930]{weapon.name} (Melee Weapons)[-]\n"
+            f"A:{weapon.A} WS:{weapon.WS} S:{weapon.S} "
+            f"AP:{weapon.AP} D:{weapon.D} "
+        )
+        append(f"[7bc596][{weapon.abilities}][-] \n" if weapon.abilities else "\n")
+    append("\n")
+
+
+def generate_description(stats: StatLine, 
+                         ranged_weapons: List[RangedWeapon], 
+                         melee_weapons: List[MeleeWeapon], 
+                         abilities: List[Ability]) -> str:
     """
     Generate a description from the provided data.
     
     Args:
-        stats: Dictionary of stat values
-        ranged_weapons: List of ranged weapon dictionaries
-        melee_weapons: List of melee weapon dictionaries
-        abilities: List of ability strings
+        stats: The stat line
+        ranged_weapons: The ranged weapons
+        melee_weapons: The melee weapons
+        abilities: The abilities
         
     Returns:
         The generated description
     """
-    description = ""
-    
-    # Stats section
-    description += "[56f442] M    T   Sv    W    Ld   OC  [-]\n"
-    stats_line = ""
-    for stat in ["M", "T", "Sv", "W", "Ld", "OC"]:
-        value = stats.get(stat, "")
-        # Pad with spaces for alignment
-        if stat == "M":
-            stats_line += f"{value}   "
-        else:
-            stats_line += f"{value}   "
-    description += stats_line + "[-][-]\n\n"
+    out: List[str] = []
+    _write_stats(out, stats)
     
-    # Ranged weapons section
     if ranged_weapons:
-        description += "[e85545]Ranged weapons[-]\n"
-        for weapon in ranged_weapons:
-            description += f"[c6c930]{weapon['name']} (Ranged Weapons)[-]\n"
-            
-            # Build stats line
-            range_val = weapon.get("range", "")
-            a_val = weapon.get("A", "")
-            bs_val = weapon.get("BS", "")
-            s_val = weapon.get("S", "")
-            ap_val = weapon.get("AP", "")
-            d_val = weapon.get("D", "")
-            abilities = weapon.get("abilities", "")
-            
-            stats_line = f"{range_val} A:{a_val} BS:{bs_val} S:{s_val} AP:{ap_val} D:{d_val} "
-            if abilities:
-                stats_line += f"[7bc596][{abilities}][-] "
-            description += stats_line + "\n"
-        description += "\n"
+        _write_ranged_weapons(out, ranged_weapons)
     
-    # Melee weapons section
     if melee_weapons:
-        description += "[e85545]Melee weapons[-]\n"
-        for weapon in melee_weapons:
-            description += f"[c6c930]{weapon['name']} (Melee Weapons)[-]\n"
-            
-            # Build stats line
-            a_val = weapon.get("A", "")
-            ws_val = weapon.get("WS", "")
-            s_val = weapon.get("S", "")
-            ap_val = weapon.get("AP", "")
-            d_val = weapon.get("D", "")
-            abilities = weapon.get("abilities", "")
-            
-            stats_line = f"A:{a_val} WS:{ws_val} S:{s_val} AP:{ap_val} D:{d_val} "
-            if abilities:
-                stats_line += f"[7bc596][{abilities}][-] "
-            description += stats_line + "\n"
-        description += "\n"
+        _write_melee_weapons(out, melee_weapons)
     
-    # Abilities section
     if abilities:
-        description += "[dc61ed]Abilities[-]\n"
-        for ability in abilities:
-            description += ability + "\n"
+        out.append(_ABILITIES_HEADER)
+        out.append("\n".join([ability.text for ability in abilities]))
+        out.append("\n")
+    
+    return "".join(out)
+
+
+# Weapon stats that are a "<key>:<value>" token on the stats line
+_WEAPON_STATS = {
+    "A": _ATTACKS,
+    "BS": _BALLISTIC_SKILL,
+    "WS": _WEAPON_SKILL,
+    "S": _STRENGTH,
+    "AP": _ARMOUR_PENETRATION,
+    "D": _DAMAGE,
+}
+
+
+def _strip_color_codes(line: str) -> Tuple[str, List[int]]:
+    """
+    Remove the color codes of a line, remembering where each character came from.
+    
+    Args:
+        line: The line, including color codes
+        
+    Returns:
+        The line without color codes, and the position in the original line
+        of each of its characters
+    """
+    pieces = []
+    positions: List[int] = []
+    last = 0
+    for match in COLOR_CODE.finditer(line):
+        pieces.append(line[last:match.start()])
+        positions.extend(range(last, match.start()))
+        last = match.end()
+    pieces.append(line[last:])
+    positions.extend(range(last, len(line)))
+    return "".join(pieces), positions
+
+
+def _original_span(positions: List[int], start: int, end: int) -> Tuple[int, int]:
+    """Map a non-empty span of a line without color codes back to the original line."""
+    return positions[start], positions[end - 1] + 1
+
+
+def _replace_spans(line: str, edits: List[Tuple[int, int, str]]) -> str:
+    """Replace (start, end, text) spans of a line; the spans must not overlap."""
+    for start, end, text in sorted(edits, reverse=True):
+        line = line[:start] + text + line[end:]
+    return line
+
+
+def _stat_edits(line: str, old: StatLine, new: StatLine) -> Optional[List[Tuple[int, int, str]]]:
+    """
+    Find the edits turning the stats of a stat values line from old to new.
+    
+    Args:
+        line: The values line of the stats section
+        old: The stats parsed from it
+        new: The changed stats
+        
+    Returns:
+        The (start, end, text) edits, or None if a changed stat isn't on the line
+    """
+    clean_line, positions = _strip_color_codes(line)
+    tokens = list(re.finditer(r'\S+', clean_line))
+    if len(tokens) < len(StatLine.FIELDS):
+        return None
+    
+    edits = []
+    for token, field in zip(tokens, StatLine.FIELDS):
+        value = getattr(new, field)
+        if value != getattr(old, field):
+            edits.append(_original_span(positions, token.start(), token.end()) + (value,))
+    return edits
+
+
+def _weapon_edits(line: str, old: Weapon, new: Weapon) -> Optional[List[Tuple[int, int, str]]]:
+    """
+    Find the edits turning a weapon stats line from old to new.
+    
+    Args:
+        line: The weapon's stats line
+        old: The weapon parsed from it
+        new: The changed weapon
+        
+    Returns:
+        The (start, end, text) edits, or None if a changed stat isn't on the
+        line or the name changed
+    """
+    clean_line, positions = _strip_color_codes(line)
+    edits = []
+    for field in old.FIELDS:
+        value = getattr(new, field)
+        if value == getattr(old, field):
+            continue
+        
+        if field == "abilities":
+            match = _ABILITIES.search(line)
+            if not match and "D:" in line:
+                after_damage = _AFTER_DAMAGE.search(line)
+                if after_damage:
+                    match = _BRACKETED.search(line, after_damage.end())
+            if match:
+                edits.append((match.start(1), match.end(1), value))
+            else:
+                # No abilities yet; add them after the last stat, as generate_description does
+                end = len(line.rstrip())
+                edits.append((end, end, f" [7bc596][{value}][-]"))
+            continue
+        
+        if field == "range":
+            match = _RANGE.match(clean_line)
+        elif field in _WEAPON_STATS:
+            match = _WEAPON_STATS[field].search(clean_line)
+        else:
+            return None
+        if not match:
+            return None
+        edits.append(_original_span(positions, match.start(1), match.end(1)) + (value,))
+    return edits
+
+
+def update_description(description: str,
+                       old_fields: Tuple[StatLine, List[RangedWeapon], List[MeleeWeapon], List[Ability]],
+                       new_fields: Tuple[StatLine, List[RangedWeapon], List[MeleeWeapon], List[Ability]]
+                       ) -> Optional[str]:
+    """
+    Change only the fields that differ in a description's text.
+    
+    Unlike generate_description, the rest of the text is kept as written:
+    color codes, line layout and any line the parser doesn't recognise.
+    Changed stats and weapon stats replace their value in place, removed
+    abilities drop their line and added abilities are inserted after the
+    last one. Weapons can't be added, removed or renamed.
+    
+    Args:
+        description: The description text
+        old_fields: The (stats, ranged weapons, melee weapons, abilities)
+            parsed from it, see parse_profile
+        new_fields: The changed fields
+        
+    Returns:
+        The changed description, or None if the change can't be made in
+        place, e.g. a stat that isn't in the text; parsing the result always
+        gives new_fields
+    """
+    old_stats, old_ranged, old_melee, old_abilities = old_fields
+    new_stats, new_ranged, new_melee, new_abilities = new_fields
+    if len(old_ranged) != len(new_ranged) or len(old_melee) != len(new_melee):
+        return None
+    
+    lines = description.split('\n')
+    line_numbers: Dict[str, List[int]] = {"stats": [], "ranged": [], "melee": [], "abilities": []}
+    for line_number, section in enumerate(_line_sections(lines)):
+        if section:
+            line_numbers[section].append(line_number)
+    
+    edits: Dict[int, List[Tuple[int, int, str]]] = {}  # Line number -> edits of the line
+    if new_stats != old_stats:
+        if len(line_numbers["stats"]) < 2:
+            return None
+        line_number = line_numbers["stats"][1]
+        stat_edits = _stat_edits(lines[line_number], old_stats, new_stats)
+        if stat_edits is None:
+            return None
+        edits[line_number] = stat_edits
+    
+    for section, old_weapons, new_weapons in (("ranged", old_ranged, new_ranged),
+                                              ("melee", old_melee, new_melee)):
+        section_line_numbers = line_numbers[section]
+        rows = _weapon_rows([lines[line_number] for line_number in section_line_numbers])
+        for (stats_position, _), old_weapon, new_weapon in zip(rows, old_weapons, new_weapons):
+            if new_weapon == old_weapon:
+                continue
+            line_number = section_line_numbers[stats_position]
+            weapon_edits = _weapon_edits(lines[line_number], old_weapon, new_weapon)
+            if weapon_edits is None:
+                return None
+            edits[line_number] = weapon_edits
+    
+    for line_number, line_edits in edits.items():
+        lines[line_number] = _replace_spans(lines[line_number], line_edits)
+    
+    if new_abilities != old_abilities:
+        # The ability lines, as extract_abilities finds them
+        ability_line_numbers = [
+            line_number for line_number in line_numbers["abilities"]
+            if "Abilities" not in lines[line_number] and COLOR_CODE.sub('', lines[line_number]).strip()
+        ]
+        # Keep the abilities still wanted in order, drop the others and add the rest after them
+        removed = set()
+        kept = 0
+        for line_number, ability in zip(ability_line_numbers, old_abilities):
+            if kept < len(new_abilities) and new_abilities[kept] == ability:
+                kept += 1
+            else:
+                removed.add(line_number)
+        added = [ability.text for ability in new_abilities[kept:]]
+        
+        if ability_line_numbers:
+            insert_after = ability_line_numbers[-1]
+        elif line_numbers["abilities"]:
+            insert_after = line_numbers["abilities"][0]
+        else:
+            # No abilities section; start one at the end, before a final line break
+            added.insert(0, _ABILITIES_HEADER.rstrip("\n"))
+            insert_after = len(lines) - 2 if lines[-1] == "" else len(lines) - 1
+        
+        new_lines = list(added) if insert_after < 0 else []
+        for line_number, line in enumerate(lines):
+            if line_number not in removed:
+                new_lines.append(line)
+            if line_number == insert_after:
+                new_lines.extend(added)
+        lines = new_lines
     
-    return description
+    new_description = '\n'.join(lines)
+    if parse_profile(new_description) != tuple(new_fields):
+        return None
+    return new_description
@@ -0,0 +1,167 @@
+"""
+Background parsing of every profile for the Warhammer 40k TTS Unit Editor.
+"""
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from . import description_parser
+from .description_parser import description_hash
+from .parallel import chunked, worker_count
+
+
+ParsedProfile = tuple  # See description_parser.parse_profile
+
+
+def _parse_chunk(descriptions: Sequence[str]) -> List[ParsedProfile]:
+    """Parse a chunk of descriptions in a worker process."""
+    return [description_parser.parse_profile(description) for description in descriptions]
+
+
+class EagerParser:
+    """
+    Parses every unique description of a unit manager in worker processes,
+    so selecting a profile only has to fill in widgets.
+
+    Work is submitted in unit order and results are collected with poll,
+    which the UI calls periodically; a unit is ready once all of its
+    profiles are parsed.
+    """
+
+    def __init__(self, chunk_size: int = 200, max_workers: Optional[int] = None):
+        """
+        Initialize the eager parser.
+
+        Args:
+            chunk_size: The number of descriptions parsed per worker task
+            max_workers: Optional cap on the number of worker processes
+        """
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.records: Dict[str, ParsedProfile] = {}  # Parsed profiles by description hash
+        self.pending_units: Dict[int, Set[str]] = {}  # Unparsed hashes of each unit
+        self._units_by_digest: Dict[str, List[int]] = {}
+        self._futures: List[Tuple[Future, List[str]]] = []
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether parsing is still in progress."""
+        return bool(self._futures)
+
+    def start(self, unit_manager) -> None:
+        """
+        Start parsing the profiles of a unit manager, cancelling earlier work.
+
+        Descriptions parsed before (by hash) are not parsed again.
+
+        Args:
+            unit_manager: The unit manager whose profiles are parsed
+        """
+        self.cancel()
+
+        pending: Dict[str, str] = {}
+        for unit_index, unit in enumerate(unit_manager.units):
+            for profile in unit.profiles:
+                digest = description_hash(profile.description)
+                if digest in self.records:
+                    continue
+                pending[digest] = profile.description
+                self.pending_units.setdefault(unit_index, set()).add(digest)
+                self._units_by_digest.setdefault(digest, []).append(unit_index)
+
+        if not pending:
+            return
+
+        digests = list(pending)
+        self._executor = ProcessPoolExecutor(max_workers=worker_count(self.max_workers))
+        for chunk in chunked(digests, self.chunk_size):
+            future = self._executor.submit(_parse_chunk, [pending[digest] for digest in chunk])
+            self._futures.append((future, chunk))
+
+    def poll(self) -> List[int]:
+        """
+        Collect finished work.
+
+        Returns:
+            The indices of units that became ready since the last poll
+        """
+        ready: List[int] = []
+        remaining = []
+        for future, digests in self._futures:
+            if not future.done():
+                remaining.append((future, digests))
+                continue
+
+            # A failed chunk is left to be parsed on selection
+            if not future.cancelled() and future.exception() is None:
+                self.records.update(zip(digests, future.result()))
+
+            for digest in digests:
+                for unit_index in self._units_by_digest.pop(digest, ()):
+                    unit_digests = self.pending_units.get(unit_index)
+                    if unit_digests is None:
+                        continue
+                    unit_digests.discard(digest)
+                    if not unit_digests:
+                        del self.pending_units[unit_index]
+                        ready.append(unit_index)
+
+        self._futures = remaining
+        if not remaining:
+            self._shutdown()
+        return ready
+
+    def is_ready(self, unit_index: int) -> bool:
+        """
+        Check whether every profile of a unit is parsed.
+
+        Args:
+            unit_index: The index of the unit
+
+        Returns:
+            True if no profile of the unit is waiting to be parsed
+        """
+        return unit_index not in self.pending_units
+
+    def get(self, description: str) -> Optional[ParsedProfile]:
+        """
+        Get the parsed fields of a description, if already parsed.
+
+        Args:
+            description: The description text
+
+        Returns:
+            The (stats, ranged weapons, melee weapons, abilities) tuple, or None
+        """
+        return self.records.get(description_hash(description))
+
+    def get_or_parse(self, description: str) -> ParsedProfile:
+        """
+        Get the parsed fields of a description, parsing it here if needed.
+
+        Args:
+            description: The description text
+
+        Returns:
+            The (stats, ranged weapons, melee weapons, abilities) tuple
+        """
+        digest = description_hash(description)
+        record = self.records.get(digest)
+        if record is None:
+            record = self.records[digest] = description_parser.parse_profile(description)
+        return record
+
+    def cancel(self) -> None:
+        """Stop any work in progress; parsed records are kept."""
+        for future, _ in self._futures:
+            future.cancel()
+        self._futures = []
+        self.pending_units = {}
+        self._units_by_digest = {}
+        self._shutdown()
+
+    def _shutdown(self) -> None:
+        """Release the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -0,0 +1,160 @@
+"""
+Roster-wide find and replace for the Warhammer 40k TTS Unit Editor.
+"""
+import difflib
+import functools
+import re
+from typing import Dict, List, Optional, Pattern, Sequence, Tuple
+
+from .parallel import map_chunks
+
+
+class Replacement:
+    """A planned description change for one profile."""
+
+    __slots__ = ("unit_index", "profile_index", "unit_name", "profile_name",
+                 "model_count", "old_description", "new_description", "match_count")
+
+    def __init__(self, unit_index: int, profile_index: int, unit_name: str, profile_name: str,
+                 model_count: int, old_description: str, new_description: str, match_count: int):
+        """
+        Initialize a planned replacement.
+
+        Args:
+            unit_index: The index of the unit in the unit manager
+            profile_index: The index of the profile in the unit
+            unit_name: The unit name
+            profile_name: The profile name
+            model_count: The number of models sharing the profile
+            old_description: The current description
+            new_description: The description after replacing
+            match_count: The number of matches replaced
+        """
+        self.unit_index = unit_index
+        self.profile_index = profile_index
+        self.unit_name = unit_name
+        self.profile_name = profile_name
+        self.model_count = model_count
+        self.old_description = old_description
+        self.new_description = new_description
+        self.match_count = match_count
+
+    def diff(self) -> str:
+        """
+        Get a unified diff of the change.
+
+        Returns:
+            The diff text
+        """
+        return "".join(difflib.unified_diff(
+            self.old_description.splitlines(True),
+            self.new_description.splitlines(True),
+            fromfile=f"{self.unit_name} / {self.profile_name}",
+            tofile=f"{self.unit_name} / {self.profile_name} (replaced)",
+            n=1
+        ))
+
+
+def _replace_chunk(regex: Pattern, replacement: str,
+                   descriptions: Sequence[str]) -> List[Optional[Tuple[str, int]]]:
+    """
+    Run a replacement over a chunk of descriptions.
+
+    Args:
+        regex: The compiled pattern
+        replacement: The replacement template
+        descriptions: The descriptions to process
+
+    Returns:
+        A (new description, match count) tuple per description, or None where
+        nothing matched
+    """
+    subn = regex.subn
+    results: List[Optional[Tuple[str, int]]] = []
+    for description in descriptions:
+        new_description, count = subn(replacement, description)
+        results.append((new_description, count) if count else None)
+    return results
+
+
+class FindReplace:
+    """A find and replace operation over every unique description in a roster."""
+
+    def __init__(self, pattern: str, replacement: str, use_regex: bool = True,
+                 ignore_case: bool = False):
+        """
+        Compile a find and replace operation.
+
+        Args:
+            pattern: The text or regular expression to find
+            replacement: The replacement text; may use group references when
+                use_regex is set
+            use_regex: Whether pattern is a regular expression
+            ignore_case: Whether matching ignores case
+
+        Raises:
+            re.error: If the pattern is not a valid regular expression
+        """
+        flags = re.MULTILINE | (re.IGNORECASE if ignore_case else 0)
+        if not use_regex:
+            pattern = re.escape(pattern)
+            replacement = replacement.replace("\\", "\\\\")
+        self.regex = re.compile(pattern, flags)
+        self.replacement = replacement
+
+    def plan(self, unit_manager) -> List[Replacement]:
+        """
+        Find every profile the replacement would change, without changing it.
+
+        Each distinct description is processed once, however many profiles
+        and models share it.
+
+        Args:
+            unit_manager: The unit manager to search
+
+        Returns:
+            The planned replacements, in unit and profile order
+        """
+        targets: Dict[str, List[Tuple[int, int]]] = {}
+        for unit_index, unit in enumerate(unit_manager.units):
+            for profile_index, profile in enumerate(unit.profiles):
+                targets.setdefault(profile.description, []).append((unit_index, profile_index))
+
+        descriptions = list(targets)
+        results = map_chunks(
+            functools.partial(_replace_chunk, self.regex, self.replacement),
+            descriptions
+        )
+
+        replacements = []
+        for description, result in zip(descriptions, results):
+            if result is None:
+                continue
+            new_description, count = result
+            for unit_index, profile_index in targets[description]:
+                unit = unit_manager.units[unit_index]
+                profile = unit.profiles[profile_index]
+                replacements.append(Replacement(
+                    unit_index, profile_index, unit.name, profile.name, profile.count,
+                    description, new_description, count
+                ))
+
+        replacements.sort(key=lambda r: (r.unit_index, r.profile_index))
+        return replacements
+
+
+def apply_replacements(unit_manager, replacements: List[Replacement]) -> int:
+    """
+    Commit planned replacements in one pass through save_descriptions.
+
+    Args:
+        unit_manager: The unit manager the replacements were planned against
+        replacements: The replacements to apply
+
+    Returns:
+        The number of profiles changed
+    """
+    return len(unit_manager.save_descriptions({
+        (replacement.unit_index, replacement.profile_index): replacement.new_description
+        for replacement in replacements
+    }))
@@ -0,0 +1,195 @@
+"""
+Fuzzy matching of unit names for the Warhammer 40k TTS Unit Editor.
+
+Names are indexed by MinHash signatures of their character trigrams, so the
+candidates for a name are found through a few index buckets instead of by
+comparing every pair of names; only candidates are compared in full. The
+work grows with the number of names and near-duplicates, not their square.
+"""
+import random
+import re
+import zlib
+from difflib import SequenceMatcher
+from itertools import chain
+from typing import Dict, List, Sequence, Set, Tuple
+
+
+_DIGITS = re.compile(r'\d+')
+
+
+def trigrams(name: str) -> Set[str]:
+    """
+    Get the character trigrams of a name, case-insensitively.
+
+    Args:
+        name: The name
+
+    Returns:
+        The set of trigrams, including ones for the start and end of the name
+    """
+    padded = f"  {' '.join(name.lower().split())} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class MergeSuggestion:
+    """A group of unit names that look like spellings of one name."""
+
+    __slots__ = ("target", "sources")
+
+    def __init__(self, target: str, sources: List[str]):
+        """
+        Initialize a merge suggestion.
+
+        Args:
+            target: The name to keep
+            sources: The names to merge into target
+        """
+        self.target = target
+        self.sources = sources
+
+    def __repr__(self):
+        return f"MergeSuggestion({self.target!r}, {self.sources!r})"
+
+
+class TrigramIndex:
+    """
+    A MinHash index of the trigram sets of names.
+
+    Each name gets a signature of minimum trigram hashes, cut into bands;
+    names with an identical band share a bucket. Two names are likely to
+    share a bucket when their trigram sets overlap a lot and unlikely when
+    they do not, so finding the candidates of a name reads a few small
+    buckets instead of every other name. With the default 12 bands of 5
+    rows, a pair with a Jaccard overlap of 0.8 (a typo in a twenty letter
+    name) is found 99% of the time and a pair overlapping by 0.3 about 3%
+    of the time.
+    """
+
+    # Modulus of the hash functions, a Mersenne prime
+    PRIME = (1 << 31) - 1
+
+    def __init__(self, names: Sequence[str], bands: int = 12, rows: int = 5, seed: int = 40000):
+        """
+        Index a list of names.
+
+        Args:
+            names: The names
+            bands: The number of bands; more bands find more candidates
+            rows: The number of hashes per band; more rows find fewer
+            seed: Seed of the hash functions, fixed so results are repeatable
+        """
+        self.names = list(names)
+        self.grams: List[Set[str]] = [trigrams(name) for name in self.names]
+        self.bands = bands
+        self.rows = rows
+
+        rng = random.Random(seed)
+        self._coefficients = [
+            (rng.randrange(1, self.PRIME), rng.randrange(self.PRIME)) for _ in range(bands * rows)
+        ]
+        self._gram_hashes: Dict[str, Tuple[int, ...]] = {}
+
+        self.buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+        self.keys: List[List[Tuple[int, Tuple[int, ...]]]] = []
+        for index, grams in enumerate(self.grams):
+            signature = self._signature(grams)
+            keys = [
+                (band, signature[band * rows:(band + 1) * rows]) for band in range(bands)
+            ]
+            self.keys.append(keys)
+            for key in keys:
+                self.buckets.setdefault(key, []).append(index)
+
+    def _signature(self, grams: Set[str]) -> Tuple[int, ...]:
+        """Get the MinHash signature of a set of trigrams."""
+        hashes = []
+        for gram in grams:
+            gram_hashes = self._gram_hashes.get(gram)
+            if gram_hashes is None:
+                value = zlib.crc32(gram.encode('utf-8'))
+                gram_hashes = self._gram_hashes[gram] = tuple(
+                    (a * value + b) % self.PRIME for a, b in self._coefficients
+                )
+            hashes.append(gram_hashes)
+        return tuple(map(min, zip(*hashes)))
+
+    def candidates(self, index: int, min_overlap: float) -> List[int]:
+        """
+        Find names sharing a bucket and enough trigrams with a name.
+
+        Args:
+            index: The index of the name
+            min_overlap: The minimum Dice coefficient of the trigram sets
+
+        Returns:
+            The indices of the candidate names, excluding the name itself
+        """
+        grams = self.grams[index]
+        seen = set(chain.from_iterable(self.buckets[key] for key in self.keys[index]))
+        seen.discard(index)
+        return [
+            other for other in seen
+            if 2 * len(grams & self.grams[other]) >=
+            min_overlap * (len(grams) + len(self.grams[other]))
+        ]
+
+
+def similar(a: str, b: str, threshold: float) -> bool:
+    """
+    Check whether two names look like spellings of the same name.
+
+    Names with different numbers ("Squad 1" and "Squad 2") are never similar.
+
+    Args:
+        a: A name
+        b: Another name
+        threshold: The minimum similarity ratio, between 0 and 1
+
+    Returns:
+        True if the names are similar
+    """
+    if _DIGITS.findall(a) != _DIGITS.findall(b):
+        return False
+    matcher = SequenceMatcher(None, a.lower(), b.lower())
+    # Cheap upper bounds first
+    return (matcher.real_quick_ratio() >= threshold and matcher.quick_ratio() >= threshold and
+            matcher.ratio() >= threshold)
+
+
+def suggest_merges(weights: Dict[str, int], threshold: float = 0.9,
+                   min_overlap: float = 0.75) -> List[MergeSuggestion]:
+    """
+    Group names that look like spellings of one name.
+
+    Names are taken heaviest first; each name not yet grouped is grouped with
+    the ungrouped names similar to it. Groups do not chain, so two names
+    are only grouped if both are similar to the name kept.
+
+    Args:
+        weights: The names to group, with a weight such as the model count;
+            the heaviest name of a group is the one suggested to keep
+        threshold: The minimum similarity ratio of two names, see similar
+        min_overlap: The minimum trigram overlap of two names to compare them
+
+    Returns:
+        The suggested merges, sorted by target name
+    """
+    names = sorted(weights, key=lambda name: (-weights[name], name))
+    index = TrigramIndex(names)
+    grouped = [False] * len(names)
+
+    suggestions = []
+    for i, name in enumerate(names):
+        if grouped[i]:
+            continue
+        sources = [
+            j for j in index.candidates(i, min_overlap)
+            if not grouped[j] and similar(name, names[j], threshold)
+        ]
+        if not sources:
+            continue
+        grouped[i] = True
+        for j in sources:
+            grouped[j] = True
+        suggestions.append(MergeSuggestion(name, sorted(names[j] for j in sources)))
+    return sorted(suggestions, key=lambda suggestion: suggestion.target.lower())
@@ -0,0 +1,110 @@
+"""
+HTML datasheet export for the Warhammer 40k TTS Unit Editor.
+
+The document is produced by a chain of generators over the unit manager's
+units and written to the file as it is produced, so memory use does not grow
+with the size of the roster.
+"""
+from html import escape
+from typing import Iterator, Optional
+
+from .color_formatter import FormattedText, tokenize
+
+
+STYLE = """
+body { background: #1e1e1e; color: #e0e0e0; font-family: sans-serif; margin: 2em; }
+nav ul { columns: 3; }
+a { color: #8ab4f8; }
+section { border-top: 1px solid #444; margin-top: 1.5em; }
+pre { background: #2a2a2a; padding: 0.75em; white-space: pre-wrap; font-family: monospace; }
+.count { color: #999; font-weight: normal; }
+"""
+
+
+def _anchor(unit_index: int) -> str:
+    """Get the id of a unit's section."""
+    return f"unit-{unit_index}"
+
+
+def iter_formatted(formatted: FormattedText) -> Iterator[str]:
+    """
+    Render a tokenized description as HTML, coloring runs with spans.
+
+    Args:
+        formatted: The tokenized description
+
+    Yields:
+        Fragments of HTML
+    """
+    text = formatted.text
+    position = 0
+    for color, start, end in zip(formatted.colors, formatted.starts, formatted.ends):
+        if start > position:
+            yield escape(text[position:start])
+        yield f'<span style="color: #{color}">{escape(text[start:end])}</span>'
+        position = end
+    if position < len(text):
+        yield escape(text[position:])
+
+
+def iter_unit(unit, unit_index: int) -> Iterator[str]:
+    """
+    Render a unit and its profiles as an HTML section.
+
+    Args:
+        unit: The unit
+        unit_index: The index of the unit, used for its anchor
+
+    Yields:
+        Fragments of HTML
+    """
+    yield f'<section id="{_anchor(unit_index)}">\n<h2>{escape(unit.name)}</h2>\n'
+    for profile in unit.profiles:
+        yield f'<h3>{escape(profile.name)}'
+        if profile.nickname and profile.nickname != profile.name:
+            yield f' &mdash; {escape(profile.nickname)}'
+        yield f' <span class="count">&times;{profile.count}</span></h3>\n<pre>'
+        # Not through the preview's cache, which a whole roster would evict; weapon keywords are kept
+        yield from iter_formatted(tokenize(profile.description, literal_brackets=True))
+        yield '</pre>\n'
+    yield '</section>\n'
+
+
+def iter_html(unit_manager, title: str) -> Iterator[str]:
+    """
+    Render every unit of a unit manager as an HTML document.
+
+    Args:
+        unit_manager: The unit manager to render
+        title: The document title
+
+    Yields:
+        Fragments of HTML
+    """
+    yield ('<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+           f'<title>{escape(title)}</title>\n<style>{STYLE}</style>\n</head>\n<body>\n'
+           f'<h1>{escape(title)}</h1>\n<nav>\n<ul>\n')
+    for unit_index, unit in enumerate(unit_manager.units):
+        yield f'<li><a href="#{_anchor(unit_index)}">{escape(unit.name)}</a></li>\n'
+    yield '</ul>\n</nav>\n'
+
+    for unit_index, unit in enumerate(unit_manager.units):
+        yield from iter_unit(unit, unit_index)
+    yield '</body>\n</html>\n'
+
+
+def export_html(unit_manager, file_path: str, title: Optional[str] = None) -> int:
+    """
+    Export every unit and profile to a static HTML datasheet.
+
+    Args:
+        unit_manager: The unit manager to export
+        file_path: Path of the HTML file to write
+        title: Optional document title; defaults to "Roster"
+
+    Returns:
+        The number of profiles exported
+    """
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.writelines(iter_html(unit_manager, title or "Roster"))
+    return sum(len(unit.profiles) for unit in unit_manager.units)
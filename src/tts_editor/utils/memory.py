@@ -0,0 +1,224 @@
+"""
+Opt-in memory accounting for the Warhammer 40k TTS Unit Editor.
+
+While enabled, tracemalloc snapshots are taken around the main phases of the
+editor (reading and loading a save, grouping units, populating the structured
+editor and saving) and the memory each phase left allocated is attributed to
+the tts_editor module closest to the allocation, so memory allocated by the
+json module while decoding a save counts towards the module that decoded it.
+Memory allocated inside Tcl/Tk itself is not visible to tracemalloc; only the
+Python side of widgets is counted.
+"""
+import json
+import os
+import sys
+import tracemalloc
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Frames kept per allocation; enough to reach editor code from deep inside json or tkinter
+TRACEBACK_DEPTH = 32
+
+# Group for allocations with no tts_editor frame in their traceback
+OTHER_MODULE = "<other>"
+
+_PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_PACKAGE = os.path.basename(_PACKAGE_DIR)
+_THIS_FILE = os.path.abspath(__file__)
+
+# Tracebacks are ordered oldest frame first from Python 3.7, newest first before
+_NEWEST_FIRST = sys.version_info < (3, 7)
+
+
+def module_name(filename: str) -> Optional[str]:
+    """
+    Get the dotted tts_editor module name of a source file.
+
+    Args:
+        filename: The source file path
+
+    Returns:
+        The module name, e.g. "tts_editor.models.unit", or None for files
+        outside the package
+    """
+    filename = os.path.abspath(filename)
+    if not filename.startswith(_PACKAGE_DIR + os.sep) or filename == _THIS_FILE:
+        return None
+    relative = os.path.splitext(os.path.relpath(filename, _PACKAGE_DIR))[0]
+    parts = [_PACKAGE] + relative.split(os.sep)
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+
+def owning_module(traceback: tracemalloc.Traceback) -> str:
+    """
+    Get the tts_editor module closest to an allocation.
+
+    Args:
+        traceback: The traceback of the allocation
+
+    Returns:
+        The module name, or OTHER_MODULE if no frame is in the package
+    """
+    frames = traceback if _NEWEST_FIRST else reversed(traceback)
+    for frame in frames:
+        name = module_name(frame.filename)
+        if name is not None:
+            return name
+    return OTHER_MODULE
+
+
+class _NullPhase:
+    """Phase returned while accounting is disabled; does nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class _Phase:
+    """Snapshots memory around a block of code and records it in an accountant."""
+
+    __slots__ = ("accountant", "name", "before")
+
+    def __init__(self, accountant: "MemoryAccountant", name: str):
+        self.accountant = accountant
+        self.name = name
+        self.before = None
+
+    def __enter__(self):
+        self.before = tracemalloc.take_snapshot()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        after = tracemalloc.take_snapshot()
+        self.accountant.record(self.name, self.before, after)
+        self.before = None
+        return False
+
+
+class MemoryAccountant:
+    """Records the memory left allocated by named phases, grouped by module."""
+
+    def __init__(self, top: int = 10):
+        """
+        Initialize the accountant.
+
+        Args:
+            top: The number of modules kept per recorded phase
+        """
+        self.enabled = False
+        self.top = top
+        # Phase name -> module -> [size in bytes, allocation count], accumulated
+        self.phases: Dict[str, Dict[str, List[int]]] = {}
+        self.counts: Dict[str, int] = {}
+
+    def start(self) -> None:
+        """Start tracing allocations and recording phases."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEBACK_DEPTH)
+        self.enabled = True
+
+    def stop(self) -> None:
+        """Stop recording phases and tracing allocations."""
+        self.enabled = False
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def phase(self, name: str):
+        """
+        Get a context manager that accounts the memory a block of code leaves allocated.
+
+        Args:
+            name: The phase name
+
+        Returns:
+            A context manager; a shared no-op one while accounting is disabled
+        """
+        if not self.enabled:
+            return _NULL_PHASE
+        return _Phase(self, name)
+
+    def record(self, name: str, before: tracemalloc.Snapshot, after: tracemalloc.Snapshot) -> None:
+        """
+        Record the difference between two snapshots as a phase.
+
+        Args:
+            name: The phase name
+            before: The snapshot taken when the phase started
+            after: The snapshot taken when the phase ended
+        """
+        modules = self.phases.setdefault(name, {})
+        for diff in after.compare_to(before, "traceback"):
+            if not diff.size_diff and not diff.count_diff:
+                continue
+            entry = modules.setdefault(owning_module(diff.traceback), [0, 0])
+            entry[0] += diff.size_diff
+            entry[1] += diff.count_diff
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    def clear(self) -> None:
+        """Remove all recorded phases."""
+        self.phases.clear()
+        self.counts.clear()
+
+    def top_modules(self, name: str) -> List[Tuple[str, int, int]]:
+        """
+        Get the modules that allocated the most memory in a phase.
+
+        Args:
+            name: The phase name
+
+        Returns:
+            Up to top (module, size in bytes, allocation count) tuples, largest first
+        """
+        modules = self.phases.get(name, {})
+        ranked = sorted(modules.items(), key=lambda item: item[1][0], reverse=True)
+        return [(module, size, count) for module, (size, count) in ranked[:self.top]]
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Summarize the recorded phases.
+
+        Returns:
+            A dictionary mapping phase names to their run count, net size in
+            bytes and top modules
+        """
+        current, peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+        return {
+            "traced_bytes": current,
+            "peak_bytes": peak,
+            "phases": {
+                name: {
+                    "count": self.counts.get(name, 0),
+                    "size_bytes": sum(size for size, _ in modules.values()),
+                    "modules": [
+                        {"module": module, "size_bytes": size, "allocations": count}
+                        for module, size, count in self.top_modules(name)
+                    ],
+                }
+                for name, modules in self.phases.items()
+            },
+        }
+
+    def export_json(self, file_path: str) -> None:
+        """
+        Export the memory report to a JSON file.
+
+        Args:
+            file_path: The path to write to
+        """
+        with open(file_path, 'w', encoding='utf-8') as file:
+            json.dump(self.report(), file, indent=2)
+
+
+# Shared memory accountant used by the editor
+memory = MemoryAccountant()
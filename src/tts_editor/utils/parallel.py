@@ -0,0 +1,71 @@
+"""
+Process pool helpers for the Warhammer 40k TTS Unit Editor.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Sequence, TypeVar
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def worker_count(max_workers: Optional[int] = None) -> int:
+    """
+    Get the number of worker processes to use.
+
+    Args:
+        max_workers: Optional cap on the number of workers
+
+    Returns:
+        The number of workers, at least 1
+    """
+    count = os.cpu_count() or 1
+    if max_workers:
+        count = min(count, max_workers)
+    return max(count, 1)
+
+
+def chunked(items: Sequence[T], chunk_size: int) -> List[Sequence[T]]:
+    """
+    Split a sequence into chunks.
+
+    Args:
+        items: The items to split
+        chunk_size: The maximum number of items per chunk
+
+    Returns:
+        The list of chunks
+    """
+    return [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+
+def map_chunks(func: Callable[[Sequence[T]], List[R]], items: Sequence[T],
+               chunk_size: int = 500, min_parallel: int = 2000,
+               max_workers: Optional[int] = None) -> List[R]:
+    """
+    Apply a function to chunks of items, across worker processes for large inputs.
+
+    Small inputs, or machines with a single CPU, are processed in this process
+    since starting workers would cost more than it saves.
+
+    Args:
+        func: A module-level function mapping a chunk of items to a list of results
+        items: The items to process
+        chunk_size: The maximum number of items per chunk
+        min_parallel: The minimum number of items before a process pool is used
+        max_workers: Optional cap on the number of worker processes
+
+    Returns:
+        The results for every item, in order
+    """
+    workers = worker_count(max_workers)
+    if len(items) < min_parallel or workers == 1:
+        return func(items)
+
+    chunk_size = max(1, min(chunk_size, -(-len(items) // workers)))
+    results: List[R] = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk_results in executor.map(func, chunked(items, chunk_size)):
+            results.extend(chunk_results)
+    return results
@@ -0,0 +1,153 @@
+"""
+Lightweight profiling spans for the Warhammer 40k TTS Unit Editor.
+"""
+import functools
+import json
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Tuple
+
+
+class _NullSpan:
+    """Span returned while profiling is disabled; does nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Times a block of code and records it in a profiler."""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.record(self.name, self.start, time.perf_counter() - self.start)
+        return False
+
+
+class Profiler:
+    """Records timed spans in a fixed-size ring buffer."""
+
+    def __init__(self, capacity: int = 4096):
+        """
+        Initialize the profiler.
+
+        Args:
+            capacity: The maximum number of spans kept in the ring buffer
+        """
+        self.enabled = False
+        self.records: Deque[Tuple[str, float, float]] = deque(maxlen=capacity)
+
+    def span(self, name: str):
+        """
+        Get a context manager that times a block of code.
+
+        Args:
+            name: The span name
+
+        Returns:
+            A context manager; a shared no-op one while profiling is disabled
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def record(self, name: str, start: float, duration: float) -> None:
+        """
+        Record a finished span.
+
+        Args:
+            name: The span name
+            start: The perf_counter value when the span started
+            duration: The span duration in seconds
+        """
+        self.records.append((name, start, duration))
+
+    def clear(self) -> None:
+        """Remove all recorded spans."""
+        self.records.clear()
+
+    def statistics(self) -> Dict[str, Dict[str, float]]:
+        """
+        Summarize the recorded spans by name.
+
+        Returns:
+            A dictionary mapping span names to count, total, mean, max and last
+            durations in milliseconds
+        """
+        stats: Dict[str, Dict[str, float]] = {}
+        for name, _, duration in self.records:
+            ms = duration * 1000.0
+            entry = stats.get(name)
+            if entry is None:
+                entry = stats[name] = {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "last_ms": 0.0}
+            entry["count"] += 1
+            entry["total_ms"] += ms
+            entry["last_ms"] = ms
+            if ms > entry["max_ms"]:
+                entry["max_ms"] = ms
+
+        for entry in stats.values():
+            entry["mean_ms"] = entry["total_ms"] / entry["count"]
+        return stats
+
+    def export_json(self, file_path: str) -> None:
+        """
+        Export the span statistics and the raw ring buffer to a JSON file.
+
+        Args:
+            file_path: The path to write to
+        """
+        data: Dict[str, Any] = {
+            "statistics": self.statistics(),
+            "spans": [
+                {"name": name, "start": start, "duration_ms": duration * 1000.0}
+                for name, start, duration in self.records
+            ],
+        }
+        with open(file_path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, indent=2)
+
+
+def profiled(name: str) -> Callable:
+    """
+    Decorator that wraps a function call in a profiling span.
+
+    Args:
+        name: The span name
+
+    Returns:
+        The decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not profiler.enabled:
+                return func(*args, **kwargs)
+            with _Span(profiler, name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# Shared profiler used by the editor
+profiler = Profiler()
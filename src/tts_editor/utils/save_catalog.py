@@ -0,0 +1,690 @@
+"""
+Catalog of a TTS Saves directory for the Warhammer 40k TTS Unit Editor.
+
+Every save in a directory tree is scanned for the nickname, GUID, unit and
+profile of each object, and the results are stored in a local SQLite index.
+Saves are read with a streaming reader that decodes ObjectStates one object
+at a time, in a process pool, so scanning never holds a whole save in memory.
+Rescans only read saves whose size or modification time changed.
+
+The unit names, weapon names and ability names of every profile also go into
+an inverted index of their words, so a search across all catalogued saves
+reads a few index entries instead of opening any save.
+"""
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ..models.unit import object_key, split_nickname
+from .description_parser import parse_profile
+from .parallel import worker_count
+
+
+# Default location of the catalog database
+DEFAULT_CATALOG_PATH = os.path.join(os.path.expanduser("~"), ".tts_editor", "catalog.sqlite")
+
+# Characters read from a save at a time
+CHUNK_SIZE = 1 << 20
+
+# Catalogs written with an older schema are emptied and rescanned
+SCHEMA_VERSION = 2
+
+# Kinds of indexed phrases, and how much a matching word counts towards a result's score
+UNIT, WEAPON, ABILITY = 0, 1, 2
+KIND_NAMES = {UNIT: "unit", WEAPON: "weapon", ABILITY: "ability"}
+KIND_WEIGHTS = {UNIT: 3.0, WEAPON: 2.0, ABILITY: 1.5}
+
+# Query words shorter than this only match whole words, not prefixes
+MIN_PREFIX_LENGTH = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS roots (
+    path TEXT PRIMARY KEY,
+    scanned_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS saves (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    save_name TEXT NOT NULL,
+    object_count INTEGER NOT NULL,
+    unit_count INTEGER NOT NULL,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS objects (
+    save_id INTEGER NOT NULL REFERENCES saves(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    guid TEXT NOT NULL,
+    nickname TEXT NOT NULL,
+    unit_name TEXT NOT NULL,
+    profile_name TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_objects_save ON objects(save_id);
+CREATE INDEX IF NOT EXISTS idx_objects_unit ON objects(unit_name);
+CREATE TABLE IF NOT EXISTS profiles (
+    id INTEGER PRIMARY KEY,
+    save_id INTEGER NOT NULL REFERENCES saves(id) ON DELETE CASCADE,
+    unit_name TEXT NOT NULL,
+    profile_name TEXT NOT NULL,
+    model_count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_profiles_save ON profiles(save_id);
+CREATE TABLE IF NOT EXISTS phrases (
+    id INTEGER PRIMARY KEY,
+    profile_id INTEGER NOT NULL REFERENCES profiles(id) ON DELETE CASCADE,
+    kind INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    guid TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_phrases_profile ON phrases(profile_id);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    phrase_id INTEGER NOT NULL REFERENCES phrases(id) ON DELETE CASCADE,
+    profile_id INTEGER NOT NULL,
+    kind INTEGER NOT NULL,
+    word_count INTEGER NOT NULL,
+    PRIMARY KEY (term, phrase_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_postings_phrase ON postings(phrase_id);
+"""
+
+# The top-level ObjectStates key; a quote escaped inside a string can't match
+_OBJECT_STATES = re.compile(r'(?<!\\)"ObjectStates"\s*:\s*\[')
+_SAVE_NAME = re.compile(r'(?<!\\)"SaveName"\s*:\s*("(?:[^"\\]|\\.)*")')
+_COLOR_CODE = re.compile(r'\[[0-9a-fA-F]{6}\]|\[-\]')
+_WORD = re.compile(r'[^\W_]+')
+
+# (position, GUID, nickname, unit name, profile name) of an object
+ObjectRow = Tuple[int, str, str, str, str]
+
+# (unit name, profile name, model count, [(kind, phrase, GUID of the first model with it)])
+# of the models sharing a unit and profile name
+ProfileRow = Tuple[str, str, int, List[Tuple[int, str, str]]]
+
+
+class SearchResult:
+    """A catalogued profile matching a search."""
+
+    __slots__ = ("score", "path", "save_name", "guid", "unit_name", "profile_name", "matches")
+
+    def __init__(self, score: float, path: str, save_name: str, guid: str, unit_name: str,
+                 profile_name: str, matches: List[Tuple[int, str]]):
+        """
+        Initialize a search result.
+
+        Args:
+            score: The relevance of the result; higher is better
+            path: The path to the save
+            save_name: The name of the save
+            guid: The GUID of a model with the profile, see UnitManager.find_profile
+            unit_name: The name of the unit
+            profile_name: The name of the profile
+            matches: The (kind, phrase) of each unit, weapon or ability name
+                that matched
+        """
+        self.score = score
+        self.path = path
+        self.save_name = save_name
+        self.guid = guid
+        self.unit_name = unit_name
+        self.profile_name = profile_name
+        self.matches = matches
+
+    def __repr__(self):
+        return (f"SearchResult({self.score:.2f}, {self.save_name!r}, "
+                f"{self.unit_name!r}, {self.profile_name!r})")
+
+
+def index_terms(text: str) -> List[str]:
+    """
+    Split text into the words it is indexed and searched by.
+
+    Args:
+        text: A unit, weapon or ability name, or a search query
+
+    Returns:
+        The lowercase words, without color codes or punctuation
+    """
+    return _WORD.findall(_COLOR_CODE.sub(" ", text).lower())
+
+
+def description_names(description: str) -> List[Tuple[int, str]]:
+    """
+    Get the weapon and ability names of a description.
+
+    Args:
+        description: The profile's description
+
+    Returns:
+        (kind, name) tuples for each weapon and ability; an ability is named
+        by its text up to any colon
+    """
+    _, ranged, melee, abilities = parse_profile(description)
+    names = []
+    for kind, name in ([(WEAPON, weapon.name) for weapon in ranged + melee] +
+                       [(ABILITY, ability.text.split(":", 1)[0]) for ability in abilities]):
+        name = _COLOR_CODE.sub("", name).strip()
+        if name:
+            names.append((kind, name))
+    return names
+
+
+def _best_score(phrase_scores: Dict[int, Dict[str, float]]) -> float:
+    """Sum the best score of each word over the phrases it matched."""
+    best: Dict[str, float] = {}
+    for term_scores in phrase_scores.values():
+        for term, score in term_scores.items():
+            if best.get(term, 0.0) < score:
+                best[term] = score
+    return sum(best.values())
+
+
+def default_saves_directory() -> str:
+    """
+    Get the usual location of Tabletop Simulator's Saves directory.
+
+    Returns:
+        The directory for this platform; it may not exist
+    """
+    home = os.path.expanduser("~")
+    if os.name == "nt":
+        return os.path.join(home, "Documents", "My Games", "Tabletop Simulator", "Saves")
+    if sys.platform == "darwin":
+        return os.path.join(home, "Library", "Tabletop Simulator", "Saves")
+    return os.path.join(home, ".local", "share", "Tabletop Simulator", "Saves")
+
+
+def iter_object_states(file_path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Decode the top-level ObjectStates of a save one object at a time.
+
+    Only the object being decoded is held in memory, along with at most a
+    chunk of the text around it.
+
+    Args:
+        file_path: The path to the save
+        chunk_size: The number of characters read at a time
+
+    Yields:
+        The object states, in order
+
+    Raises:
+        ValueError: If an object is not valid JSON
+    """
+    decoder = json.JSONDecoder()
+    with open(file_path, 'r', encoding='utf-8') as file:
+        # Find the start of the array, keeping a tail in case the key is split between chunks
+        buffer = ""
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                return
+            buffer = buffer[-64:] + chunk
+            match = _OBJECT_STATES.search(buffer)
+            if match:
+                buffer = buffer[match.end():]
+                break
+
+        position = 0
+        eof = False
+        while True:
+            while position < len(buffer) and buffer[position] in " \t\r\n,":
+                position += 1
+            if position >= len(buffer):
+                if eof:
+                    return
+                buffer = file.read(chunk_size)
+                position = 0
+                eof = not buffer
+                continue
+            if buffer[position] == "]":
+                return
+
+            try:
+                obj, end = decoder.raw_decode(buffer, position)
+            except ValueError:
+                if eof:
+                    raise
+                # The object continues past the buffer; read at least as much again
+                chunk = file.read(max(chunk_size, len(buffer) - position))
+                eof = not chunk
+                buffer = buffer[position:] + chunk
+                position = 0
+                continue
+
+            yield obj
+            position = end
+            if position >= chunk_size:
+                buffer = buffer[position:]
+                position = 0
+
+
+def read_save_name(file_path: str) -> str:
+    """
+    Read a save's name from the start of the file.
+
+    Args:
+        file_path: The path to the save
+
+    Returns:
+        The SaveName, or the file name if the save has none
+    """
+    with open(file_path, 'r', encoding='utf-8') as file:
+        match = _SAVE_NAME.search(file.read(4096))
+    if match:
+        try:
+            name = json.loads(match.group(1))
+            if name:
+                return name
+        except ValueError:
+            pass
+    return os.path.splitext(os.path.basename(file_path))[0]
+
+
+def scan_save(file_path: str) -> Tuple[str, str, List[ObjectRow], List[ProfileRow], Optional[str]]:
+    """
+    Scan a save for the units of its objects and the names in their profiles.
+
+    Models sharing a unit and profile name are indexed together, with the
+    union of their weapon and ability names; each name remembers the first
+    model whose description has it, so a search result can select that
+    model's profile. Each distinct description is parsed once. Runs in a
+    worker process; errors are returned rather than raised, so one broken
+    save doesn't stop a scan.
+
+    Args:
+        file_path: The path to the save
+
+    Returns:
+        A (file path, save name, object rows, profile rows, error) tuple;
+        error is None for saves read successfully
+    """
+    try:
+        save_name = read_save_name(file_path)
+        rows: List[ObjectRow] = []
+        profiles: Dict[Tuple[str, str], list] = {}  # (unit, profile) -> [model count, phrases by key, descriptions]
+        names: Dict[str, List[Tuple[int, str]]] = {}  # Parsed names by description
+        seen = set()
+        for position, obj in enumerate(iter_object_states(file_path)):
+            if not isinstance(obj, dict):
+                continue
+            guid = object_key(obj, position, seen)
+            seen.add(guid)
+            nickname = obj.get("Nickname") or f"Unit {position + 1}"
+            unit_name, profile_name = split_nickname(nickname)
+            rows.append((position, guid, nickname, unit_name, profile_name))
+
+            profile = profiles.get((unit_name, profile_name))
+            if profile is None:
+                profile = profiles[(unit_name, profile_name)] = [0, {(UNIT, unit_name.lower()): (UNIT, unit_name, guid)}, set()]
+            profile[0] += 1
+
+            description = obj.get("Description", "")
+            if description in profile[2]:
+                continue
+            profile[2].add(description)
+            if description not in names:
+                names[description] = description_names(description)
+            for kind, name in names[description]:
+                profile[1].setdefault((kind, name.lower()), (kind, name, guid))
+
+        profile_rows = [
+            (unit_name, profile_name, model_count, list(phrases.values()))
+            for (unit_name, profile_name), (model_count, phrases, _) in profiles.items()
+        ]
+        return file_path, save_name, rows, profile_rows, None
+    except (OSError, UnicodeDecodeError, ValueError) as e:
+        return file_path, os.path.basename(file_path), [], [], str(e)
+
+
+def find_saves(directory: str) -> Dict[str, Tuple[int, float]]:
+    """
+    Find the saves in a directory tree.
+
+    Args:
+        directory: The directory to search
+
+    Returns:
+        The (size, modification time) of every .json file, by absolute path
+    """
+    saves = {}
+    for folder, _, file_names in os.walk(directory):
+        for file_name in file_names:
+            if not file_name.lower().endswith(".json"):
+                continue
+            path = os.path.abspath(os.path.join(folder, file_name))
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            saves[path] = (stat.st_size, stat.st_mtime)
+    return saves
+
+
+class SaveCatalog:
+    """SQLite index of the saves in one or more directories."""
+
+    def __init__(self, db_path: str = DEFAULT_CATALOG_PATH):
+        """
+        Open or create a catalog.
+
+        Args:
+            db_path: The path of the SQLite database
+        """
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+        self.db_path = db_path
+        self.connection = sqlite3.connect(db_path)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.executescript(SCHEMA)
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version < SCHEMA_VERSION:
+            # Saves catalogued before the search index existed are read again by the next refresh
+            with self.connection:
+                self.connection.execute("DELETE FROM saves")
+                self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        """Close the database."""
+        self.connection.close()
+
+    def last_directory(self) -> Optional[str]:
+        """
+        Get the most recently scanned directory.
+
+        Returns:
+            The directory, or None if none was scanned
+        """
+        row = self.connection.execute(
+            "SELECT path FROM roots ORDER BY scanned_at DESC LIMIT 1"
+        ).fetchone()
+        return row[0] if row else None
+
+    def refresh(self, directory: str, max_workers: Optional[int] = None) -> Dict[str, int]:
+        """
+        Scan a directory tree, reading only new and changed saves.
+
+        Saves whose size and modification time match the catalog are not
+        read; saves that no longer exist are removed from it.
+
+        Args:
+            directory: The directory to scan
+            max_workers: Optional cap on the number of worker processes
+
+        Returns:
+            A dictionary with the number of added, updated, removed,
+            unchanged and failed saves
+        """
+        directory = os.path.abspath(directory)
+        found = find_saves(directory)
+        cursor = self.connection.cursor()
+
+        prefix = directory.rstrip(os.sep) + os.sep
+        known = {
+            path: (save_id, size, mtime)
+            for save_id, path, size, mtime in cursor.execute(
+                "SELECT id, path, size, mtime FROM saves WHERE substr(path, 1, ?) = ?",
+                (len(prefix), prefix)
+            )
+        }
+        # Largest saves first, so one big save doesn't finish alone at the end of a scan
+        changed = sorted(
+            (path for path, (size, mtime) in found.items()
+             if path not in known or known[path][1:] != (size, mtime)),
+            key=lambda path: -found[path][0]
+        )
+        removed = [known[path][0] for path in known if path not in found]
+
+        counts = {"added": 0, "updated": 0, "removed": len(removed),
+                  "unchanged": len(found) - len(changed), "failed": 0}
+        with self.connection:
+            cursor.executemany("DELETE FROM saves WHERE id = ?", [(save_id,) for save_id in removed])
+            for file_path, save_name, rows, profiles, error in self._scan(changed, max_workers):
+                size, mtime = found[file_path]
+                if file_path in known:
+                    save_id = known[file_path][0]
+                    cursor.execute("DELETE FROM objects WHERE save_id = ?", (save_id,))
+                    cursor.execute("DELETE FROM profiles WHERE save_id = ?", (save_id,))
+                    counts["updated"] += 1
+                else:
+                    save_id = None
+                    counts["added"] += 1
+                if error:
+                    counts["failed"] += 1
+                save_id = self._write_save(cursor, save_id, file_path, size, mtime, save_name, rows, error)
+                self._write_profiles(cursor, save_id, profiles)
+            cursor.execute(
+                "INSERT OR REPLACE INTO roots (path, scanned_at) VALUES (?, ?)",
+                (directory, time.time())
+            )
+        return counts
+
+    @staticmethod
+    def _scan(paths: List[str], max_workers: Optional[int] = None) -> Iterator[tuple]:
+        """Scan saves, across worker processes when there are several."""
+        workers = min(worker_count(max_workers), len(paths))
+        if workers <= 1:
+            for path in paths:
+                yield scan_save(path)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for result in executor.map(scan_save, paths):
+                yield result
+
+    @staticmethod
+    def _write_save(cursor: sqlite3.Cursor, save_id: Optional[int], file_path: str, size: int,
+                    mtime: float, save_name: str, rows: List[ObjectRow],
+                    error: Optional[str]) -> int:
+        """Write a scanned save and its objects, returning the save's id."""
+        unit_count = len({row[3] for row in rows})
+        if save_id is None:
+            cursor.execute(
+                "INSERT INTO saves (path, size, mtime, save_name, object_count, unit_count, error) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (file_path, size, mtime, save_name, len(rows), unit_count, error)
+            )
+            save_id = cursor.lastrowid
+        else:
+            cursor.execute(
+                "UPDATE saves SET size = ?, mtime = ?, save_name = ?, object_count = ?, "
+                "unit_count = ?, error = ? WHERE id = ?",
+                (size, mtime, save_name, len(rows), unit_count, error, save_id)
+            )
+        cursor.executemany(
+            "INSERT INTO objects (save_id, position, guid, nickname, unit_name, profile_name) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [(save_id,) + row for row in rows]
+        )
+        return save_id
+
+    @staticmethod
+    def _write_profiles(cursor: sqlite3.Cursor, save_id: int, profiles: List[ProfileRow]) -> None:
+        """Write the profiles of a scanned save and the words of their names."""
+        # Ids are assigned here so every table is written with a single executemany
+        profile_id = cursor.execute("SELECT COALESCE(MAX(id), 0) FROM profiles").fetchone()[0]
+        phrase_id = cursor.execute("SELECT COALESCE(MAX(id), 0) FROM phrases").fetchone()[0]
+        profile_rows, phrase_rows, posting_rows = [], [], []
+        for unit_name, profile_name, model_count, phrases in profiles:
+            profile_id += 1
+            profile_rows.append((profile_id, save_id, unit_name, profile_name, model_count))
+            for kind, text, guid in phrases:
+                terms = set(index_terms(text))
+                if not terms:
+                    continue
+                phrase_id += 1
+                phrase_rows.append((phrase_id, profile_id, kind, text, guid))
+                posting_rows.extend((term, phrase_id, profile_id, kind, len(terms)) for term in terms)
+
+        cursor.executemany(
+            "INSERT INTO profiles (id, save_id, unit_name, profile_name, model_count) "
+            "VALUES (?, ?, ?, ?, ?)",
+            profile_rows
+        )
+        cursor.executemany(
+            "INSERT INTO phrases (id, profile_id, kind, text, guid) VALUES (?, ?, ?, ?, ?)",
+            phrase_rows
+        )
+        posting_rows.sort()
+        cursor.executemany(
+            "INSERT INTO postings (term, phrase_id, profile_id, kind, word_count) VALUES (?, ?, ?, ?, ?)",
+            posting_rows
+        )
+
+    def saves(self, text: str = "") -> List[Tuple[int, str, str, int, int, float, Optional[str]]]:
+        """
+        List the catalogued saves, optionally only those matching some text.
+
+        Args:
+            text: Text to find in the save name, file name or a unit name,
+                case-insensitively; every save if empty
+
+        Returns:
+            (id, path, save name, unit count, object count, modification time,
+            error) tuples, most recently modified first
+        """
+        query = (
+            "SELECT id, path, save_name, unit_count, object_count, mtime, error FROM saves"
+        )
+        parameters: tuple = ()
+        if text:
+            pattern = f"%{text}%"
+            query += (
+                " WHERE save_name LIKE ? OR path LIKE ? OR id IN "
+                "(SELECT save_id FROM objects WHERE unit_name LIKE ?)"
+            )
+            parameters = (pattern, pattern, pattern)
+        query += " ORDER BY mtime DESC"
+        return self.connection.execute(query, parameters).fetchall()
+
+    def units(self, save_id: int) -> List[Tuple[str, int]]:
+        """
+        List the units of a catalogued save.
+
+        Args:
+            save_id: The id of the save
+
+        Returns:
+            (unit name, model count) tuples, sorted by name
+        """
+        return self.connection.execute(
+            "SELECT unit_name, COUNT(*) FROM objects WHERE save_id = ? "
+            "GROUP BY unit_name ORDER BY unit_name COLLATE NOCASE",
+            (save_id,)
+        ).fetchall()
+
+    def search(self, query: str, limit: int = 100) -> List[SearchResult]:
+        """
+        Find the catalogued profiles whose unit, weapon or ability names
+        contain every word of a query.
+
+        Only the inverted index is read. Each query word matches the words
+        it starts (the whole word only for short words). A word scores more
+        for matching a whole word than a prefix, for matching a shorter name,
+        and for matching a unit name over a weapon name over an ability name;
+        a profile's score is the sum of its best score for each word.
+
+        Args:
+            query: The words to search for
+            limit: The maximum number of results
+
+        Returns:
+            The best results, best first
+        """
+        terms = list(dict.fromkeys(index_terms(query)))
+        if not terms:
+            return []
+
+        postings = []
+        for term in terms:
+            if len(term) >= MIN_PREFIX_LENGTH:
+                rows = self.connection.execute(
+                    "SELECT term, phrase_id, profile_id, kind, word_count FROM postings "
+                    "WHERE term >= ? AND term < ?",
+                    (term, term + "\uffff")
+                ).fetchall()
+            else:
+                rows = self.connection.execute(
+                    "SELECT term, phrase_id, profile_id, kind, word_count FROM postings WHERE term = ?",
+                    (term,)
+                ).fetchall()
+            if not rows:
+                return []
+            postings.append((term, rows))
+
+        # Start from the rarest word, so the other words only score its profiles
+        postings.sort(key=lambda item: len(item[1]))
+        kinds: Dict[int, int] = {}
+        matched: Optional[Dict[int, Dict[int, Dict[str, float]]]] = None  # Word scores by phrase, by profile
+        for term, rows in postings:
+            term_matched: Dict[int, Dict[int, Dict[str, float]]] = {}
+            for word, phrase_id, profile_id, kind, word_count in rows:
+                if matched is not None and profile_id not in matched:
+                    continue
+                score = KIND_WEIGHTS[kind] * (1.0 if word == term else 0.5) / word_count
+                kinds[phrase_id] = kind
+                term_scores = term_matched.setdefault(profile_id, {}).setdefault(phrase_id, {})
+                if term_scores.get(term, 0.0) < score:
+                    term_scores[term] = score
+            if matched is not None:
+                for profile_id, phrase_scores in term_matched.items():
+                    for phrase_id, term_scores in matched[profile_id].items():
+                        phrase_scores.setdefault(phrase_id, {}).update(term_scores)
+            matched = term_matched
+            if not matched:
+                return []
+
+        ranked = sorted(
+            ((_best_score(phrase_scores), profile_id, phrase_scores)
+             for profile_id, phrase_scores in matched.items()),
+            key=lambda item: (-item[0], item[1])
+        )[:limit]
+
+        # The fewest names covering every word, best first
+        covers = []
+        for _, _, phrase_scores in ranked:
+            covered, cover = set(), []
+            for phrase_id, term_scores in sorted(phrase_scores.items(),
+                                                 key=lambda item: (-sum(item[1].values()), item[0])):
+                if not term_scores.keys() <= covered:
+                    cover.append(phrase_id)
+                    covered.update(term_scores)
+            covers.append(cover)
+
+        profiles = self._fetch_by_id(
+            "SELECT profiles.id, saves.path, saves.save_name, profiles.unit_name, profiles.profile_name "
+            "FROM profiles JOIN saves ON saves.id = profiles.save_id WHERE profiles.id IN ({})",
+            [profile_id for _, profile_id, _ in ranked]
+        )
+        phrases = self._fetch_by_id(
+            "SELECT id, kind, text, guid FROM phrases WHERE id IN ({})",
+            list({phrase_id for cover in covers for phrase_id in cover})
+        )
+
+        results = []
+        for (score, profile_id, _), cover in zip(ranked, covers):
+            # Every model of the profile has its unit name, so select one with a matching weapon or ability
+            selected = next((phrase_id for phrase_id in cover if kinds[phrase_id] != UNIT), cover[0])
+            path, save_name, unit_name, profile_name = profiles[profile_id]
+            results.append(SearchResult(
+                score, path, save_name, phrases[selected][2], unit_name, profile_name,
+                [phrases[phrase_id][:2] for phrase_id in cover]
+            ))
+        return results
+
+    def _fetch_by_id(self, query: str, ids: List[int]) -> Dict[int, tuple]:
+        """Run a query for rows by id, with an "IN ({})" placeholder for the ids."""
+        rows = {}
+        # In batches, under SQLite's limit on the number of parameters
+        for start in range(0, len(ids), 500):
+            batch = ids[start:start + 500]
+            for row in self.connection.execute(query.format(",".join("?" * len(batch))), batch):
+                rows[row[0]] = row[1:]
+        return rows
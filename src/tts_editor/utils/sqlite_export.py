@@ -0,0 +1,190 @@
+"""
+SQLite roster export for the Warhammer 40k TTS Unit Editor.
+"""
+import sqlite3
+from typing import Dict, Iterator, Tuple
+
+from . import description_parser
+from .description_parser import description_hash
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS units (
+    name TEXT PRIMARY KEY,
+    profile_count INTEGER NOT NULL,
+    model_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS profiles (
+    id INTEGER PRIMARY KEY,
+    unit_name TEXT NOT NULL,
+    profile_name TEXT NOT NULL,
+    nickname TEXT NOT NULL,
+    model_count INTEGER NOT NULL,
+    description_hash TEXT NOT NULL,
+    description TEXT NOT NULL,
+    M TEXT, T TEXT, Sv TEXT, W TEXT, Ld TEXT, OC TEXT,
+    UNIQUE (unit_name, profile_name, description_hash)
+);
+CREATE TABLE IF NOT EXISTS weapons (
+    profile_id INTEGER NOT NULL REFERENCES profiles(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    name TEXT NOT NULL,
+    range TEXT, A TEXT, skill TEXT, S TEXT, AP TEXT, D TEXT,
+    abilities TEXT
+);
+CREATE TABLE IF NOT EXISTS abilities (
+    profile_id INTEGER NOT NULL REFERENCES profiles(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_profiles_unit ON profiles(unit_name);
+CREATE INDEX IF NOT EXISTS idx_weapons_profile ON weapons(profile_id);
+CREATE INDEX IF NOT EXISTS idx_weapons_name ON weapons(name);
+CREATE INDEX IF NOT EXISTS idx_abilities_profile ON abilities(profile_id);
+CREATE INDEX IF NOT EXISTS idx_abilities_text ON abilities(text);
+"""
+
+# Number of profiles written per executemany batch
+BATCH_SIZE = 500
+
+ProfileKey = Tuple[str, str, str]
+
+
+def _iter_profiles(unit_manager) -> Iterator[Tuple[ProfileKey, object]]:
+    """Yield every profile with its (unit name, profile name, hash) key."""
+    for unit in unit_manager.units:
+        for profile in unit.profiles:
+            yield (unit.name, profile.name, description_hash(profile.description)), profile
+
+
+def _flush(cursor: sqlite3.Cursor, profile_rows: list, weapon_rows: list,
+           ability_rows: list) -> None:
+    """Write one batch of rows and empty the buffers."""
+    cursor.executemany(
+        "INSERT INTO profiles (id, unit_name, profile_name, nickname, model_count, "
+        "description_hash, description, M, T, Sv, W, Ld, OC) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        profile_rows
+    )
+    cursor.executemany(
+        "INSERT INTO weapons (profile_id, position, type, name, range, A, skill, S, AP, D, abilities) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        weapon_rows
+    )
+    cursor.executemany(
+        "INSERT INTO abilities (profile_id, position, text) VALUES (?, ?, ?)",
+        ability_rows
+    )
+    del profile_rows[:]
+    del weapon_rows[:]
+    del ability_rows[:]
+
+
+def export_roster(unit_manager, db_path: str, incremental: bool = True) -> Dict[str, int]:
+    """
+    Export the grouped roster to an indexed SQLite database.
+
+    Profiles are keyed by unit name, profile name and description hash. With
+    incremental export, profiles already present with the same key are left
+    untouched (only their model count is refreshed), profiles no longer in
+    the roster are deleted, and only new or changed profiles are parsed and
+    inserted.
+
+    Args:
+        unit_manager: The unit manager whose units are exported
+        db_path: The path of the SQLite database to write
+        incremental: Whether to update an existing export instead of replacing it
+
+    Returns:
+        A dictionary with the number of inserted, updated and deleted profiles
+    """
+    connection = sqlite3.connect(db_path)
+    try:
+        connection.execute("PRAGMA foreign_keys = ON")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        connection.executescript(SCHEMA)
+        cursor = connection.cursor()
+
+        with connection:
+            if not incremental:
+                cursor.execute("DELETE FROM abilities")
+                cursor.execute("DELETE FROM weapons")
+                cursor.execute("DELETE FROM profiles")
+
+            existing: Dict[ProfileKey, Tuple[int, int]] = {
+                (unit_name, profile_name, digest): (profile_id, model_count)
+                for profile_id, unit_name, profile_name, digest, model_count in cursor.execute(
+                    "SELECT id, unit_name, profile_name, description_hash, model_count FROM profiles"
+                )
+            }
+            next_id = cursor.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM profiles").fetchone()[0]
+
+            seen = set()
+            count_updates = []
+            profile_rows: list = []
+            weapon_rows: list = []
+            ability_rows: list = []
+            parsed_cache: Dict[str, tuple] = {}
+            inserted = 0
+
+            for key, profile in _iter_profiles(unit_manager):
+                seen.add(key)
+                current = existing.get(key)
+                if current is not None:
+                    if current[1] != profile.count:
+                        count_updates.append((profile.count, current[0]))
+                    continue
+
+                parsed = parsed_cache.get(key[2])
+                if parsed is None:
+                    parsed = description_parser.parse_profile(profile.description)
+                    parsed_cache[key[2]] = parsed
+                stats, ranged, melee, abilities = parsed
+
+                profile_id = next_id
+                next_id += 1
+                inserted += 1
+                profile_rows.append(
+                    (profile_id, key[0], key[1], profile.nickname, profile.count, key[2],
+                     profile.description) + stats.astuple()
+                )
+                for position, weapon in enumerate(ranged):
+                    weapon_rows.append((
+                        profile_id, position, "ranged", weapon.name, weapon.range,
+                        weapon.A, weapon.BS, weapon.S, weapon.AP, weapon.D, weapon.abilities
+                    ))
+                for position, weapon in enumerate(melee, len(ranged)):
+                    weapon_rows.append((
+                        profile_id, position, "melee", weapon.name, "",
+                        weapon.A, weapon.WS, weapon.S, weapon.AP, weapon.D, weapon.abilities
+                    ))
+                ability_rows.extend(
+                    (profile_id, position, ability.text)
+                    for position, ability in enumerate(abilities)
+                )
+
+                if len(profile_rows) >= BATCH_SIZE:
+                    _flush(cursor, profile_rows, weapon_rows, ability_rows)
+
+            if profile_rows:
+                _flush(cursor, profile_rows, weapon_rows, ability_rows)
+
+            stale = [(value[0],) for key, value in existing.items() if key not in seen]
+            cursor.executemany("DELETE FROM abilities WHERE profile_id = ?", stale)
+            cursor.executemany("DELETE FROM weapons WHERE profile_id = ?", stale)
+            cursor.executemany("DELETE FROM profiles WHERE id = ?", stale)
+            cursor.executemany("UPDATE profiles SET model_count = ? WHERE id = ?", count_updates)
+
+            cursor.execute("DELETE FROM units")
+            cursor.executemany(
+                "INSERT INTO units (name, profile_count, model_count) VALUES (?, ?, ?)",
+                [
+                    (unit.name, len(unit.profiles), sum(p.count for p in unit.profiles))
+                    for unit in unit_manager.units
+                ]
+            )
+
+        return {"inserted": inserted, "updated": len(count_updates), "deleted": len(stale)}
+    finally:
+        connection.close()
@@ -0,0 +1,217 @@
+"""
+Typed stat values for the Warhammer 40k TTS Unit Editor.
+
+Stat strings such as '6"', "3+", "D6+1", "-1" and "*" are encoded as a kind
+and up to three integers, so stats can be compared and changed arithmetically
+instead of by editing strings. A StatColumn holds many values in parallel
+typed arrays, so a bulk change such as +1 A on every melee weapon of a
+roster is one pass over a few arrays.
+"""
+import re
+from array import array
+from typing import Iterable, List, Tuple
+
+# Value kinds
+NUMBER = 0  # "4"
+ROLL = 1  # "3+"
+DICE = 2  # "D6", "2D3+1"
+DISTANCE = 3  # '6"'
+OTHER = 4  # Anything else, e.g. "*" or "N/A", kept as written
+MODIFIER = 5  # "-1", "+1"; a number written with its sign
+
+# Lowest ROLL value; a roll can't need less than 2+. There is no highest,
+# since characteristics such as Leadership are 7+ or 8+
+MIN_ROLL = 2
+
+# (kind, value, sides, modifier); value is the number of dice for DICE
+Encoded = Tuple[int, int, int, int]
+
+_NUMBER = re.compile(r'^([+-])?(\d+)$')
+_ROLL = re.compile(r'^(\d+)\s*\+$')
+_DICE = re.compile(r'^(\d*)\s*[dD]\s*(\d+)(?:\s*([+-])\s*(\d+))?$')
+_DISTANCE = re.compile(r'^(\d+)\s*(?:"|\'\'|″)$')
+
+
+def parse_value(text: str) -> Encoded:
+    """
+    Encode a stat string.
+
+    Args:
+        text: The stat string, e.g. '6"' or "D6+1"
+
+    Returns:
+        The (kind, value, sides, modifier) encoding; OTHER for text that is
+        not a number, modifier, roll, dice expression or distance
+    """
+    text = text.strip()
+    match = _NUMBER.match(text)
+    if match:
+        sign, number = match.groups()
+        if sign is None:
+            return NUMBER, int(number), 0, 0
+        return MODIFIER, -int(number) if sign == "-" else int(number), 0, 0
+    match = _ROLL.match(text)
+    if match:
+        return ROLL, int(match.group(1)), 0, 0
+    match = _DICE.match(text)
+    if match:
+        count, sides, sign, modifier = match.groups()
+        modifier = int(modifier) if modifier else 0
+        return DICE, int(count) if count else 1, int(sides), -modifier if sign == "-" else modifier
+    match = _DISTANCE.match(text)
+    if match:
+        return DISTANCE, int(match.group(1)), 0, 0
+    return OTHER, 0, 0, 0
+
+
+def format_value(kind: int, value: int, sides: int = 0, modifier: int = 0) -> str:
+    """
+    Write an encoded stat value in its normal form, e.g. "D6+1" for "1d6 + 1".
+
+    Args:
+        kind: NUMBER, MODIFIER, ROLL, DICE or DISTANCE
+        value: The number, or the number of dice
+        sides: The sides of each die, for DICE
+        modifier: The amount added to the roll, for DICE
+
+    Returns:
+        The stat string
+    """
+    if kind == NUMBER:
+        return str(value)
+    if kind == MODIFIER:
+        return f"+{value}" if value > 0 else str(value)
+    if kind == ROLL:
+        return f"{value}+"
+    if kind == DISTANCE:
+        return f'{value}"'
+    if kind == DICE:
+        dice = f"{value if value != 1 else ''}D{sides}"
+        if modifier > 0:
+            return f"{dice}+{modifier}"
+        if modifier < 0:
+            return f"{dice}-{-modifier}"
+        return dice
+    raise ValueError(f"Cannot format a value of kind {kind}")
+
+
+def add_to_value(text: str, amount: int, signed: bool = False) -> str:
+    """
+    Add to a single stat string; see StatColumn.add.
+
+    Args:
+        text: The stat string
+        amount: The amount to add
+        signed: Whether numbers may go below 0, e.g. for AP
+
+    Returns:
+        The changed, normalized stat string
+    """
+    column = StatColumn([text])
+    column.add(amount, signed)
+    return column[0]
+
+
+class StatColumn:
+    """
+    Stat values encoded in parallel typed arrays.
+
+    Values of kind OTHER keep their text; every other value is re-serialized
+    in normal form.
+    """
+
+    __slots__ = ("kinds", "values", "sides", "modifiers", "other")
+
+    def __init__(self, texts: Iterable[str] = ()):
+        """
+        Initialize a column.
+
+        Args:
+            texts: The stat strings to encode
+        """
+        self.kinds = array('b')
+        self.values = array('l')
+        self.sides = array('l')
+        self.modifiers = array('l')
+        self.other: List[str] = []  # Text of each value, only kept for kind OTHER
+        self.extend(texts)
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def __getitem__(self, index: int) -> str:
+        kind = self.kinds[index]
+        if kind == OTHER:
+            return self.other[index]
+        return format_value(kind, self.values[index], self.sides[index], self.modifiers[index])
+
+    def extend(self, texts: Iterable[str]) -> None:
+        """
+        Encode and append stat strings.
+
+        Args:
+            texts: The stat strings
+        """
+        for text in texts:
+            kind, value, sides, modifier = parse_value(text)
+            self.kinds.append(kind)
+            self.values.append(value)
+            self.sides.append(sides)
+            self.modifiers.append(modifier)
+            self.other.append(text if kind == OTHER else "")
+
+    def add(self, amount: int, signed: bool = False) -> None:
+        """
+        Add an amount to every value, in place.
+
+        Numbers, modifiers, rolls and distances change by the amount, so +1
+        turns "3+" into "4+" (improving a roll is -1), '6"' into '7"' and
+        "-1" into "0". Dice expressions change their modifier, so +1 turns
+        "D6" into "D6+1". Rolls do not go below 2+, distances do not go
+        below 0 and numbers only do when signed; OTHER values are left
+        unchanged.
+
+        Args:
+            amount: The amount to add, possibly negative
+            signed: Whether numbers may go below 0, e.g. for AP, where -1
+                turns "0" into "-1"
+        """
+        kinds = self.kinds
+        values = self.values
+        modifiers = self.modifiers
+        for index in range(len(kinds)):
+            kind = kinds[index]
+            if kind == DICE:
+                modifiers[index] += amount
+            elif kind == ROLL:
+                values[index] = max(values[index] + amount, MIN_ROLL)
+            elif kind == DISTANCE or (kind == NUMBER and not signed):
+                values[index] = max(values[index] + amount, 0)
+            elif kind != OTHER:
+                values[index] += amount
+
+    def expected(self) -> array:
+        """
+        Get the average of every value, for comparing stats of any kind.
+
+        Returns:
+            An array of floats; the dice average for DICE and NaN for OTHER
+        """
+        result = array('d')
+        for kind, value, sides, modifier in zip(self.kinds, self.values, self.sides, self.modifiers):
+            if kind == DICE:
+                result.append(value * (sides + 1) / 2 + modifier)
+            elif kind == OTHER:
+                result.append(float("nan"))
+            else:
+                result.append(float(value))
+        return result
+
+    def to_strings(self) -> List[str]:
+        """
+        Re-serialize every value.
+
+        Returns:
+            The stat strings, in normal form except for OTHER values
+        """
+        return [self[index] for index in range(len(self.kinds))]
@@ -0,0 +1,303 @@
+"""
+Autocomplete vocabulary for the Warhammer 40k TTS Unit Editor.
+
+Weapon names, weapon keywords and ability lines found in the loaded profiles
+are kept in one prefix trie per category. Terms are reference counted by the
+profiles using them, so the vocabulary can follow edits profile by profile
+instead of being rebuilt.
+"""
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from . import description_parser
+from .description_parser import description_hash
+from .parallel import map_chunks
+
+
+# Completion categories
+WEAPON_NAMES = "weapon"
+KEYWORDS = "keyword"
+ABILITIES = "ability"
+CATEGORIES = (WEAPON_NAMES, KEYWORDS, ABILITIES)
+
+# (weapon names, keywords, ability lines) used by a description
+Terms = Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]
+
+# Cursor contexts in raw description text
+_OPEN_KEYWORDS = re.compile(r'\[7bc596\]\[([^\]]*)$')
+_OPEN_WEAPON_NAME = re.compile(r'^\[c6c930\]([^(\[]*)$')
+_ABILITIES_HEADER = "[dc61ed]Abilities[-]"
+
+
+class _Node:
+    """A trie node."""
+
+    __slots__ = ("children", "count", "term", "uses")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.count = 0  # Uses of all terms at or below this node
+        self.term: Optional[str] = None  # The term ending here, as first spelled
+        self.uses = 0  # Uses of the term ending here
+
+
+class Trie:
+    """
+    A case-insensitive prefix trie of reference counted terms.
+
+    complete walks the prefix and then only as much of the subtree as it
+    needs to fill its limit, so a lookup costs the prefix length plus about
+    limit times the term length, however many terms there are.
+    """
+
+    def __init__(self):
+        """Initialize an empty trie."""
+        self.root = _Node()
+
+    def __len__(self) -> int:
+        return self.root.count
+
+    def add(self, term: str, uses: int = 1) -> None:
+        """
+        Add uses of a term.
+
+        Args:
+            term: The term
+            uses: The number of uses to add
+        """
+        node = self.root
+        node.count += uses
+        for char in term.lower():
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _Node()
+            node = child
+            node.count += uses
+        if node.term is None:
+            node.term = term
+        node.uses += uses
+
+    def remove(self, term: str, uses: int = 1) -> None:
+        """
+        Remove uses of a term, pruning nodes no longer used.
+
+        Args:
+            term: The term
+            uses: The number of uses to remove
+        """
+        key = term.lower()
+        path = [self.root]
+        for char in key:
+            child = path[-1].children.get(char)
+            if child is None:
+                return
+            path.append(child)
+        if path[-1].uses < uses:
+            return
+
+        path[-1].uses -= uses
+        if not path[-1].uses:
+            path[-1].term = None
+        for node in path:
+            node.count -= uses
+        for depth in range(len(path) - 1, 0, -1):
+            if path[depth].count:
+                break
+            del path[depth - 1].children[key[depth - 1]]
+
+    def complete(self, prefix: str, limit: int = 10) -> List[str]:
+        """
+        Get terms starting with a prefix, in alphabetical order.
+
+        Args:
+            prefix: The prefix, matched case-insensitively
+            limit: The maximum number of terms
+
+        Returns:
+            Up to limit terms
+        """
+        node = self.root
+        for char in prefix.lower():
+            node = node.children.get(char)
+            if node is None:
+                return []
+
+        results: List[str] = []
+        stack = [node]
+        while stack and len(results) < limit:
+            node = stack.pop()
+            if node.term is not None:
+                results.append(node.term)
+            stack.extend(node.children[char] for char in sorted(node.children, reverse=True))
+        return results
+
+
+def extract_terms(description: str) -> Terms:
+    """
+    Get the vocabulary terms used by a description.
+
+    Args:
+        description: The description text
+
+    Returns:
+        The (weapon names, keywords, ability lines) of the description
+    """
+    _, ranged, melee, abilities = description_parser.parse_profile(description)
+    weapons = ranged + melee
+    keywords = []
+    for weapon in weapons:
+        keywords.extend(keyword.strip() for keyword in weapon.abilities.split(","))
+    return (
+        tuple(weapon.name for weapon in weapons if weapon.name),
+        tuple(keyword for keyword in keywords if keyword),
+        tuple(ability.text for ability in abilities if ability.text),
+    )
+
+
+def _terms_chunk(descriptions: Sequence[str]) -> List[Terms]:
+    """Extract the terms of a chunk of descriptions in a worker process."""
+    return [extract_terms(description) for description in descriptions]
+
+
+def completion_context(line: str, in_abilities: bool = False) -> Optional[Tuple[str, str]]:
+    """
+    Work out what is being typed at the cursor of a raw description.
+
+    Args:
+        line: The text of the cursor's line up to the cursor
+        in_abilities: Whether the line is in the abilities section
+
+    Returns:
+        The (category, prefix) to complete, or None if there is nothing to complete
+    """
+    match = _OPEN_KEYWORDS.search(line)
+    if match:
+        return KEYWORDS, match.group(1).split(",")[-1].lstrip()
+    match = _OPEN_WEAPON_NAME.match(line)
+    if match:
+        return WEAPON_NAMES, match.group(1)
+    if in_abilities and line.strip() and "[" not in line:
+        return ABILITIES, line.lstrip()
+    return None
+
+
+def in_abilities_section(text_before_line: str) -> bool:
+    """
+    Check whether a line is in the abilities section of a raw description.
+
+    Args:
+        text_before_line: The description text before the line
+
+    Returns:
+        True if the abilities header comes before the line
+    """
+    return _ABILITIES_HEADER in text_before_line
+
+
+class Vocabulary:
+    """
+    The completion terms of a unit manager's profiles.
+
+    Like DescriptionLinter, the terms of each description are cached by
+    description hash, so refreshing after an edit only extracts the terms of
+    descriptions not seen before and only touches the tries for profiles
+    whose description changed.
+    """
+
+    def __init__(self):
+        """Initialize an empty vocabulary."""
+        self.tries: Dict[str, Trie] = {category: Trie() for category in CATEGORIES}
+        self.cache: Dict[str, Terms] = {}  # Terms by description hash
+        self.digests: Dict[Tuple[int, int], str] = {}  # Description hash of each profile
+
+    def refresh(self, unit_manager) -> int:
+        """
+        Bring the vocabulary in line with every profile of a unit manager.
+
+        Used both to build the vocabulary on load and to follow edits made to
+        several profiles at once.
+
+        Args:
+            unit_manager: The unit manager
+
+        Returns:
+            The number of profiles whose terms were updated
+        """
+        current: Dict[Tuple[int, int], str] = {}
+        pending: Dict[str, str] = {}
+        for unit_index, unit in enumerate(unit_manager.units):
+            for profile_index, profile in enumerate(unit.profiles):
+                digest = description_hash(profile.description)
+                current[(unit_index, profile_index)] = digest
+                if digest not in self.cache:
+                    pending[digest] = profile.description
+
+        if pending:
+            digests = list(pending)
+            results = map_chunks(_terms_chunk, [pending[digest] for digest in digests])
+            self.cache.update(zip(digests, results))
+
+        changed = 0
+        for key in set(self.digests) - set(current):
+            self._count(self.digests.pop(key), -1)
+            changed += 1
+        for key, digest in current.items():
+            old_digest = self.digests.get(key)
+            if old_digest == digest:
+                continue
+            if old_digest is not None:
+                self._count(old_digest, -1)
+            self._count(digest, 1)
+            self.digests[key] = digest
+            changed += 1
+        return changed
+
+    def update(self, unit_manager, unit_index: int, profile_index: int) -> None:
+        """
+        Follow an edit to a single profile, e.g. after save_profile_changes.
+
+        Args:
+            unit_manager: The unit manager holding the profile
+            unit_index: The index of the unit
+            profile_index: The index of the profile in the unit
+        """
+        description = unit_manager.units[unit_index].profiles[profile_index].description
+        digest = description_hash(description)
+        key = (unit_index, profile_index)
+        old_digest = self.digests.get(key)
+        if old_digest == digest:
+            return
+
+        if digest not in self.cache:
+            self.cache[digest] = extract_terms(description)
+        if old_digest is not None:
+            self._count(old_digest, -1)
+        self._count(digest, 1)
+        self.digests[key] = digest
+
+    def _count(self, digest: str, uses: int) -> None:
+        """Add (uses > 0) or remove the terms of a cached description."""
+        for category, terms in zip(CATEGORIES, self.cache[digest]):
+            trie = self.tries[category]
+            for term in terms:
+                if uses > 0:
+                    trie.add(term, uses)
+                else:
+                    trie.remove(term, -uses)
+
+    def complete(self, category: str, prefix: str, limit: int = 10) -> List[str]:
+        """
+        Get the terms of a category starting with a prefix.
+
+        Args:
+            category: WEAPON_NAMES, KEYWORDS or ABILITIES
+            prefix: The typed prefix; nothing is suggested for an empty prefix
+            limit: The maximum number of terms
+
+        Returns:
+            Up to limit terms, leaving out a term equal to the prefix
+        """
+        if not prefix:
+            return []
+        terms = self.tries[category].complete(prefix, limit + 1)
+        return [term for term in terms if term.lower() != prefix.lower()][:limit]
@@ -0,0 +1,269 @@
+"""
+Stall detection for the Warhammer 40k TTS Unit Editor's event loop.
+
+Once installed, every Tk callback (bound events, menu and button commands,
+after callbacks) is timed, and a heartbeat scheduled with after measures how
+late the event loop runs. A watcher thread samples the main thread's stack
+while a callback or the loop is stuck, so a logged stall shows where the time
+went rather than only which handler was running. Stalls are kept in memory
+and written to a rotating log file that can be attached to bug reports.
+"""
+import logging
+import logging.handlers
+import os
+import sys
+import threading
+import time
+import tkinter
+import traceback
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+
+# Default location of the stall log
+DEFAULT_LOG_PATH = os.path.join(os.path.expanduser("~"), ".tts_editor", "stalls.log")
+
+# Size of a log file before it is rotated, and rotated files kept
+LOG_MAX_BYTES = 256 * 1024
+LOG_BACKUP_COUNT = 2
+
+
+def callback_name(func) -> str:
+    """
+    Get a readable name for a Tk callback.
+
+    Args:
+        func: The callback
+
+    Returns:
+        The qualified name, e.g. "tts_editor.ui.main_window.MainWindow.save_changes"
+    """
+    name = getattr(func, "__qualname__", None) or getattr(func, "__name__", None) or repr(func)
+    module = getattr(func, "__module__", None)
+    return f"{module}.{name}" if module else name
+
+
+class _Call:
+    """A running callback; the stack is filled in by the watcher thread."""
+
+    __slots__ = ("name", "start", "stack")
+
+    def __init__(self, name: str, start: float):
+        self.name = name
+        self.start = start
+        self.stack: Optional[List[str]] = None
+
+
+class StallWatchdog:
+    """Times Tk callbacks and the event loop, and logs the ones that stall."""
+
+    def __init__(self, threshold: float = 0.25, heartbeat_interval: int = 100,
+                 log_path: Optional[str] = DEFAULT_LOG_PATH, capacity: int = 100):
+        """
+        Initialize the watchdog.
+
+        Args:
+            threshold: The duration in seconds above which a callback or
+                event loop delay is a stall
+            heartbeat_interval: Milliseconds between heartbeats
+            log_path: Path of the rotating log file, or None to only keep
+                stalls in memory
+            capacity: The maximum number of stalls kept in memory
+        """
+        self.threshold = threshold
+        self.heartbeat_interval = heartbeat_interval
+        self.log_path = log_path
+        self.stalls: Deque[Dict[str, Any]] = deque(maxlen=capacity)
+
+        self.root: Optional[tkinter.Tk] = None
+        self._original_wrapper = None
+        self._calls: List[_Call] = []  # Running callbacks, outermost first
+        self._main_thread_id: Optional[int] = None
+        self._last_beat = 0.0
+        self._loop_stack: Optional[List[str]] = None  # Stack sampled while the loop was late
+        self._stalled_since_beat = False
+        self._heartbeat_id = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._logger: Optional[logging.Logger] = None
+        self._handler: Optional[logging.Handler] = None
+
+    @property
+    def installed(self) -> bool:
+        """Whether the watchdog is installed."""
+        return self.root is not None
+
+    def install(self, root: tkinter.Tk) -> None:
+        """
+        Start timing callbacks and the event loop.
+
+        Only callbacks registered after this are timed, so install the
+        watchdog before creating the widgets.
+
+        Args:
+            root: The root window
+        """
+        if self.installed:
+            return
+        self.root = root
+        self._main_thread_id = threading.get_ident()
+        self._open_log()
+
+        watchdog = self
+        self._original_wrapper = tkinter.CallWrapper
+
+        class TimedCallWrapper(self._original_wrapper):
+            """CallWrapper timing every call through the watchdog."""
+
+            def __call__(self, *args):
+                call = watchdog.enter(callback_name(self.func))
+                try:
+                    return super().__call__(*args)
+                finally:
+                    watchdog.exit(call)
+
+        # Tk commands are created through tkinter.CallWrapper
+        tkinter.CallWrapper = TimedCallWrapper
+
+        self._last_beat = time.perf_counter()
+        self._heartbeat_id = root.after(self.heartbeat_interval, self._heartbeat)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="stall-watchdog", daemon=True)
+        self._thread.start()
+
+    def uninstall(self) -> None:
+        """Stop timing callbacks and close the log."""
+        if not self.installed:
+            return
+        tkinter.CallWrapper = self._original_wrapper
+        self._stop.set()
+        if self._heartbeat_id is not None:
+            try:
+                self.root.after_cancel(self._heartbeat_id)
+            except tkinter.TclError:
+                pass  # The root window is already destroyed
+        self._heartbeat_id = None
+        self._thread = None
+        self.root = None
+        if self._handler is not None:
+            self._logger.removeHandler(self._handler)
+            self._handler.close()
+            self._handler = None
+
+    def _open_log(self) -> None:
+        """Attach the rotating log file, if there is one and it can be created."""
+        self._logger = logging.getLogger("tts_editor.stalls")
+        self._logger.setLevel(logging.WARNING)
+        self._logger.propagate = False
+        if not self.log_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.log_path)), exist_ok=True)
+            self._handler = logging.handlers.RotatingFileHandler(
+                self.log_path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT,
+                encoding='utf-8'
+            )
+        except OSError as e:
+            print(f"Failed to open stall log {self.log_path}: {str(e)}")
+            return
+        self._handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        self._logger.addHandler(self._handler)
+
+    def enter(self, name: str) -> _Call:
+        """
+        Record the start of a callback.
+
+        Args:
+            name: The callback name
+
+        Returns:
+            The running call, to pass to exit
+        """
+        call = _Call(name, time.perf_counter())
+        self._calls.append(call)
+        return call
+
+    def exit(self, call: _Call) -> None:
+        """
+        Record the end of a callback, logging it if it stalled.
+
+        Nested callbacks, run by update() inside another callback, are only
+        logged as part of the outermost one.
+
+        Args:
+            call: The call returned by enter
+        """
+        duration = time.perf_counter() - call.start
+        self._calls.pop()
+        if not self._calls and duration > self.threshold:
+            stack = call.stack or traceback.format_stack()[:-1]
+            self.record("handler", call.name, duration, stack)
+            self._stalled_since_beat = True
+
+    def _heartbeat(self) -> None:
+        """Measure how late the event loop ran this heartbeat, and schedule the next."""
+        now = time.perf_counter()
+        lag = now - self._last_beat - self.heartbeat_interval / 1000.0
+        # A lag caused by a timed callback was already logged with the callback
+        if lag > self.threshold and not self._stalled_since_beat:
+            self.record("event loop", "event loop lag", lag, self._loop_stack or [])
+        self._loop_stack = None
+        self._stalled_since_beat = False
+        self._last_beat = now
+        # A heartbeat inside a callback means it runs a nested event loop, e.g.
+        # a message box; only the time since this heartbeat can be a stall
+        for call in self._calls:
+            call.start = now
+            call.stack = None
+        if self.root is not None:
+            self._heartbeat_id = self.root.after(self.heartbeat_interval, self._heartbeat)
+
+    def _watch(self) -> None:
+        """Sample the main thread's stack when a callback or the event loop stalls."""
+        interval = self.threshold / 2
+        deadline = self.threshold + self.heartbeat_interval / 1000.0
+        while not self._stop.wait(interval):
+            now = time.perf_counter()
+            calls = self._calls
+            call = calls[0] if calls else None
+            if call is not None:
+                if call.stack is None and now - call.start > self.threshold:
+                    call.stack = self._sample()
+            elif self._loop_stack is None and now - self._last_beat > deadline:
+                self._loop_stack = self._sample()
+
+    def _sample(self) -> List[str]:
+        """Get the main thread's current stack."""
+        frame = sys._current_frames().get(self._main_thread_id)
+        return traceback.format_stack(frame) if frame is not None else []
+
+    def record(self, kind: str, name: str, duration: float, stack: List[str]) -> None:
+        """
+        Record a stall in memory and in the log.
+
+        Args:
+            kind: "handler" or "event loop"
+            name: The callback name
+            duration: The stall duration in seconds
+            stack: The formatted stack of the stall
+        """
+        stall = {
+            "time": time.time(),
+            "kind": kind,
+            "name": name,
+            "duration_ms": duration * 1000.0,
+            "stack": stack,
+        }
+        self.stalls.append(stall)
+        if self._handler is not None:
+            self._logger.warning(
+                "%s stall: %s took %.0f ms\n%s", kind, name, stall["duration_ms"], "".join(stack)
+            )
+
+    def clear(self) -> None:
+        """Remove the stalls kept in memory; the log file is kept."""
+        self.stalls.clear()
+
+
+# Shared watchdog used by the editor
+watchdog = StallWatchdog()